@@ -1,12 +1,19 @@
 """State machine for managing hexapod operational modes."""
 
 import asyncio
+import itertools
+import threading
+import time
+from collections import deque
 from enum import Enum, auto
 from typing import Optional, Callable, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from loguru import logger
 
+# Local binding avoids attribute lookup on every transition
+_now = datetime.now
+
 
 class OperationalMode(Enum):
     """Operational modes for the hexapod."""
@@ -19,7 +26,11 @@ class OperationalMode(Enum):
     MAINTENANCE = auto()
 
 
-@dataclass
+# Enum .name is a descriptor lookup; cache the strings once
+_MODE_NAMES: Dict[OperationalMode, str] = {mode: mode.name for mode in OperationalMode}
+
+
+@dataclass(slots=True)
 class StateTransition:
     """Represents a state transition with metadata."""
     from_state: OperationalMode
@@ -27,6 +38,27 @@ class StateTransition:
     timestamp: datetime
     reason: str
     triggered_by: str  # 'operator', 'system', 'emergency'
+    monotonic_ts: float = field(default_factory=time.monotonic)  # For duration math
+
+
+def _build_transition_masks(
+    transitions: Dict[OperationalMode, frozenset[OperationalMode]]
+) -> tuple[int, ...]:
+    """
+    Encode allowed transitions as one bitmask per source mode.
+
+    Args:
+        transitions: Mapping of source mode to allowed destination modes
+
+    Returns:
+        Tuple indexed by ``mode.value - 1`` with bit ``dest.value - 1`` set
+        for every allowed destination
+    """
+    masks = [0] * len(OperationalMode)
+    for source, destinations in transitions.items():
+        for dest in destinations:
+            masks[source.value - 1] |= 1 << (dest.value - 1)
+    return tuple(masks)
 
 
 class StateMachine:
@@ -37,62 +69,90 @@ class StateMachine:
     triggers appropriate callbacks when states change.
     """
 
-    # Define allowed state transitions
-    ALLOWED_TRANSITIONS: Dict[OperationalMode, list[OperationalMode]] = {
-        OperationalMode.INITIALIZATION: [
+    # Terminal states have no outgoing transitions
+    _TERMINAL: frozenset = frozenset()
+
+    # Define allowed state transitions (frozensets for O(1) membership checks)
+    ALLOWED_TRANSITIONS: Dict[OperationalMode, frozenset[OperationalMode]] = {
+        OperationalMode.INITIALIZATION: frozenset({
             OperationalMode.AUTONOMOUS,
             OperationalMode.SEMI_AUTONOMOUS,
             OperationalMode.REMOTE_CONTROL,
             OperationalMode.SHUTDOWN,
-        ],
-        OperationalMode.AUTONOMOUS: [
+        }),
+        OperationalMode.AUTONOMOUS: frozenset({
             OperationalMode.SEMI_AUTONOMOUS,
             OperationalMode.REMOTE_CONTROL,
             OperationalMode.EMERGENCY_STOP,
             OperationalMode.MAINTENANCE,
             OperationalMode.SHUTDOWN,
-        ],
-        OperationalMode.SEMI_AUTONOMOUS: [
+        }),
+        OperationalMode.SEMI_AUTONOMOUS: frozenset({
             OperationalMode.AUTONOMOUS,
             OperationalMode.REMOTE_CONTROL,
             OperationalMode.EMERGENCY_STOP,
             OperationalMode.MAINTENANCE,
             OperationalMode.SHUTDOWN,
-        ],
-        OperationalMode.REMOTE_CONTROL: [
+        }),
+        OperationalMode.REMOTE_CONTROL: frozenset({
             OperationalMode.AUTONOMOUS,
             OperationalMode.SEMI_AUTONOMOUS,
             OperationalMode.EMERGENCY_STOP,
             OperationalMode.MAINTENANCE,
             OperationalMode.SHUTDOWN,
-        ],
-        OperationalMode.EMERGENCY_STOP: [
+        }),
+        OperationalMode.EMERGENCY_STOP: frozenset({
             OperationalMode.REMOTE_CONTROL,  # Must go through remote control first
             OperationalMode.SHUTDOWN,
-        ],
-        OperationalMode.MAINTENANCE: [
+        }),
+        OperationalMode.MAINTENANCE: frozenset({
             OperationalMode.AUTONOMOUS,
             OperationalMode.SEMI_AUTONOMOUS,
             OperationalMode.REMOTE_CONTROL,
             OperationalMode.SHUTDOWN,
-        ],
-        OperationalMode.SHUTDOWN: [],  # Terminal state
+        }),
+        OperationalMode.SHUTDOWN: _TERMINAL,  # Terminal state
     }
 
-    def __init__(self, initial_mode: OperationalMode = OperationalMode.INITIALIZATION):
+    # Modes in which the hexapod is considered operational
+    _OPERATIONAL_MODES: frozenset[OperationalMode] = frozenset({
+        OperationalMode.AUTONOMOUS,
+        OperationalMode.SEMI_AUTONOMOUS,
+        OperationalMode.REMOTE_CONTROL,
+        OperationalMode.MAINTENANCE,
+    })
+
+    def __init__(
+        self,
+        initial_mode: OperationalMode = OperationalMode.INITIALIZATION,
+        history_limit: int = 1024
+    ):
         """
         Initialize state machine.
 
         Args:
             initial_mode: Starting operational mode
+            history_limit: Maximum number of transitions kept in history
         """
         self._current_mode = initial_mode
         self._previous_mode: Optional[OperationalMode] = None
-        self._transition_history: list[StateTransition] = []
-        self._callbacks: Dict[OperationalMode, list[Callable]] = {}
-        self._lock = asyncio.Lock()
+        self._transition_history: deque[StateTransition] = deque(maxlen=history_limit)
+
+        # Preallocated records reused in ring order; the slot being overwritten
+        # is always the one the bounded deque evicts on the next append
+        self._transition_pool = [
+            StateTransition(initial_mode, initial_mode, datetime.min, "", "")
+            for _ in range(history_limit)
+        ]
+        self._transition_count = 0
+        self._state_info_cache: Optional[Dict[str, Any]] = None
+        # Callbacks partitioned by kind at registration time
+        self._sync_callbacks: Dict[OperationalMode, list[Callable]] = {}
+        self._async_callbacks: Dict[OperationalMode, list[Callable]] = {}
+        # Guards state mutation only; never held across an await
+        self._lock = threading.Lock()
 
-        logger.info(f"StateMachine initialized in {initial_mode.name} mode")
+        logger.info(f"StateMachine initialized in {_MODE_NAMES[initial_mode]} mode")
 
     @property
     def current_mode(self) -> OperationalMode:
@@ -107,7 +167,7 @@ class StateMachine:
     @property
     def mode_name(self) -> str:
         """Get current mode name as string."""
-        return self._current_mode.name
+        return _MODE_NAMES[self._current_mode]
 
     def is_mode(self, mode: OperationalMode) -> bool:
         """
@@ -131,8 +191,7 @@ class StateMachine:
         Returns:
             True if transition is allowed
         """
-        allowed = self.ALLOWED_TRANSITIONS.get(self._current_mode, [])
-        return target_mode in allowed
+        return bool(_ALLOWED_MASK[self._current_mode.value - 1] & (1 << (target_mode.value - 1)))
 
     async def transition_to(
         self,
@@ -151,43 +210,32 @@ class StateMachine:
         Returns:
             True if transition successful, False otherwise
         """
-        async with self._lock:
+        with self._lock:
             # Check if transition is allowed
             if not self.can_transition_to(target_mode):
                 logger.warning(
-                    f"Transition from {self._current_mode.name} to {target_mode.name} "
+                    f"Transition from {_MODE_NAMES[self._current_mode]} to {_MODE_NAMES[target_mode]} "
                     f"is not allowed"
                 )
                 return False
 
             # Same state transition is a no-op
             if self._current_mode == target_mode:
-                logger.debug(f"Already in {target_mode.name} mode, ignoring transition")
+                logger.debug("Already in {} mode, ignoring transition", _MODE_NAMES[target_mode])
                 return True
 
-            # Record transition
-            transition = StateTransition(
-                from_state=self._current_mode,
-                to_state=target_mode,
-                timestamp=datetime.now(),
-                reason=reason,
-                triggered_by=triggered_by
-            )
-
+            # Positional args: loguru formats only if INFO is enabled
             logger.info(
-                f"State transition: {self._current_mode.name} → {target_mode.name} "
-                f"(reason: {reason}, triggered by: {triggered_by})"
+                "State transition: {} → {} (reason: {}, triggered by: {})",
+                _MODE_NAMES[self._current_mode], _MODE_NAMES[target_mode], reason, triggered_by
             )
 
-            # Update state
-            self._previous_mode = self._current_mode
-            self._current_mode = target_mode
-            self._transition_history.append(transition)
+            self._record_transition(target_mode, reason, triggered_by)
 
-            # Trigger callbacks for new state
-            await self._trigger_callbacks(target_mode)
+        # Trigger callbacks for new state (outside the lock)
+        await self._trigger_callbacks(target_mode)
 
-            return True
+        return True
 
     async def emergency_stop(self, reason: str = "Emergency stop triggered"):
         """
@@ -198,23 +246,42 @@ class StateMachine:
         Args:
             reason: Reason for emergency stop
         """
-        async with self._lock:
+        with self._lock:
             logger.critical(f"EMERGENCY STOP: {reason}")
 
-            transition = StateTransition(
-                from_state=self._current_mode,
-                to_state=OperationalMode.EMERGENCY_STOP,
-                timestamp=datetime.now(),
-                reason=reason,
-                triggered_by="emergency"
-            )
+            self._record_transition(OperationalMode.EMERGENCY_STOP, reason, "emergency")
 
-            self._previous_mode = self._current_mode
-            self._current_mode = OperationalMode.EMERGENCY_STOP
+        # Trigger emergency stop callbacks (outside the lock)
+        await self._trigger_callbacks(OperationalMode.EMERGENCY_STOP)
+
+    def _record_transition(self, target_mode: OperationalMode, reason: str, triggered_by: str):
+        """
+        Record a transition into a pooled slot and update current state.
+
+        Must be called with the state lock held.
+
+        Args:
+            target_mode: Mode being entered
+            reason: Reason for transition
+            triggered_by: Who triggered the transition
+        """
+        pool = self._transition_pool
+        # history_limit=0 keeps no history, so there is no slot to fill
+        if pool:
+            transition = pool[self._transition_count % len(pool)]
+            transition.from_state = self._current_mode
+            transition.to_state = target_mode
+            transition.timestamp = _now()
+            transition.reason = reason
+            transition.triggered_by = triggered_by
+            transition.monotonic_ts = time.monotonic()
             self._transition_history.append(transition)
 
-            # Trigger emergency stop callbacks
-            await self._trigger_callbacks(OperationalMode.EMERGENCY_STOP)
+        # Update state
+        self._previous_mode = self._current_mode
+        self._current_mode = target_mode
+        self._transition_count += 1
+        self._state_info_cache = None
 
     def register_callback(self, mode: OperationalMode, callback: Callable):
         """
@@ -224,11 +291,11 @@ class StateMachine:
             mode: Operational mode
             callback: Async callable to execute on mode entry
         """
-        if mode not in self._callbacks:
-            self._callbacks[mode] = []
-
-        self._callbacks[mode].append(callback)
-        logger.debug(f"Registered callback for {mode.name} mode")
+        if asyncio.iscoroutinefunction(callback):
+            self._async_callbacks.setdefault(mode, []).append(callback)
+        else:
+            self._sync_callbacks.setdefault(mode, []).append(callback)
+        logger.debug(f"Registered callback for {_MODE_NAMES[mode]} mode")
 
     async def _trigger_callbacks(self, mode: OperationalMode):
         """
@@ -237,16 +304,27 @@ class StateMachine:
         Args:
             mode: Operational mode that was entered
         """
-        callbacks = self._callbacks.get(mode, [])
-
-        for callback in callbacks:
-            try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(mode)
-                else:
+        sync_callbacks = self._sync_callbacks.get(mode)
+        async_callbacks = self._async_callbacks.get(mode)
+        if not sync_callbacks and not async_callbacks:
+            return
+
+        if sync_callbacks:
+            for callback in sync_callbacks:
+                try:
                     callback(mode)
-            except Exception as e:
-                logger.error(f"Error executing callback for {mode.name}: {e}")
+                except Exception as e:
+                    logger.error(f"Error executing callback for {_MODE_NAMES[mode]}: {e}")
+
+        if async_callbacks:
+            # Run async callbacks concurrently so entry latency is max, not sum
+            results = await asyncio.gather(
+                *(callback(mode) for callback in async_callbacks),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error executing callback for {_MODE_NAMES[mode]}: {result}")
 
     def get_transition_history(self, limit: Optional[int] = None) -> list[StateTransition]:
         """
@@ -256,12 +334,13 @@ class StateMachine:
             limit: Maximum number of transitions to return (most recent first)
 
         Returns:
-            List of state transitions
+            List of state transitions (copies; pooled records are reused)
         """
-        history = list(reversed(self._transition_history))
-        if limit:
-            return history[:limit]
-        return history
+        # Lazy reverse iteration: only the requested entries are materialized
+        return [
+            replace(transition)
+            for transition in itertools.islice(reversed(self._transition_history), limit or None)
+        ]
 
     def get_mode_duration(self) -> float:
         """
@@ -273,9 +352,7 @@ class StateMachine:
         if not self._transition_history:
             return 0.0
 
-        last_transition = self._transition_history[-1]
-        duration = (datetime.now() - last_transition.timestamp).total_seconds()
-        return duration
+        return time.monotonic() - self._transition_history[-1].monotonic_ts
 
     def is_operational(self) -> bool:
         """
@@ -284,13 +361,7 @@ class StateMachine:
         Returns:
             True if in operational mode
         """
-        operational_modes = [
-            OperationalMode.AUTONOMOUS,
-            OperationalMode.SEMI_AUTONOMOUS,
-            OperationalMode.REMOTE_CONTROL,
-            OperationalMode.MAINTENANCE,
-        ]
-        return self._current_mode in operational_modes
+        return self._current_mode in self._OPERATIONAL_MODES
 
     def requires_operator_approval(self) -> bool:
         """
@@ -335,29 +406,39 @@ class StateMachine:
         Returns:
             Dictionary with current state information
         """
-        return {
-            'current_mode': self._current_mode.name,
-            'previous_mode': self._previous_mode.name if self._previous_mode else None,
-            'mode_duration': self.get_mode_duration(),
-            'is_operational': self.is_operational(),
-            'requires_operator_approval': self.requires_operator_approval(),
-            'transition_count': len(self._transition_history),
-            'last_transition': {
-                'to_state': self._transition_history[-1].to_state.name,
-                'timestamp': self._transition_history[-1].timestamp.isoformat(),
-                'reason': self._transition_history[-1].reason,
-                'triggered_by': self._transition_history[-1].triggered_by,
-            } if self._transition_history else None
-        }
+        if self._state_info_cache is None:
+            # Everything except mode_duration only changes on transition
+            self._state_info_cache = {
+                'current_mode': _MODE_NAMES[self._current_mode],
+                'previous_mode': _MODE_NAMES[self._previous_mode] if self._previous_mode else None,
+                'mode_duration': 0.0,
+                'is_operational': self.is_operational(),
+                'requires_operator_approval': self.requires_operator_approval(),
+                'transition_count': self._transition_count,
+                'last_transition': {
+                    'to_state': _MODE_NAMES[self._transition_history[-1].to_state],
+                    'timestamp': self._transition_history[-1].timestamp.isoformat(),
+                    'reason': self._transition_history[-1].reason,
+                    'triggered_by': self._transition_history[-1].triggered_by,
+                } if self._transition_history else None
+            }
+
+        info = dict(self._state_info_cache)
+        info['mode_duration'] = self.get_mode_duration()
+        return info
 
     def __str__(self) -> str:
         """String representation of state machine."""
-        return f"StateMachine(mode={self._current_mode.name}, operational={self.is_operational()})"
+        return f"StateMachine(mode={_MODE_NAMES[self._current_mode]}, operational={self.is_operational()})"
 
     def __repr__(self) -> str:
         """Developer representation of state machine."""
         return (
-            f"StateMachine(current={self._current_mode.name}, "
-            f"previous={self._previous_mode.name if self._previous_mode else 'None'}, "
-            f"transitions={len(self._transition_history)})"
+            f"StateMachine(current={_MODE_NAMES[self._current_mode]}, "
+            f"previous={_MODE_NAMES[self._previous_mode] if self._previous_mode else 'None'}, "
+            f"transitions={self._transition_count})"
         )
+
+
+# Flat transition table: one machine word per mode, built once at import
+_ALLOWED_MASK = _build_transition_masks(StateMachine.ALLOWED_TRANSITIONS)
@@ -1,9 +1,16 @@
 """Azure IoT Hub device client for hexapod."""
 
 import asyncio
-from typing import Optional, Callable, Dict, Any
+import json
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from loguru import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from azure.iot.device.aio import IoTHubDeviceClient
     from azure.iot.device import Message, MethodResponse
@@ -17,6 +24,18 @@ except ImportError:
 from utils.config_loader import get_config_loader
 
 
+def _dumps(data: Any):
+    """
+    Serialize telemetry payload to JSON (bytes with orjson, str otherwise).
+
+    With orjson, NumPy arrays and scalars (e.g. joint angles or positions
+    from the kinematics code) are encoded natively instead of failing.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data)
+
+
 class AzureIoTClient:
     """
     Azure IoT Hub device client.
@@ -37,6 +56,16 @@ class AzureIoTClient:
         self._client: Optional[IoTHubDeviceClient] = None
         self._connected = False
 
+        # Telemetry coalescing (opt-in: packs sends arriving within one
+        # latency window into one message, a JSON array with a batchSize property)
+        self._coalesce_enabled = False
+        self._batch_max_messages = 10
+        self._batch_latency = 0.1  # seconds
+        # Queued sends as (data, properties, future resolved with the send result)
+        self._tx_queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._unflushed: List[Tuple[Dict[str, Any], Optional[Dict[str, str]], asyncio.Future]] = []
+
         # Load Azure configuration
         try:
             azure_config = self._config_loader.get_azure_config()
@@ -44,6 +73,11 @@ class AzureIoTClient:
             self._protocol = azure_config['azure_iot'].get('protocol', 'MQTT')
             self._keep_alive = azure_config['azure_iot'].get('keep_alive', 60)
 
+            coalescing = azure_config.get('telemetry', {}).get('coalescing', {})
+            self._coalesce_enabled = coalescing.get('enabled', False)
+            self._batch_max_messages = coalescing.get('max_messages', 10)
+            self._batch_latency = coalescing.get('latency_ms', 100) / 1000.0
+
             # Check if mock mode is configured
             dev_config = azure_config.get('development', {})
             if dev_config.get('mock_connection', False):
@@ -54,9 +88,9 @@ class AzureIoTClient:
             self._mock_mode = True
             self._connection_string = ""
 
-        # Message handlers
-        self._message_handlers: Dict[str, Callable] = {}
-        self._method_handlers: Dict[str, Callable] = {}
+        # Message handlers: name -> (is_coroutine_function, handler)
+        self._message_handlers: Dict[str, Tuple[bool, Callable]] = {}
+        self._method_handlers: Dict[str, Tuple[bool, Callable]] = {}
 
         if self._mock_mode:
             logger.info("AzureIoTClient initialized in MOCK mode")
@@ -101,6 +135,11 @@ class AzureIoTClient:
             # Set up handlers
             await self._setup_handlers()
 
+            # Start telemetry coalescing
+            if self._coalesce_enabled:
+                self._tx_queue = asyncio.Queue(maxsize=1024)
+                self._flush_task = asyncio.create_task(self._telemetry_flush_loop())
+
             return True
 
         except Exception as e:
@@ -120,31 +159,40 @@ class AzureIoTClient:
 
     async def _handle_c2d_message(self, message):
         """Handle cloud-to-device message."""
-        logger.info(f"Received C2D message: {message.data.decode('utf-8')}")
-
         try:
             # Extract command from message properties
             command = message.custom_properties.get('command', 'unknown')
 
-            # Call registered handler if exists
-            if command in self._message_handlers:
-                handler = self._message_handlers[command]
-                await handler(message.data.decode('utf-8'))
-            else:
+            # Route to registered handler; unknown commands are never decoded
+            route = self._message_handlers.get(command)
+            if route is None:
                 logger.warning(f"No handler registered for command: {command}")
+                return
+
+            is_coro, handler = route
+            data = message.data.decode('utf-8')
+            logger.debug("Received C2D message: {}", data)
+            if is_coro:
+                await handler(data)
+            else:
+                handler(data)
 
         except Exception as e:
             logger.error(f"Error handling C2D message: {e}")
 
     async def _handle_method_request(self, method_request):
         """Handle direct method invocation."""
-        logger.info(f"Received method request: {method_request.name}")
+        logger.info("Received method request: {}", method_request.name)
 
         try:
             # Call registered method handler
-            if method_request.name in self._method_handlers:
-                handler = self._method_handlers[method_request.name]
-                result = await handler(method_request.payload)
+            route = self._method_handlers.get(method_request.name)
+            if route is not None:
+                is_coro, handler = route
+                if is_coro:
+                    result = await handler(method_request.payload)
+                else:
+                    result = handler(method_request.payload)
 
                 # Send response
                 response = MethodResponse.create_from_method_request(
@@ -160,6 +208,8 @@ class AzureIoTClient:
                     payload={"error": f"Method {method_request.name} not found"}
                 )
 
+            # Payload stays a dict: the SDK JSON-encodes it on its own pipeline
+            # thread, so pre-encoding here would double-encode without sparing the loop
             await self._client.send_method_response(response)
 
         except Exception as e:
@@ -179,9 +229,9 @@ class AzureIoTClient:
 
         Args:
             command: Command name
-            handler: Async callable(message_data)
+            handler: Callable(message_data), sync or async
         """
-        self._message_handlers[command] = handler
+        self._message_handlers[command] = (asyncio.iscoroutinefunction(handler), handler)
         logger.info(f"Registered C2D message handler for: {command}")
 
     def register_method_handler(self, method_name: str, handler: Callable):
@@ -190,9 +240,9 @@ class AzureIoTClient:
 
         Args:
             method_name: Method name
-            handler: Async callable(payload) -> result
+            handler: Callable(payload) -> result, sync or async
         """
-        self._method_handlers[method_name] = handler
+        self._method_handlers[method_name] = (asyncio.iscoroutinefunction(handler), handler)
         logger.info(f"Registered method handler for: {method_name}")
 
     async def send_telemetry(
@@ -215,14 +265,40 @@ class AzureIoTClient:
             return False
 
         if self._mock_mode:
-            logger.debug(f"Mock: Sending telemetry: {data}")
+            logger.debug("Mock: Sending telemetry: {}", data)
             return True
 
-        try:
-            import json
+        # Payloads the caller already batched are sent as they are
+        if self._tx_queue is not None and not (properties and properties.get("messageType") == "batch"):
+            fut = asyncio.get_running_loop().create_future()
+            try:
+                self._tx_queue.put_nowait((data, properties, fut))
+            except asyncio.QueueFull:
+                logger.warning("Telemetry batch queue full, dropping message")
+                return False
+            # Resolved by the flush task once the coalesced message is sent
+            return await fut
+
+        return await self._send_message(data, properties)
 
+    async def _send_message(
+        self,
+        payload: Any,
+        properties: Optional[Dict[str, str]] = None
+    ) -> bool:
+        """
+        Serialize and send a single IoT Hub message.
+
+        Args:
+            payload: JSON-serializable message body
+            properties: Optional message properties
+
+        Returns:
+            True if successful
+        """
+        try:
             # Create message
-            message = Message(json.dumps(data))
+            message = Message(_dumps(payload))
             message.content_type = "application/json"
             message.content_encoding = "utf-8"
 
@@ -241,6 +317,84 @@ class AzureIoTClient:
             logger.error(f"Failed to send telemetry: {e}")
             return False
 
+    async def _send_batch(
+        self, batch: List[Tuple[Dict[str, Any], Optional[Dict[str, str]], asyncio.Future]]
+    ):
+        """
+        Send queued telemetry, packing entries with equal properties into one message.
+
+        Each entry's future is resolved with the result of the message it went
+        out in, so callers of send_telemetry see failures.
+
+        Args:
+            batch: List of (data, properties, future) tuples
+        """
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
+        group_properties: Dict[tuple, Optional[Dict[str, str]]] = {}
+        group_futures: Dict[tuple, List[asyncio.Future]] = {}
+
+        for data, properties, fut in batch:
+            key = tuple(sorted(properties.items())) if properties else ()
+            groups.setdefault(key, []).append(data)
+            group_properties[key] = properties
+            group_futures.setdefault(key, []).append(fut)
+
+        for key, items in groups.items():
+            if len(items) == 1:
+                success = await self._send_message(items[0], group_properties[key])
+            else:
+                properties = dict(group_properties[key] or {})
+                properties["batchSize"] = str(len(items))
+                success = await self._send_message(items, properties)
+
+            for fut in group_futures[key]:
+                if not fut.done():
+                    fut.set_result(success)
+
+    async def _telemetry_flush_loop(self):
+        """Background loop that drains the telemetry queue once per latency window."""
+        while True:
+            batch = []
+            try:
+                batch.append(await self._tx_queue.get())
+
+                # Collect everything else that arrives within the latency window
+                await asyncio.sleep(self._batch_latency)
+                while len(batch) < self._batch_max_messages and not self._tx_queue.empty():
+                    batch.append(self._tx_queue.get_nowait())
+
+                await self._send_batch(batch)
+
+            except asyncio.CancelledError:
+                # Entries taken off the queue but not yet sent go out in _stop_batching
+                self._unflushed = batch
+                break
+            except Exception as e:
+                logger.error(f"Error in telemetry flush loop: {e}")
+                for _, _, fut in batch:
+                    if not fut.done():
+                        fut.set_result(False)
+
+    async def _stop_batching(self):
+        """Stop the flush task and send any telemetry still queued."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        if self._tx_queue is not None:
+            pending = [entry for entry in self._unflushed if not entry[2].done()]
+            self._unflushed = []
+            while not self._tx_queue.empty():
+                pending.append(self._tx_queue.get_nowait())
+            self._tx_queue = None
+
+            if pending:
+                await self._send_batch(pending)
+
     async def update_reported_properties(self, properties: Dict[str, Any]) -> bool:
         """
         Update device twin reported properties.
@@ -256,7 +410,7 @@ class AzureIoTClient:
             return False
 
         if self._mock_mode:
-            logger.debug(f"Mock: Updating reported properties: {properties}")
+            logger.debug("Mock: Updating reported properties: {}", properties)
             return True
 
         try:
@@ -307,6 +461,8 @@ class AzureIoTClient:
             return
 
         try:
+            await self._stop_batching()
+
             if self._client:
                 await self._client.disconnect()
             self._connected = False
@@ -1,6 +1,7 @@
 """Device Twin handler for configuration synchronization."""
 
 import asyncio
+import json
 from typing import Dict, Any, Optional, Callable
 from loguru import logger
 
@@ -42,7 +43,9 @@ class DeviceTwinHandler:
 
         # Current state
         self._reported_properties: Dict[str, Any] = {}
+        self._reported_fingerprints: Dict[str, str] = {}  # Last successfully sent values
         self._desired_values: Dict[str, Any] = {}
+        self._last_desired_hash: Optional[int] = None
 
         # Background task
         self._running = False
@@ -69,6 +72,11 @@ class DeviceTwinHandler:
             property_name: Property name
             value: Property value
         """
+        # Serialized snapshot so in-place mutations of the same object are detected
+        fingerprint = json.dumps(value, sort_keys=True, default=str)
+        if self._reported_fingerprints.get(property_name) == fingerprint:
+            return
+
         self._reported_properties[property_name] = value
 
         # Send to IoT Hub
@@ -76,7 +84,8 @@ class DeviceTwinHandler:
         success = await self._iot_client.update_reported_properties(patch)
 
         if success:
-            logger.debug(f"Updated reported property: {property_name}={value}")
+            self._reported_fingerprints[property_name] = fingerprint
+            logger.debug("Updated reported property: {}={}", property_name, value)
         else:
             logger.warning(f"Failed to update reported property: {property_name}")
 
@@ -100,6 +109,13 @@ class DeviceTwinHandler:
         # Process desired properties
         desired = twin.get('desired', {})
 
+        # Skip property processing if desired section is unchanged since last sync
+        desired_hash = hash(tuple(sorted((k, repr(v)) for k, v in desired.items())))
+        if desired_hash == self._last_desired_hash:
+            logger.debug("Device twin unchanged, skipping sync")
+            return
+        self._last_desired_hash = desired_hash
+
         for prop_name in self._desired_properties:
             if prop_name in desired:
                 new_value = desired[prop_name]
@@ -1,10 +1,12 @@
 """Adaptive telemetry sender for energy-efficient data transmission."""
 
 import asyncio
+import bisect
+import itertools
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, asdict
-from collections import deque
 from loguru import logger
 
 from azure_iot.device_client import AzureIoTClient
@@ -16,7 +18,7 @@ class TelemetryMessage:
     """Telemetry message with priority."""
     data: Dict[str, Any]
     priority: int  # 1=highest, 5=lowest
-    timestamp: datetime
+    timestamp: float  # Seconds since epoch (time.time())
     message_type: str
 
 
@@ -26,6 +28,10 @@ class TelemetrySender:
 
     Adjusts transmission rate based on battery level and connection quality.
     Buffers messages when offline and syncs when connection restored.
+
+    Not thread-safe: queue_* methods and get_statistics must be called from
+    the event loop thread that runs the sender, which is why the queue
+    needs no lock.
     """
 
     def __init__(
@@ -57,14 +63,32 @@ class TelemetrySender:
         self._low_battery_interval = self._telemetry_config['lorawan']['adaptive']['low_battery_interval']
         self._critical_battery_interval = self._telemetry_config['lorawan']['adaptive']['critical_battery_interval']
 
-        # Message queue with priority
-        self._message_queue: deque[TelemetryMessage] = deque(maxlen=1000)
+        # Message queue with priority: list of (priority, sequence, message) kept
+        # sorted ascending. The sequence number keeps FIFO order among equal priorities.
+        # The list is only ever mutated in place, never rebuilt or reassigned.
+        self._max_queue_size = 1000
+        self._message_queue: List[Tuple[int, int, TelemetryMessage]] = []
+        self._sequence = itertools.count()
         self._running = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Send timer (re-armed after every tick) and the send it started, if
+        # one is in progress; no task exists while the queue is idle
+        self._timer: Optional[asyncio.TimerHandle] = None
         self._sender_task: Optional[asyncio.Task] = None
+        # An urgent message arrived during a send; tick again right after it
+        self._wake_pending = False
+
+        # Per-message-type IoT message properties, built once and reused
+        self._props_cache: Dict[str, Dict[str, str]] = {}
+
+        # Retry backoff after sender loop errors (seconds, doubles per failure)
+        self._backoff = 0.5
 
         # Statistics
         self._messages_sent = 0
         self._messages_failed = 0
+        self._messages_dropped = 0
         self._last_send_time: Optional[datetime] = None
 
         logger.info("TelemetrySender initialized")
@@ -73,81 +97,136 @@ class TelemetrySender:
         self,
         data: Dict[str, Any],
         message_type: str = "general",
-        priority: int = 3
+        priority: int = 3,
+        timestamp: Optional[float] = None
     ):
         """
         Queue telemetry message for sending.
 
         Args:
-            data: Telemetry data
+            data: Telemetry data (owned by the sender once queued; queue
+                metadata is added to it in place when sent)
             message_type: Type of message
             priority: Priority level (1=highest, 5=lowest)
+            timestamp: Queue time in epoch seconds (defaults to now)
         """
         message = TelemetryMessage(
             data=data,
             priority=priority,
-            timestamp=datetime.now(),
+            timestamp=timestamp or time.time(),
             message_type=message_type
         )
 
-        # Insert into queue based on priority
-        # Higher priority (lower number) goes first
-        inserted = False
-        for i, existing_msg in enumerate(self._message_queue):
-            if message.priority < existing_msg.priority:
-                # Insert before this message
-                temp_queue = list(self._message_queue)
-                temp_queue.insert(i, message)
-                self._message_queue = deque(temp_queue, maxlen=1000)
-                inserted = True
-                break
-
-        if not inserted:
-            self._message_queue.append(message)
+        self._push(message)
+
+        if priority == 1:
+            # Don't make urgent messages wait out the send interval
+            self._wake()
 
         logger.debug(
-            f"Queued {message_type} telemetry (priority={priority}, "
-            f"queue_size={len(self._message_queue)})"
+            "Queued {} telemetry (priority={}, queue_size={})",
+            message_type, priority, len(self._message_queue)
         )
 
+    def _push(self, message: TelemetryMessage):
+        """
+        Insert message in priority order, evicting the least important when full.
+
+        Args:
+            message: TelemetryMessage to queue
+        """
+        self._insert((message.priority, next(self._sequence), message))
+
+    def _insert(self, entry: Tuple[int, int, TelemetryMessage]):
+        """
+        Insert a queue entry in place, evicting the least important when full.
+
+        Args:
+            entry: (priority, sequence, message) tuple
+        """
+        queue = self._message_queue
+
+        if len(queue) >= self._max_queue_size:
+            self._messages_dropped += 1
+
+            if entry > queue[-1]:
+                # Everything queued is at least as important; drop the newcomer
+                return
+
+            # Evict the lowest-priority, newest entry (tail of the sorted list)
+            queue.pop()
+
+        if not queue or entry > queue[-1]:
+            # Common case: nothing less important is queued, so append in O(1)
+            queue.append(entry)
+        else:
+            bisect.insort(queue, entry)
+
     def queue_position_update(self, latitude: float, longitude: float, altitude: float = 0.0):
         """Queue position update."""
+        now = datetime.now()
         self.queue_telemetry(
             {
                 "latitude": latitude,
                 "longitude": longitude,
                 "altitude": altitude,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now.isoformat()
             },
             message_type="position",
-            priority=2
+            priority=2,
+            timestamp=now.timestamp()
         )
 
     def queue_orientation_update(self, roll: float, pitch: float, yaw: float):
         """Queue orientation update."""
+        now = datetime.now()
         self.queue_telemetry(
             {
                 "roll": roll,
                 "pitch": pitch,
                 "yaw": yaw,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now.isoformat()
             },
             message_type="orientation",
-            priority=3
+            priority=3,
+            timestamp=now.timestamp()
+        )
+
+    def queue_orientation_batch(self, samples: List[Tuple[float, float, float, float]]):
+        """
+        Queue several orientation samples as one message.
+
+        Args:
+            samples: (timestamp, roll, pitch, yaw) tuples, oldest first;
+                timestamps are epoch seconds
+        """
+        if not samples:
+            return
+
+        self.queue_telemetry(
+            {
+                "fields": ["timestamp", "roll", "pitch", "yaw"],
+                "samples": samples
+            },
+            message_type="orientation_batch",
+            priority=3,
+            timestamp=samples[0][0]
         )
 
     def queue_battery_status(self, voltage: float, percentage: float, current: float = 0.0):
         """Queue battery status."""
+        now = datetime.now()
         priority = 1 if percentage < 20.0 else 2
         self.queue_telemetry(
             {
                 "voltage": voltage,
                 "percentage": percentage,
                 "current": current,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now.isoformat()
             },
             message_type="battery",
-            priority=priority
+            priority=priority,
+            timestamp=now.timestamp()
         )
 
     def queue_system_health(self, status: Dict[str, Any]):
@@ -160,14 +239,16 @@ class TelemetrySender:
 
     def queue_emergency_event(self, event: str, details: Dict[str, Any]):
         """Queue emergency event (highest priority)."""
+        now = datetime.now()
         self.queue_telemetry(
             {
                 "event": event,
                 "details": details,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now.isoformat()
             },
             message_type="emergency",
-            priority=1
+            priority=1,
+            timestamp=now.timestamp()
         )
 
     def set_battery_level(self, percentage: float):
@@ -207,13 +288,14 @@ class TelemetrySender:
             logger.debug("Idle mode: Normal telemetry rate")
 
     async def start(self):
-        """Start telemetry sender background task."""
+        """Start the telemetry send timer."""
         if self._running:
             logger.warning("Telemetry sender already running")
             return
 
         self._running = True
-        self._sender_task = asyncio.create_task(self._sender_loop())
+        self._loop = asyncio.get_running_loop()
+        self._schedule(self._current_interval)
         logger.info("Telemetry sender started")
 
     async def stop(self):
@@ -224,30 +306,72 @@ class TelemetrySender:
         logger.info("Stopping telemetry sender")
         self._running = False
 
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
         if self._sender_task:
             self._sender_task.cancel()
             try:
                 await self._sender_task
             except asyncio.CancelledError:
                 pass
+            self._sender_task = None
 
         logger.info("Telemetry sender stopped")
 
-    async def _sender_loop(self):
-        """Background loop for sending telemetry."""
-        while self._running:
-            try:
-                # Wait for interval
-                await asyncio.sleep(self._current_interval)
+    def _schedule(self, delay: float):
+        """
+        Arm the send timer.
 
-                # Send queued messages
-                await self._send_queued_messages()
+        Args:
+            delay: Seconds until the next tick
+        """
+        self._timer = self._loop.call_later(delay, self._tick)
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in telemetry sender loop: {e}")
-                await asyncio.sleep(5.0)  # Wait before retry
+    def _wake(self):
+        """Tick now instead of waiting out the send interval."""
+        if not self._running:
+            return
+
+        if self._sender_task is not None:
+            # The running send re-arms the timer when it finishes
+            self._wake_pending = True
+            return
+
+        self._timer.cancel()
+        self._schedule(0)
+
+    def _tick(self):
+        """Timer callback: start a send if anything is queued, otherwise re-arm."""
+        self._timer = None
+        if not self._running:
+            return
+
+        if not self._message_queue:
+            self._schedule(self._current_interval)
+            return
+
+        self._sender_task = self._loop.create_task(self._send_and_reschedule())
+
+    async def _send_and_reschedule(self):
+        """Send queued messages, then arm the timer for the next tick."""
+        delay = self._current_interval
+        try:
+            await self._send_queued_messages()
+            self._backoff = 0.5
+            if self._wake_pending:
+                delay = 0
+        except Exception as e:
+            logger.error(f"Error in telemetry sender: {e}")
+            # Back off exponentially, never longer than the send interval
+            delay = min(self._backoff, self._current_interval)
+            self._backoff = min(self._backoff * 2, 30.0)
+
+        self._sender_task = None
+        self._wake_pending = False
+        if self._running:
+            self._schedule(delay)
 
     async def _send_queued_messages(self):
         """Send queued telemetry messages."""
@@ -255,29 +379,52 @@ class TelemetrySender:
             return
 
         # Send highest priority messages first
-        messages_to_send = []
         max_batch_size = 10
 
-        while len(messages_to_send) < max_batch_size and self._message_queue:
-            messages_to_send.append(self._message_queue.popleft())
+        batch = self._message_queue[:max_batch_size]
+        del self._message_queue[:max_batch_size]
+        messages_to_send = [entry[2] for entry in batch]
 
-        logger.debug(f"Sending {len(messages_to_send)} telemetry messages")
+        logger.debug("Sending {} telemetry messages", len(messages_to_send))
 
-        for message in messages_to_send:
-            success = await self._send_message(message)
+        # Coalesce the batch into one IoT message to amortize per-publish overhead
+        if len(messages_to_send) == 1:
+            success = await self._send_message(messages_to_send[0])
+        else:
+            success = await self._send_batch(messages_to_send)
 
-            if success:
-                self._messages_sent += 1
-                self._last_send_time = datetime.now()
-            else:
-                self._messages_failed += 1
+        if success:
+            self._messages_sent += len(messages_to_send)
+            self._last_send_time = datetime.now()
+            return
 
-                # Re-queue if failed (unless too old)
-                age = (datetime.now() - message.timestamp).total_seconds()
-                if age < 3600:  # Re-queue if less than 1 hour old
-                    self._message_queue.append(message)
-                else:
-                    logger.warning(f"Dropping stale message (age={age}s)")
+        self._messages_failed += len(messages_to_send)
+
+        now = time.time()
+        for entry in batch:
+            # Re-queue if failed (unless too old), keeping the original entry
+            # so retried messages stay ahead of newer ones of equal priority
+            age = now - entry[2].timestamp
+            if age < 3600:  # Re-queue if less than 1 hour old
+                self._insert(entry)
+            else:
+                logger.warning(f"Dropping stale message (age={age}s)")
+
+    @staticmethod
+    def _with_metadata(message: TelemetryMessage) -> Dict[str, Any]:
+        """Stamp queue metadata onto the message payload in place and return it."""
+        data = message.data
+        data["message_type"] = message.message_type
+        data["priority"] = message.priority
+        data["queued_at"] = datetime.fromtimestamp(message.timestamp).isoformat()
+        return data
+
+    def _properties_for(self, message_type: str) -> Dict[str, str]:
+        """Get the cached IoT message properties for a message type."""
+        props = self._props_cache.get(message_type)
+        if props is None:
+            props = self._props_cache[message_type] = {"messageType": message_type}
+        return props
 
     async def _send_message(self, message: TelemetryMessage) -> bool:
         """
@@ -291,22 +438,17 @@ class TelemetrySender:
         """
         try:
             # Add metadata
-            telemetry_data = {
-                **message.data,
-                "message_type": message.message_type,
-                "priority": message.priority,
-                "queued_at": message.timestamp.isoformat(),
-                "sent_at": datetime.now().isoformat()
-            }
+            telemetry_data = self._with_metadata(message)
+            telemetry_data["sent_at"] = datetime.now().isoformat()
 
             # Send via IoT client
             success = await self._iot_client.send_telemetry(
                 telemetry_data,
-                properties={"messageType": message.message_type}
+                properties=self._properties_for(message.message_type)
             )
 
             if success:
-                logger.debug(f"Sent {message.message_type} telemetry")
+                logger.debug("Sent {} telemetry", message.message_type)
             else:
                 logger.warning(f"Failed to send {message.message_type} telemetry")
 
@@ -316,6 +458,38 @@ class TelemetrySender:
             logger.error(f"Error sending telemetry: {e}")
             return False
 
+    async def _send_batch(self, messages: List[TelemetryMessage]) -> bool:
+        """
+        Send several telemetry messages as one batched IoT message.
+
+        Args:
+            messages: TelemetryMessages to send
+
+        Returns:
+            True if successful
+        """
+        try:
+            batch_payload = {
+                "batch": [self._with_metadata(message) for message in messages],
+                "sent_at": datetime.now().isoformat()
+            }
+
+            success = await self._iot_client.send_telemetry(
+                batch_payload,
+                properties={"messageType": "batch", "count": str(len(messages))}
+            )
+
+            if success:
+                logger.debug("Sent batch of {} telemetry messages", len(messages))
+            else:
+                logger.warning(f"Failed to send batch of {len(messages)} telemetry messages")
+
+            return success
+
+        except Exception as e:
+            logger.error(f"Error sending telemetry batch: {e}")
+            return False
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get telemetry statistics.
@@ -326,6 +500,7 @@ class TelemetrySender:
         return {
             "messages_sent": self._messages_sent,
             "messages_failed": self._messages_failed,
+            "messages_dropped": self._messages_dropped,
             "queue_size": len(self._message_queue),
             "current_interval": self._current_interval,
             "last_send_time": self._last_send_time.isoformat() if self._last_send_time else None,
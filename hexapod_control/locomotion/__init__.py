@@ -1,7 +1,7 @@
 """Locomotion control modules for hexapod."""
 
 from .ik_solver_wrapper import IKSolver, Position3D, JointAngles, LegDimensions
-from .servo_controller import ServoController  # Legacy PCA9685
+from .servo_controller import ServoController, MockServoController  # Legacy PCA9685
 from .maestro_controller import MaestroController  # Pololu Maestro
 from .gait_controller import GaitController
 
@@ -11,6 +11,7 @@ __all__ = [
     'JointAngles',
     'LegDimensions',
     'ServoController',
+    'MockServoController',
     'MaestroController',
     'GaitController',
 ]
@@ -0,0 +1,79 @@
+"""
+ctypes bindings for libservo_driver.
+
+Declarations mirror locomotion/lib/servo_driver.h one-to-one; update both
+together. Signatures are applied once per library path and the configured
+CDLL is cached, so further controllers reuse it without setup.
+"""
+
+import ctypes
+from typing import Dict, List, Tuple
+
+_c_uint8_p = ctypes.POINTER(ctypes.c_uint8)
+_c_uint16_p = ctypes.POINTER(ctypes.c_uint16)
+_c_double_p = ctypes.POINTER(ctypes.c_double)
+
+# Function name -> (restype, argtypes)
+SIGNATURES: Dict[str, Tuple[object, List[object]]] = {
+    'servo_driver_init': (ctypes.c_int, [
+        ctypes.c_int,      # i2c_bus
+        ctypes.c_uint8,    # i2c_addr
+        ctypes.c_uint16,   # pwm_freq
+    ]),
+    'servo_set_angle': (ctypes.c_int, [
+        ctypes.c_uint8,    # channel
+        ctypes.c_double,   # angle_deg
+        ctypes.c_uint16,   # min_pulse
+        ctypes.c_uint16,   # max_pulse
+        ctypes.c_uint16,   # pwm_freq
+    ]),
+    'servo_set_multiple': (ctypes.c_int, [
+        _c_uint8_p,        # channels
+        _c_double_p,       # angles
+        ctypes.c_int,      # count
+        ctypes.c_uint16,   # min_pulse
+        ctypes.c_uint16,   # max_pulse
+        ctypes.c_uint16,   # pwm_freq
+    ]),
+    'servo_set_multiple_raw': (ctypes.c_int, [
+        _c_uint8_p,        # servo_idx
+        _c_double_p,       # angles (in: raw, out: adjusted)
+        ctypes.c_int,      # count
+        _c_uint16_p,       # channel_map
+        _c_double_p,       # signs
+        _c_double_p,       # biases
+        _c_double_p,       # min_angles
+        _c_double_p,       # max_angles
+        ctypes.c_uint16,   # min_pulse
+        ctypes.c_uint16,   # max_pulse
+        ctypes.c_uint16,   # pwm_freq
+    ]),
+    'servo_off': (ctypes.c_int, [ctypes.c_uint8]),
+    'servo_off_all': (ctypes.c_int, []),
+    'servo_driver_close': (None, []),
+    'servo_driver_is_initialized': (ctypes.c_int, []),
+}
+
+_libraries: Dict[str, ctypes.CDLL] = {}
+
+
+def load(lib_path: str) -> ctypes.CDLL:
+    """
+    Load the servo driver library with all function signatures applied.
+
+    Args:
+        lib_path: Path to libservo_driver (.so/.dll)
+
+    Returns:
+        Configured library handle (cached per path)
+    """
+    lib_path = str(lib_path)
+    lib = _libraries.get(lib_path)
+    if lib is None:
+        lib = ctypes.CDLL(lib_path)
+        for name, (restype, argtypes) in SIGNATURES.items():
+            func = getattr(lib, name)
+            func.restype = restype
+            func.argtypes = argtypes
+        _libraries[lib_path] = lib
+    return lib
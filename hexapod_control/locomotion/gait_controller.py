@@ -5,13 +5,81 @@ import math
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+import numpy as np
 from loguru import logger
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from locomotion.ik_solver_wrapper import IKSolver, Position3D, LegDimensions
 from locomotion.servo_controller import ServoController
 from utils.config_loader import get_config_loader
 
 
+def _trajectory_kernel(
+    base_x: float,
+    base_y: float,
+    base_z: float,
+    phase: float,
+    step_length: float,
+    step_height: float,
+    cos_d: float,
+    sin_d: float
+) -> Tuple[float, float, float]:
+    """Foot (x, y, z) for one leg at a gait phase; see _calculate_leg_trajectory."""
+    if phase < 0.5:
+        # Swing phase: forward motion along a parabolic arc
+        swing_phase = phase * 2.0
+        forward = step_length * (swing_phase - 0.5)
+        height_offset = step_height * (1.0 - (2.0 * swing_phase - 1.0) ** 2)
+        return (
+            base_x + forward * cos_d,
+            base_y + forward * sin_d,
+            base_z + height_offset
+        )
+
+    # Stance phase: foot on the ground, moving backward
+    stance_phase = (phase - 0.5) * 2.0
+    backward = -step_length * stance_phase
+    return (
+        base_x + backward * cos_d,
+        base_y + backward * sin_d,
+        base_z
+    )
+
+
+def _tripod_kernel(
+    base_x: np.ndarray,
+    base_y: np.ndarray,
+    base_z: np.ndarray,
+    phase_offsets: np.ndarray,
+    phase: float,
+    step_length: float,
+    step_height: float,
+    cos_d: float,
+    sin_d: float,
+    out: np.ndarray
+):
+    """Fill out[6, 3] with tripod foot targets for all legs."""
+    for leg_idx in range(6):
+        leg_phase = (phase + phase_offsets[leg_idx]) % 1.0
+        x, y, z = _trajectory_kernel(
+            base_x[leg_idx], base_y[leg_idx], base_z[leg_idx],
+            leg_phase, step_length, step_height, cos_d, sin_d
+        )
+        out[leg_idx, 0] = x
+        out[leg_idx, 1] = y
+        out[leg_idx, 2] = z
+
+
+if NUMBA_AVAILABLE:
+    _trajectory_kernel = njit(cache=True, fastmath=True)(_trajectory_kernel)
+    _tripod_kernel = njit(cache=True, fastmath=True)(_tripod_kernel)
+
+
 class GaitType(Enum):
     """Available gait patterns."""
     TRIPOD = "tripod"
@@ -65,28 +133,44 @@ class GaitController:
         behavior_config = self._config_loader.get_behavior_config()
 
         # Parse leg dimensions
-        dims = hw_config['hexapod']['dimensions']
-        self._leg_dimensions = LegDimensions(
-            coxa_length=dims['coxa_length'],
-            femur_length=dims['femur_length'],
-            tibia_length=dims['tibia_length']
-        )
+        self._leg_dimensions = LegDimensions.from_config(hw_config['hexapod']['dimensions'])
+        # All legs share these dimensions; bind them into one IK function
+        self._solve_leg_ik = self._ik_solver.specialize(self._leg_dimensions)
 
         # Body configuration
         self._body_radius = hw_config['hexapod']['body']['radius']
         self._default_height = hw_config['hexapod']['body']['height']
         self._leg_angles = hw_config['hexapod']['leg_angles']
 
+        # Leg mounting angle trig tables (constant for the robot's lifetime)
+        leg_angles_rad = [
+            math.radians(self._leg_angles[f'leg_{leg_idx}']) for leg_idx in range(6)
+        ]
+        self._leg_dir_cos: Tuple[float, ...] = tuple(math.cos(a) for a in leg_angles_rad)
+        self._leg_dir_sin: Tuple[float, ...] = tuple(math.sin(a) for a in leg_angles_rad)
+
         # Load gait configurations
         self._gait_configs = self._parse_gait_configs(behavior_config['gaits'])
         self._current_gait = GaitType.TRIPOD
         self._gait_running = False
         self._gait_task: Optional[asyncio.Task] = None
 
-        # Movement state
-        self._current_positions: Dict[int, Position3D] = {}
+        # Movement state: row i is leg i's current foot (x, y, z)
+        self._positions = np.zeros((6, 3), dtype=np.float64)
         self._initialize_default_positions()
 
+        self._all_legs = list(range(6))
+
+        # Tripod phase offsets: legs 0, 2, 4 lead, legs 1, 3, 5 trail by half a cycle
+        self._tripod_offsets = np.array([0.0, 0.5, 0.0, 0.5, 0.0, 0.5])
+
+        # Output buffer for the JIT tripod kernel
+        self._tripod_targets = np.empty((6, 3))
+        if NUMBA_AVAILABLE:
+            # Warm start so the first gait cycle doesn't pay compile cost
+            self._calculate_leg_trajectory(0, 0.0, 0.0, 0.0)
+            self._calculate_tripod_targets(0.0, 0.0, 0.0, 1.0, 0.0)
+
         logger.info("GaitController initialized")
 
     def _parse_gait_configs(self, gait_data: dict) -> Dict[GaitType, GaitConfig]:
@@ -114,17 +198,31 @@ class GaitController:
     def _initialize_default_positions(self):
         """Initialize legs to default standing positions."""
         for leg_idx in range(6):
-            # Calculate default foot position in body coordinate system
-            leg_angle_deg = self._leg_angles[f'leg_{leg_idx}']
-            leg_angle_rad = math.radians(leg_angle_deg)
-
-            # Position foot at default radius and height
+            # Position foot at default radius and height in body coordinate system
             default_reach = 100.0  # mm from body center
-            x = default_reach * math.cos(leg_angle_rad)
-            y = default_reach * math.sin(leg_angle_rad)
+            x = default_reach * self._leg_dir_cos[leg_idx]
+            y = default_reach * self._leg_dir_sin[leg_idx]
             z = -self._default_height
 
-            self._current_positions[leg_idx] = Position3D(x, y, z)
+            self._positions[leg_idx] = (x, y, z)
+
+        # Neutral stance as per-axis arrays for vectorized trajectory math
+        self._base_x = self._positions[:, 0].copy()
+        self._base_y = self._positions[:, 1].copy()
+        self._base_z = self._positions[:, 2].copy()
+
+    def get_leg_position(self, leg_idx: int) -> Position3D:
+        """
+        Get current foot position for a leg.
+
+        Args:
+            leg_idx: Leg index (0-5)
+
+        Returns:
+            Current foot position
+        """
+        x, y, z = self._positions[leg_idx].tolist()
+        return Position3D(x, y, z)
 
     def set_gait(self, gait_type: GaitType):
         """
@@ -161,18 +259,13 @@ class GaitController:
         """
         try:
             # Solve inverse kinematics
-            angles = self._ik_solver.solve_ik(position, self._leg_dimensions)
+            coxa, femur, tibia = self._solve_leg_ik(position.x, position.y, position.z)
 
             # Send to servos
-            success = self._servo_controller.set_leg_angles(
-                leg_idx,
-                angles.coxa,
-                angles.femur,
-                angles.tibia
-            )
+            success = self._servo_controller.set_leg_angles(leg_idx, coxa, femur, tibia)
 
             if success:
-                self._current_positions[leg_idx] = position
+                self._positions[leg_idx] = (position.x, position.y, position.z)
 
             return success
 
@@ -180,31 +273,77 @@ class GaitController:
             logger.error(f"Failed to move leg {leg_idx}: {e}")
             return False
 
+    async def move_legs_to_positions(self, positions: Dict[int, Position3D]) -> bool:
+        """
+        Move several legs at once using IK and a single batched servo update.
+
+        Legs whose IK fails are logged and left where they are.
+
+        Args:
+            positions: Dictionary mapping leg_idx -> target foot position
+
+        Returns:
+            True if all legs moved successfully
+        """
+        targets = np.array([(p.x, p.y, p.z) for p in positions.values()])
+        return await self._move_legs(list(positions), targets)
+
+    async def _move_legs(self, leg_indices: List[int], targets: np.ndarray) -> bool:
+        """
+        Solve IK for all targets in one batch and send a single servo update.
+
+        Args:
+            leg_indices: Leg index for each row of targets
+            targets: Array of shape (N, 3) with target foot positions
+
+        Returns:
+            True if all legs moved successfully
+        """
+        angles = self._ik_solver.solve_ik_batch(targets, self._leg_dimensions)
+
+        leg_angles = {}
+        solved = []
+        for row, leg_idx in enumerate(leg_indices):
+            coxa, femur, tibia = angles[row].tolist()
+            if math.isnan(coxa):
+                logger.error(f"Failed to move leg {leg_idx}: target unreachable")
+                continue
+
+            leg_angles[leg_idx] = (coxa, femur, tibia)
+            solved.append(row)
+
+        if not leg_angles:
+            return False
+
+        try:
+            success = self._servo_controller.set_all_legs(leg_angles)
+        except Exception as e:
+            logger.error(f"Failed to move legs: {e}")
+            return False
+
+        if success:
+            self._positions[[leg_indices[row] for row in solved]] = targets[solved]
+
+        return success and len(solved) == len(leg_indices)
+
     async def stand(self):
         """Move all legs to standing position."""
         logger.info("Moving to standing position")
 
-        tasks = []
-        for leg_idx in range(6):
-            pos = self._current_positions[leg_idx]
-            tasks.append(self.move_leg_to_position(leg_idx, pos))
-
-        results = await asyncio.gather(*tasks)
-        return all(results)
+        return await self.move_legs_to_positions({
+            leg_idx: self.get_leg_position(leg_idx) for leg_idx in range(6)
+        })
 
     async def sit(self):
         """Lower body to sitting position."""
         logger.info("Moving to sitting position")
 
-        tasks = []
-        for leg_idx in range(6):
-            pos = self._current_positions[leg_idx]
-            # Lower body by 30mm
-            lowered_pos = Position3D(pos.x, pos.y, pos.z - 30.0)
-            tasks.append(self.move_leg_to_position(leg_idx, lowered_pos))
-
-        results = await asyncio.gather(*tasks)
-        return all(results)
+        # Lower body by 30mm
+        lowered = {
+            leg_idx: Position3D(x, y, z - 30.0)
+            for leg_idx, (x, y, z) in enumerate(self._positions.tolist())
+        }
+        return await self.move_legs_to_positions(lowered)
 
     def _calculate_leg_trajectory(
         self,
@@ -212,7 +351,8 @@ class GaitController:
         phase: float,
         step_length: float,
         step_height: float,
-        direction: float = 0.0
+        cos_d: float = 1.0,
+        sin_d: float = 0.0
     ) -> Position3D:
         """
         Calculate leg position for given gait phase.
@@ -222,45 +362,79 @@ class GaitController:
             phase: Gait phase (0.0 to 1.0)
             step_length: Length of step in mm
             step_height: Height of step in mm
-            direction: Movement direction in degrees
+            cos_d: Cosine of movement direction (precomputed per cycle)
+            sin_d: Sine of movement direction (precomputed per cycle)
 
         Returns:
             Target foot position
         """
-        base_pos = self._current_positions[leg_idx]
-        direction_rad = math.radians(direction)
+        x, y, z = _trajectory_kernel(
+            float(self._base_x[leg_idx]),
+            float(self._base_y[leg_idx]),
+            float(self._base_z[leg_idx]),
+            phase, step_length, step_height, cos_d, sin_d
+        )
+        return Position3D(x, y, z)
 
-        if phase < 0.5:
-            # Swing phase (foot in air)
-            swing_phase = phase * 2.0  # 0.0 to 1.0
+    def _calculate_tripod_targets(
+        self,
+        phase: float,
+        step_length: float,
+        step_height: float,
+        cos_d: float,
+        sin_d: float
+    ) -> np.ndarray:
+        """
+        Calculate foot positions for all six legs at a tripod gait phase.
 
-            # Forward motion during swing
-            forward = step_length * (swing_phase - 0.5)
-            x_offset = forward * math.cos(direction_rad)
-            y_offset = forward * math.sin(direction_rad)
+        Vectorized equivalent of calling _calculate_leg_trajectory per leg.
+        Uses the JIT kernel when Numba is available, in which case the
+        returned array is a reused buffer valid until the next call.
 
-            # Parabolic arc for foot height
-            height_offset = step_height * (1.0 - (2.0 * swing_phase - 1.0) ** 2)
+        Args:
+            phase: Gait phase of group A (0.0 to 1.0)
+            step_length: Length of step in mm
+            step_height: Height of step in mm
+            cos_d: Cosine of movement direction
+            sin_d: Sine of movement direction
 
-            return Position3D(
-                base_pos.x + x_offset,
-                base_pos.y + y_offset,
-                base_pos.z + height_offset
-            )
-        else:
-            # Stance phase (foot on ground)
-            stance_phase = (phase - 0.5) * 2.0  # 0.0 to 1.0
-
-            # Backward motion during stance (body moves forward)
-            backward = -step_length * stance_phase
-            x_offset = backward * math.cos(direction_rad)
-            y_offset = backward * math.sin(direction_rad)
-
-            return Position3D(
-                base_pos.x + x_offset,
-                base_pos.y + y_offset,
-                base_pos.z
+        Returns:
+            Array of shape (6, 3) with target (x, y, z) per leg
+        """
+        if NUMBA_AVAILABLE:
+            _tripod_kernel(
+                self._base_x, self._base_y, self._base_z, self._tripod_offsets,
+                phase, step_length, step_height, cos_d, sin_d,
+                self._tripod_targets
             )
+            return self._tripod_targets
+
+        # Group 1 and Group 2 are 180 degrees out of phase
+        phases = (phase + self._tripod_offsets) % 1.0
+        swing_mask = phases < 0.5
+
+        swing_phases = phases * 2.0
+        stance_phases = (phases - 0.5) * 2.0
+
+        # Forward motion during swing, backward during stance
+        motion = np.where(
+            swing_mask,
+            step_length * (swing_phases - 0.5),
+            -step_length * stance_phases
+        )
+
+        # Parabolic arc for foot height, feet on the ground during stance
+        z_offsets = np.where(
+            swing_mask,
+            step_height * (1.0 - (2.0 * swing_phases - 1.0) ** 2),
+            0.0
+        )
+
+        return np.stack([
+            self._base_x + motion * cos_d,
+            self._base_y + motion * sin_d,
+            self._base_z + z_offsets
+        ], axis=1)
 
     async def _tripod_gait_cycle(
         self,
@@ -287,21 +461,23 @@ class GaitController:
         num_steps = 20  # Number of interpolation steps
         dt = cycle_time / num_steps
 
-        for step in range(num_steps):
-            phase = step / num_steps
-            tasks = []
-
-            for leg_idx in range(6):
-                # Group 1 and Group 2 are 180 degrees out of phase
-                leg_phase = phase if leg_idx in [0, 2, 4] else (phase + 0.5) % 1.0
+        # Direction is constant for the whole cycle
+        direction_rad = math.radians(direction)
+        cos_d = math.cos(direction_rad)
+        sin_d = math.sin(direction_rad)
 
-                target_pos = self._calculate_leg_trajectory(
-                    leg_idx, leg_phase, step_length, step_height, direction
-                )
+        for step in range(num_steps):
+            # Bail out mid-cycle so stop_walking lands within one step
+            if not self._gait_running:
+                return
 
-                tasks.append(self.move_leg_to_position(leg_idx, target_pos))
+            phase = step / num_steps
+            targets = self._calculate_tripod_targets(
+                phase, step_length, step_height, cos_d, sin_d
+            )
 
-            await asyncio.gather(*tasks)
+            # One IK pass and one servo bus transaction for all six legs
+            await self._move_legs(self._all_legs, targets)
             await asyncio.sleep(dt)
 
     async def _wave_gait_cycle(
@@ -316,27 +492,39 @@ class GaitController:
         # Wave gait: Legs move one at a time in sequence
         leg_sequence = [0, 5, 1, 4, 2, 3]  # Optimized sequence
 
+        direction_rad = math.radians(direction)
+        dx = step_length * math.cos(direction_rad)
+        dy = step_length * math.sin(direction_rad)
+
         for leg_idx in leg_sequence:
             # Lift and move leg
-            current = self._current_positions[leg_idx]
+            x, y, z = self._positions[leg_idx].tolist()
 
             # Lift phase
-            direction_rad = math.radians(direction)
-            x_target = current.x + step_length * math.cos(direction_rad)
-            y_target = current.y + step_length * math.sin(direction_rad)
+            x_target = x + dx
+            y_target = y + dy
+
+            if not self._gait_running:
+                return
 
             # Move up
-            up_pos = Position3D(current.x, current.y, current.z + step_height)
+            up_pos = Position3D(x, y, z + step_height)
             await self.move_leg_to_position(leg_idx, up_pos)
             await asyncio.sleep(cycle_time / 18)
 
+            if not self._gait_running:
+                return
+
             # Move forward
-            forward_pos = Position3D(x_target, y_target, current.z + step_height)
+            forward_pos = Position3D(x_target, y_target, z + step_height)
             await self.move_leg_to_position(leg_idx, forward_pos)
             await asyncio.sleep(cycle_time / 18)
 
+            if not self._gait_running:
+                return
+
             # Move down
-            down_pos = Position3D(x_target, y_target, current.z)
+            down_pos = Position3D(x_target, y_target, z)
             await self.move_leg_to_position(leg_idx, down_pos)
             await asyncio.sleep(cycle_time / 18)
 
@@ -359,19 +547,33 @@ class GaitController:
             return
 
         self._gait_running = True
-        config = self._gait_configs[self._current_gait]
 
         logger.info(
             f"Starting {self._current_gait.value} gait: "
             f"direction={direction}°, speed={speed:.2f}"
         )
 
-        start_time = asyncio.get_event_loop().time()
+        # Run the gait in its own task so stop_walking can await exactly it
+        self._gait_task = asyncio.create_task(
+            self._gait_loop(direction, speed, duration)
+        )
+        await self._gait_task
+
+    async def _gait_loop(
+        self,
+        direction: float,
+        speed: float,
+        duration: Optional[float]
+    ):
+        """Run gait cycles until stopped or the duration elapses."""
+        config = self._gait_configs[self._current_gait]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + duration if duration else None
 
         try:
             while self._gait_running:
                 # Check duration limit
-                if duration and (asyncio.get_event_loop().time() - start_time) > duration:
+                if deadline is not None and loop.time() > deadline:
                     break
 
                 # Execute gait cycle
@@ -406,9 +608,14 @@ class GaitController:
         logger.info("Stopping gait")
         self._gait_running = False
 
-        # Wait for gait to finish current cycle
-        if self._gait_task:
-            await asyncio.sleep(0.5)
+        # Wait for gait to finish its current interpolation step
+        task = self._gait_task
+        self._gait_task = None
+        if task and task is not asyncio.current_task():
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
 
     def is_walking(self) -> bool:
         """Check if gait is currently running."""
@@ -433,7 +640,7 @@ class GaitController:
         return {
             'current_gait': self._current_gait.value,
             'is_walking': self._gait_running,
-            'leg_count': len(self._current_positions),
+            'leg_count': len(self._positions),
             'gait_config': {
                 'step_length': self._gait_configs[self._current_gait].step_length,
                 'step_height': self._gait_configs[self._current_gait].step_height,
@@ -1,11 +1,26 @@
 """Python wrapper for C++ inverse kinematics solver."""
 
 import ctypes
+import math
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Tuple
+from dataclasses import dataclass, field
+from typing import Callable, Tuple
+import numpy as np
 from loguru import logger
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from locomotion.lib import ik_solver_cy
+    CYTHON_IK_AVAILABLE = True
+except ImportError:
+    CYTHON_IK_AVAILABLE = False
+
 
 # Define C structures once at module level to avoid type conflicts
 class CPosition3D(ctypes.Structure):
@@ -57,13 +72,53 @@ class JointAngles:
         return cls(c_struct.coxa, c_struct.femur, c_struct.tibia)
 
 
-@dataclass
+@dataclass(frozen=True)
 class LegDimensions:
     """Leg segment dimensions in millimeters."""
     coxa_length: float
     femur_length: float
     tibia_length: float
 
+    # Law-of-cosines terms, constant for the lifetime of the leg
+    sq_sum: float = field(init=False, repr=False)       # l2² + l3²
+    sq_diff: float = field(init=False, repr=False)      # l2² - l3²
+    inv_2l2l3: float = field(init=False, repr=False)    # 1 / (2·l2·l3)
+    inv_2l2: float = field(init=False, repr=False)      # 1 / (2·l2)
+    max_reach: float = field(init=False, repr=False)
+    min_reach: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Precompute the IK terms that depend only on segment lengths."""
+        l2 = self.femur_length
+        l3 = self.tibia_length
+        derived = {
+            'sq_sum': l2 * l2 + l3 * l3,
+            'sq_diff': l2 * l2 - l3 * l3,
+            'inv_2l2l3': 1.0 / (2.0 * l2 * l3),
+            'inv_2l2': 1.0 / (2.0 * l2),
+            'max_reach': l2 + l3,
+            'min_reach': abs(l2 - l3),
+        }
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_config(cls, dims) -> "LegDimensions":
+        """
+        Create from the hexapod.dimensions section of hardware.yaml.
+
+        Args:
+            dims: Mapping with coxa_length, femur_length and tibia_length
+
+        Returns:
+            LegDimensions with the IK terms precomputed
+        """
+        return cls(
+            coxa_length=dims['coxa_length'],
+            femur_length=dims['femur_length'],
+            tibia_length=dims['tibia_length']
+        )
+
     def to_c_struct(self):
         """Convert to ctypes structure."""
         return CLegDimensions(self.coxa_length, self.femur_length, self.tibia_length)
@@ -73,7 +128,8 @@ class IKSolver:
     """
     Inverse kinematics solver for hexapod legs.
 
-    Wraps C++ implementation for performance.
+    Wraps C++ implementation for performance. Prefers the Cython bindings
+    when built ('make cython'), then the ctypes library, then pure Python.
     """
 
     def __init__(self, lib_path: str = None):
@@ -81,8 +137,30 @@ class IKSolver:
         Initialize IK solver.
 
         Args:
-            lib_path: Path to compiled IK solver library (.so file)
+            lib_path: Path to compiled IK solver library (.so file).
+                If given, the ctypes library is used even if Cython
+                bindings are available.
         """
+        # Persistent ctypes buffers, filled in place on every call
+        self._c_angles = CJointAngles()
+        self._c_target = CPosition3D()
+        self._c_dims = CLegDimensions()
+        self._c_ik_in = (ctypes.c_double * 3)()
+        self._c_ik_out = (ctypes.c_double * 3)()
+
+        # Per-instance reachability memo over 0.1 mm-quantized targets;
+        # LegDimensions is frozen and part of the key, so no invalidation needed
+        self._is_reachable_cached = lru_cache(maxsize=4096)(self._is_reachable_quantized)
+
+        self._lib = None
+        self._use_cython = False
+
+        if lib_path is None and CYTHON_IK_AVAILABLE:
+            self._use_cython = True
+            self._use_python_fallback = False
+            logger.info("Using Cython IK solver bindings")
+            return
+
         if lib_path is None:
             # Auto-detect library path based on platform
             import sys
@@ -114,22 +192,46 @@ class IKSolver:
 
     def _setup_ctypes(self):
         """Setup ctypes function signatures."""
-        # solve_ik function
-        self._lib.solve_ik.argtypes = [CPosition3D, CLegDimensions]
-        self._lib.solve_ik.restype = CJointAngles
+        # The C++ functions take structs by const reference, i.e. by pointer.
+        # solve_ik itself throws on unreachable targets, which must not cross
+        # the FFI boundary, so IK goes through the non-throwing solve_ik_array.
+        self._lib.solve_ik_array.argtypes = [
+            ctypes.POINTER(ctypes.c_double),  # targets (n x 3)
+            ctypes.c_int,                     # n
+            ctypes.POINTER(CLegDimensions),   # dimensions
+            ctypes.POINTER(ctypes.c_double)   # out (n x 3)
+        ]
+        self._lib.solve_ik_array.restype = ctypes.c_int
 
         # solve_fk function
-        self._lib.solve_fk.argtypes = [CJointAngles, CLegDimensions]
+        self._lib.solve_fk.argtypes = [
+            ctypes.POINTER(CJointAngles),
+            ctypes.POINTER(CLegDimensions)
+        ]
         self._lib.solve_fk.restype = CPosition3D
 
         # is_reachable function
-        self._lib.is_reachable.argtypes = [CPosition3D, CLegDimensions]
+        self._lib.is_reachable.argtypes = [
+            ctypes.POINTER(CPosition3D),
+            ctypes.POINTER(CLegDimensions)
+        ]
         self._lib.is_reachable.restype = ctypes.c_bool
 
         # max_reach_at_height function
-        self._lib.max_reach_at_height.argtypes = [ctypes.c_double, CLegDimensions]
+        self._lib.max_reach_at_height.argtypes = [
+            ctypes.c_double,
+            ctypes.POINTER(CLegDimensions)
+        ]
         self._lib.max_reach_at_height.restype = ctypes.c_double
 
+    def _load_dims(self, dimensions: LegDimensions) -> ctypes.Structure:
+        """Copy leg dimensions into the persistent C buffer."""
+        c_dims = self._c_dims
+        c_dims.coxa_length = dimensions.coxa_length
+        c_dims.femur_length = dimensions.femur_length
+        c_dims.tibia_length = dimensions.tibia_length
+        return c_dims
+
     def solve_ik(self, target: Position3D, dimensions: LegDimensions) -> JointAngles:
         """
         Solve inverse kinematics for a leg.
@@ -144,18 +246,72 @@ class IKSolver:
         Raises:
             RuntimeError: If target position is unreachable
         """
+        if self._use_cython:
+            coxa, femur, tibia = ik_solver_cy.solve_ik_cy(
+                target.x, target.y, target.z,
+                dimensions.coxa_length, dimensions.femur_length, dimensions.tibia_length
+            )
+            return JointAngles(coxa, femur, tibia)
+
         if self._use_python_fallback:
             return self._solve_ik_python(target, dimensions)
 
+        c_in = self._c_ik_in
+        c_out = self._c_ik_out
+        c_in[0] = target.x
+        c_in[1] = target.y
+        c_in[2] = target.z
+
         try:
-            c_result = self._lib.solve_ik(
-                target.to_c_struct(),
-                dimensions.to_c_struct()
+            unreachable = self._lib.solve_ik_array(
+                c_in, 1, ctypes.byref(self._load_dims(dimensions)), c_out
             )
-            return JointAngles(c_result.coxa, c_result.femur, c_result.tibia)
         except Exception as e:
             raise RuntimeError(f"IK solver failed: {e}")
 
+        if unreachable:
+            raise RuntimeError("Target position unreachable")
+
+        return JointAngles(c_out[0], c_out[1], c_out[2])
+
+    def specialize(self, dimensions: LegDimensions) -> Callable[[float, float, float],
+                                                               Tuple[float, float, float]]:
+        """
+        Build an IK function with the given leg dimensions baked in.
+
+        The solver is generated from a source template with every
+        dimension-derived term as a numeric literal, so a call does no
+        attribute lookups or backend dispatch. Capture the result once
+        (all legs share the same dimensions) and call it from the hot path.
+
+        Args:
+            dimensions: Leg segment lengths
+
+        Returns:
+            ik(x, y, z) -> (coxa, femur, tibia) in degrees; raises
+            RuntimeError for unreachable targets like solve_ik
+        """
+        source = _IK_SPECIALIZED_TEMPLATE.format(
+            coxa_length=float(dimensions.coxa_length),
+            sq_sum=dimensions.sq_sum,
+            sq_diff=dimensions.sq_diff,
+            inv_2l2l3=dimensions.inv_2l2l3,
+            inv_2l2=dimensions.inv_2l2,
+            max_reach=float(dimensions.max_reach),
+            min_reach=float(dimensions.min_reach),
+        )
+        namespace = {
+            'atan2': math.atan2,
+            'sqrt': math.sqrt,
+            'acos': math.acos,
+            'degrees': math.degrees,
+        }
+        exec(compile(source, f"<ik specialized for {dimensions}>", "exec"), namespace)
+
+        ik = namespace['ik']
+        ik.__doc__ = f"IK specialized for {dimensions}; returns (coxa, femur, tibia)."
+        return ik
+
     def solve_fk(self, angles: JointAngles, dimensions: LegDimensions) -> Position3D:
         """
         Solve forward kinematics (calculate foot position from joint angles).
@@ -167,18 +323,172 @@ class IKSolver:
         Returns:
             Foot position (x, y, z in mm)
         """
+        if self._use_cython:
+            x, y, z = ik_solver_cy.solve_fk_cy(
+                angles.coxa, angles.femur, angles.tibia,
+                dimensions.coxa_length, dimensions.femur_length, dimensions.tibia_length
+            )
+            return Position3D(x, y, z)
+
         if self._use_python_fallback:
             return self._solve_fk_python(angles, dimensions)
 
-        c_angles = CJointAngles(angles.coxa, angles.femur, angles.tibia)
-        c_result = self._lib.solve_fk(c_angles, dimensions.to_c_struct())
+        c_angles = self._c_angles
+        c_angles.coxa = angles.coxa
+        c_angles.femur = angles.femur
+        c_angles.tibia = angles.tibia
+        c_result = self._lib.solve_fk(
+            ctypes.byref(c_angles),
+            ctypes.byref(self._load_dims(dimensions))
+        )
 
         return Position3D(c_result.x, c_result.y, c_result.z)
 
+    def solve_ik_batch(self, targets: np.ndarray, dimensions: LegDimensions) -> np.ndarray:
+        """
+        Solve inverse kinematics for several legs at once.
+
+        Vectorized equivalent of solve_ik over an array of targets.
+
+        Args:
+            targets: Array of shape (N, 3) with foot positions (x, y, z in mm)
+            dimensions: Leg segment lengths
+
+        Returns:
+            Array of shape (N, 3) with (coxa, femur, tibia) in degrees.
+            Rows for unreachable targets are NaN instead of raising.
+        """
+        if self._use_cython:
+            targets = np.ascontiguousarray(targets, dtype=np.float64)
+            out = np.empty_like(targets)
+            ik_solver_cy.solve_ik_batch_cy(
+                targets, out,
+                dimensions.coxa_length, dimensions.femur_length, dimensions.tibia_length
+            )
+            return out
+
+        if not self._use_python_fallback:
+            # One FFI call for all legs
+            targets = np.ascontiguousarray(targets, dtype=np.float64)
+            out = np.empty_like(targets)
+            self._lib.solve_ik_array(
+                targets.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+                len(targets),
+                ctypes.byref(self._load_dims(dimensions)),
+                out.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
+            )
+            return out
+
+        if NUMBA_AVAILABLE:
+            targets = np.ascontiguousarray(targets, dtype=np.float64)
+            out = np.empty_like(targets)
+            _ik_batch_kernel(
+                targets,
+                dimensions.coxa_length, dimensions.sq_sum, dimensions.sq_diff,
+                dimensions.inv_2l2l3, dimensions.inv_2l2,
+                dimensions.max_reach, dimensions.min_reach,
+                out
+            )
+            return out
+
+        targets = np.asarray(targets, dtype=np.float64)
+        x = targets[:, 0]
+        y = targets[:, 1]
+        z = targets[:, 2]
+
+        l1 = dimensions.coxa_length
+
+        # Coxa angle and planar reach from the femur joint
+        coxa_rad = np.arctan2(y, x)
+        # Same sqrt form as the scalar solvers so reach limits agree exactly
+        horizontal_reach = np.sqrt(x * x + y * y) - l1
+        reach_distance = np.sqrt(horizontal_reach * horizontal_reach + z * z)
+
+        reachable = (
+            (reach_distance <= dimensions.max_reach) &
+            (reach_distance >= dimensions.min_reach)
+        )
+        reach_sq = reach_distance * reach_distance
+
+        # Law of cosines for tibia
+        cos_tibia = np.clip((dimensions.sq_sum - reach_sq) * dimensions.inv_2l2l3, -1.0, 1.0)
+        tibia_rad = np.arccos(cos_tibia)
+
+        # Femur angle
+        reach_angle = np.arctan2(z, horizontal_reach)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cos_femur_offset = np.clip(
+                (dimensions.sq_diff + reach_sq) * dimensions.inv_2l2 / reach_distance,
+                -1.0, 1.0
+            )
+        femur_rad = reach_angle + np.arccos(cos_femur_offset)
+
+        # Convert to degrees and adjust for servo range
+        angles = np.stack([
+            np.degrees(coxa_rad) + 90.0,
+            np.degrees(femur_rad) + 90.0,
+            180.0 - np.degrees(tibia_rad)
+        ], axis=1)
+        np.clip(angles, 0.0, 180.0, out=angles)
+        angles[~reachable] = np.nan
+
+        return angles
+
+    def solve_legs(self, targets: np.ndarray, dimensions: LegDimensions) -> np.ndarray:
+        """
+        Solve inverse kinematics for the whole hexapod in one call.
+
+        Args:
+            targets: C-contiguous float64 array of shape (6, 3), one foot
+                position (x, y, z in mm) per leg
+            dimensions: Leg segment lengths
+
+        Returns:
+            Array of shape (6, 3) with (coxa, femur, tibia) in degrees per leg,
+            NaN rows for unreachable targets
+        """
+        targets = np.ascontiguousarray(targets, dtype=np.float64)
+        if targets.shape != (6, 3):
+            raise ValueError(f"Expected targets of shape (6, 3), got {targets.shape}")
+
+        return self.solve_ik_batch(targets, dimensions)
+
+    def solve_fk_batch(self, angles: np.ndarray, dimensions: LegDimensions) -> np.ndarray:
+        """
+        Solve forward kinematics for several legs at once.
+
+        Args:
+            angles: Array of shape (N, 3) with (coxa, femur, tibia) in degrees
+            dimensions: Leg segment lengths
+
+        Returns:
+            Array of shape (N, 3) with foot positions (x, y, z in mm)
+        """
+        angles = np.asarray(angles, dtype=np.float64)
+        coxa_rad = np.radians(angles[:, 0] - 90.0)
+        femur_rad = np.radians(angles[:, 1] - 90.0)
+        tibia_abs_angle = femur_rad + np.radians(180.0 - angles[:, 2]) - np.pi
+
+        total_horizontal = (
+            dimensions.femur_length * np.cos(femur_rad) +
+            dimensions.tibia_length * np.cos(tibia_abs_angle)
+        )
+        radial = dimensions.coxa_length + total_horizontal
+
+        return np.stack([
+            radial * np.cos(coxa_rad),
+            radial * np.sin(coxa_rad),
+            dimensions.femur_length * np.sin(femur_rad) +
+            dimensions.tibia_length * np.sin(tibia_abs_angle)
+        ], axis=1)
+
     def is_reachable(self, target: Position3D, dimensions: LegDimensions) -> bool:
         """
         Check if target position is reachable.
 
+        Results are memoized on the target rounded to 0.1 mm, so repeated
+        foothold queries are answered without solving IK again.
+
         Args:
             target: Target foot position
             dimensions: Leg segment lengths
@@ -186,16 +496,30 @@ class IKSolver:
         Returns:
             True if reachable
         """
-        if self._use_python_fallback:
+        return self._is_reachable_cached(
+            round(target.x * 10.0), round(target.y * 10.0), round(target.z * 10.0),
+            dimensions
+        )
+
+    def _is_reachable_quantized(self, xq: int, yq: int, zq: int,
+                                dimensions: LegDimensions) -> bool:
+        """Reachability of a target given in tenths of a millimeter."""
+        target = Position3D(xq / 10.0, yq / 10.0, zq / 10.0)
+
+        if self._use_python_fallback or self._use_cython:
             try:
-                self._solve_ik_python(target, dimensions)
+                self.solve_ik(target, dimensions)
                 return True
             except RuntimeError:
                 return False
 
+        c_target = self._c_target
+        c_target.x = target.x
+        c_target.y = target.y
+        c_target.z = target.z
         return self._lib.is_reachable(
-            target.to_c_struct(),
-            dimensions.to_c_struct()
+            ctypes.byref(c_target),
+            ctypes.byref(self._load_dims(dimensions))
         )
 
     def max_reach_at_height(self, z_height: float, dimensions: LegDimensions) -> float:
@@ -209,86 +533,198 @@ class IKSolver:
         Returns:
             Maximum horizontal reach (mm)
         """
-        if self._use_python_fallback:
-            import math
-            max_leg_length = dimensions.femur_length + dimensions.tibia_length
+        if self._use_python_fallback or self._use_cython:
+            max_leg_length = dimensions.max_reach
             horizontal_reach = math.sqrt(max_leg_length ** 2 - z_height ** 2)
             return horizontal_reach + dimensions.coxa_length
 
-        return self._lib.max_reach_at_height(z_height, dimensions.to_c_struct())
+        return self._lib.max_reach_at_height(
+            z_height,
+            ctypes.byref(self._load_dims(dimensions))
+        )
 
     # Python fallback implementation
     def _solve_ik_python(self, target: Position3D, dimensions: LegDimensions) -> JointAngles:
         """Pure Python IK solver (fallback)."""
-        import math
-
-        # Step 1: Coxa angle
-        coxa_angle_rad = math.atan2(target.y, target.x)
-        xy_distance = math.sqrt(target.x ** 2 + target.y ** 2)
-        femur_base_distance = xy_distance - dimensions.coxa_length
-
-        # Step 2: Femur and tibia angles
-        horizontal_reach = femur_base_distance
-        vertical_reach = target.z
-        reach_distance = math.sqrt(horizontal_reach ** 2 + vertical_reach ** 2)
-
-        max_reach = dimensions.femur_length + dimensions.tibia_length
-        min_reach = abs(dimensions.femur_length - dimensions.tibia_length)
+        coxa, femur, tibia, status = _ik_kernel(
+            target.x, target.y, target.z,
+            dimensions.coxa_length, dimensions.sq_sum, dimensions.sq_diff,
+            dimensions.inv_2l2l3, dimensions.inv_2l2,
+            dimensions.max_reach, dimensions.min_reach
+        )
 
-        if reach_distance > max_reach:
+        if status == _IK_TOO_FAR:
             raise RuntimeError("Target position too far")
-        if reach_distance < min_reach:
+        if status == _IK_TOO_CLOSE:
             raise RuntimeError("Target position too close")
 
-        # Law of cosines for tibia
-        cos_tibia = ((dimensions.femur_length ** 2 + dimensions.tibia_length ** 2 -
-                      reach_distance ** 2) /
-                     (2.0 * dimensions.femur_length * dimensions.tibia_length))
-        cos_tibia = max(-1.0, min(1.0, cos_tibia))
-        tibia_angle_rad = math.acos(cos_tibia)
-
-        # Femur angle
-        reach_angle = math.atan2(vertical_reach, horizontal_reach)
-        cos_femur_offset = ((dimensions.femur_length ** 2 + reach_distance ** 2 -
-                            dimensions.tibia_length ** 2) /
-                           (2.0 * dimensions.femur_length * reach_distance))
-        cos_femur_offset = max(-1.0, min(1.0, cos_femur_offset))
-        femur_offset_angle = math.acos(cos_femur_offset)
-        femur_angle_rad = reach_angle + femur_offset_angle
-
-        # Convert to degrees and adjust for servo range
-        coxa = math.degrees(coxa_angle_rad) + 90.0
-        femur = math.degrees(femur_angle_rad) + 90.0
-        tibia = 180.0 - math.degrees(tibia_angle_rad)
-
-        return JointAngles(
-            coxa=max(0.0, min(180.0, coxa)),
-            femur=max(0.0, min(180.0, femur)),
-            tibia=max(0.0, min(180.0, tibia))
-        )
+        return JointAngles(coxa=coxa, femur=femur, tibia=tibia)
 
     def _solve_fk_python(self, angles: JointAngles, dimensions: LegDimensions) -> Position3D:
         """Pure Python FK solver (fallback)."""
-        import math
-
-        coxa_rad = math.radians(angles.coxa - 90.0)
-        femur_rad = math.radians(angles.femur - 90.0)
-        tibia_interior_rad = math.radians(180.0 - angles.tibia)
-
-        coxa_x = dimensions.coxa_length * math.cos(coxa_rad)
-        coxa_y = dimensions.coxa_length * math.sin(coxa_rad)
+        x, y, z = _fk_kernel(
+            angles.coxa, angles.femur, angles.tibia,
+            dimensions.coxa_length, dimensions.femur_length, dimensions.tibia_length
+        )
+        return Position3D(x, y, z)
 
-        femur_horizontal = dimensions.femur_length * math.cos(femur_rad)
-        femur_vertical = dimensions.femur_length * math.sin(femur_rad)
 
-        tibia_abs_angle = femur_rad + tibia_interior_rad - math.pi
-        tibia_horizontal = dimensions.tibia_length * math.cos(tibia_abs_angle)
-        tibia_vertical = dimensions.tibia_length * math.sin(tibia_abs_angle)
+# Source for IKSolver.specialize; same math as _ik_kernel with the
+# LegDimensions terms substituted as literals ({name!r} keeps full precision)
+_IK_SPECIALIZED_TEMPLATE = """
+def ik(x, y, z):
+    coxa_angle_rad = atan2(y, x)
+    horizontal_reach = sqrt(x * x + y * y) - {coxa_length!r}
+    reach_sq = horizontal_reach * horizontal_reach + z * z
+    reach_distance = sqrt(reach_sq)
+
+    if reach_distance > {max_reach!r}:
+        raise RuntimeError("Target position too far")
+    if reach_distance < {min_reach!r}:
+        raise RuntimeError("Target position too close")
+
+    cos_tibia = ({sq_sum!r} - reach_sq) * {inv_2l2l3!r}
+    tibia_angle_rad = acos(-1.0 if cos_tibia < -1.0 else 1.0 if cos_tibia > 1.0 else cos_tibia)
+
+    cos_femur_offset = ({sq_diff!r} + reach_sq) * {inv_2l2!r} / reach_distance
+    femur_angle_rad = atan2(z, horizontal_reach) + acos(
+        -1.0 if cos_femur_offset < -1.0 else 1.0 if cos_femur_offset > 1.0 else cos_femur_offset
+    )
+
+    coxa = degrees(coxa_angle_rad) + 90.0
+    femur = degrees(femur_angle_rad) + 90.0
+    tibia = 180.0 - degrees(tibia_angle_rad)
+
+    return (
+        0.0 if coxa < 0.0 else 180.0 if coxa > 180.0 else coxa,
+        0.0 if femur < 0.0 else 180.0 if femur > 180.0 else femur,
+        0.0 if tibia < 0.0 else 180.0 if tibia > 180.0 else tibia,
+    )
+"""
+
+
+# Kernel status codes for unreachable targets
+_IK_OK = 0
+_IK_TOO_FAR = 1
+_IK_TOO_CLOSE = 2
+
+
+def _ik_kernel(
+    x: float,
+    y: float,
+    z: float,
+    coxa_length: float,
+    sq_sum: float,
+    sq_diff: float,
+    inv_2l2l3: float,
+    inv_2l2: float,
+    max_reach: float,
+    min_reach: float
+) -> Tuple[float, float, float, int]:
+    """
+    IK on plain floats; returns (coxa, femur, tibia, status) in degrees.
 
-        total_horizontal = femur_horizontal + tibia_horizontal
+    Takes the precomputed LegDimensions terms rather than raw femur/tibia
+    lengths, so each call does no squaring of constants and no divisions
+    by them.
+    """
+    # Step 1: Coxa angle
+    coxa_angle_rad = math.atan2(y, x)
+    xy_distance = math.sqrt(x ** 2 + y ** 2)
+    femur_base_distance = xy_distance - coxa_length
+
+    # Step 2: Femur and tibia angles
+    horizontal_reach = femur_base_distance
+    vertical_reach = z
+    reach_sq = horizontal_reach * horizontal_reach + vertical_reach * vertical_reach
+    reach_distance = math.sqrt(reach_sq)
+
+    if reach_distance > max_reach:
+        return 0.0, 0.0, 0.0, _IK_TOO_FAR
+    if reach_distance < min_reach:
+        return 0.0, 0.0, 0.0, _IK_TOO_CLOSE
+
+    # Law of cosines for tibia
+    cos_tibia = (sq_sum - reach_sq) * inv_2l2l3
+    cos_tibia = max(-1.0, min(1.0, cos_tibia))
+    tibia_angle_rad = math.acos(cos_tibia)
+
+    # Femur angle
+    reach_angle = math.atan2(vertical_reach, horizontal_reach)
+    cos_femur_offset = (sq_diff + reach_sq) * inv_2l2 / reach_distance
+    cos_femur_offset = max(-1.0, min(1.0, cos_femur_offset))
+    femur_offset_angle = math.acos(cos_femur_offset)
+    femur_angle_rad = reach_angle + femur_offset_angle
+
+    # Convert to degrees and adjust for servo range
+    coxa = math.degrees(coxa_angle_rad) + 90.0
+    femur = math.degrees(femur_angle_rad) + 90.0
+    tibia = 180.0 - math.degrees(tibia_angle_rad)
+
+    return (
+        max(0.0, min(180.0, coxa)),
+        max(0.0, min(180.0, femur)),
+        max(0.0, min(180.0, tibia)),
+        _IK_OK
+    )
+
+
+def _fk_kernel(
+    coxa: float,
+    femur: float,
+    tibia: float,
+    coxa_length: float,
+    femur_length: float,
+    tibia_length: float
+) -> Tuple[float, float, float]:
+    """FK on plain floats; returns foot (x, y, z) in mm."""
+    coxa_rad = math.radians(coxa - 90.0)
+    femur_rad = math.radians(femur - 90.0)
+    tibia_abs_angle = femur_rad + math.radians(180.0 - tibia) - math.pi
+
+    # Each angle's sin/cos pair is evaluated exactly once
+    c1, s1 = math.cos(coxa_rad), math.sin(coxa_rad)
+    c2, s2 = math.cos(femur_rad), math.sin(femur_rad)
+    c3, s3 = math.cos(tibia_abs_angle), math.sin(tibia_abs_angle)
+
+    # Coxa, femur and tibia horizontal spans all lie along the coxa direction
+    radial = coxa_length + femur_length * c2 + tibia_length * c3
+
+    x = radial * c1
+    y = radial * s1
+    z = femur_length * s2 + tibia_length * s3
+
+    return x, y, z
+
+
+def _ik_batch_kernel(
+    targets: np.ndarray,
+    coxa_length: float,
+    sq_sum: float,
+    sq_diff: float,
+    inv_2l2l3: float,
+    inv_2l2: float,
+    max_reach: float,
+    min_reach: float,
+    out: np.ndarray
+):
+    """Fill out[N, 3] with IK angles for targets[N, 3]; NaN rows if unreachable."""
+    for i in range(targets.shape[0]):
+        coxa, femur, tibia, status = _ik_kernel(
+            targets[i, 0], targets[i, 1], targets[i, 2],
+            coxa_length, sq_sum, sq_diff, inv_2l2l3, inv_2l2, max_reach, min_reach
+        )
+        if status == _IK_OK:
+            out[i, 0] = coxa
+            out[i, 1] = femur
+            out[i, 2] = tibia
+        else:
+            out[i, 0] = np.nan
+            out[i, 1] = np.nan
+            out[i, 2] = np.nan
 
-        x = coxa_x + total_horizontal * math.cos(coxa_rad)
-        y = coxa_y + total_horizontal * math.sin(coxa_rad)
-        z = femur_vertical + tibia_vertical
 
-        return Position3D(x, y, z)
+if NUMBA_AVAILABLE:
+    _ik_kernel = njit(cache=True, fastmath=True)(_ik_kernel)
+    _fk_kernel = njit(cache=True, fastmath=True)(_fk_kernel)
+    _ik_batch_kernel = njit(cache=True)(_ik_batch_kernel)
@@ -5,6 +5,8 @@
  * Compiled as shared library for Python integration
  */
 
+#include "ik_solver.h"
+
 #include <cmath>
 #include <algorithm>
 #include <stdexcept>
@@ -14,27 +16,6 @@
 #define M_PI 3.14159265358979323846
 #endif
 
-// Struct for 3D position
-struct Position3D {
-    double x;
-    double y;
-    double z;
-};
-
-// Struct for joint angles (in radians)
-struct JointAngles {
-    double coxa;   // Hip rotation
-    double femur;  // Upper leg angle
-    double tibia;  // Lower leg angle
-};
-
-// Struct for leg dimensions
-struct LegDimensions {
-    double coxa_length;   // Length of coxa (hip segment)
-    double femur_length;  // Length of femur (upper leg)
-    double tibia_length;  // Length of tibia (lower leg)
-};
-
 /**
  * Convert degrees to radians
  */
@@ -57,16 +38,15 @@ inline double clamp_angle(double angle_deg, double min_deg = 0.0, double max_deg
 }
 
 /**
- * Solve inverse kinematics for a single leg
+ * Core IK solution shared by solve_ik and solve_ik_array
  *
  * @param target Target foot position in leg coordinate system
  * @param dimensions Leg segment lengths
- * @return Joint angles (in degrees)
- * @throws std::runtime_error if target is unreachable
+ * @param angles Output joint angles (in degrees)
+ * @return 0 on success, -1 if too far, -2 if too close
  */
-extern "C" JointAngles solve_ik(const Position3D& target, const LegDimensions& dimensions) {
-    JointAngles angles;
-
+static int solve_ik_impl(const Position3D& target, const LegDimensions& dimensions,
+                         JointAngles& angles) {
     // Step 1: Calculate coxa angle (rotation in XY plane)
     // Coxa rotates the leg horizontally
     double coxa_angle_rad = atan2(target.y, target.x);
@@ -91,11 +71,11 @@ extern "C" JointAngles solve_ik(const Position3D& target, const LegDimensions& d
     double min_reach = fabs(dimensions.femur_length - dimensions.tibia_length);
 
     if (reach_distance > max_reach) {
-        throw std::runtime_error("Target position is too far (unreachable)");
+        return -1;
     }
 
     if (reach_distance < min_reach) {
-        throw std::runtime_error("Target position is too close (unreachable)");
+        return -2;
     }
 
     // Use law of cosines to find tibia angle
@@ -137,9 +117,65 @@ extern "C" JointAngles solve_ik(const Position3D& target, const LegDimensions& d
     angles.femur = clamp_angle(angles.femur + 90.0);
     angles.tibia = clamp_angle(angles.tibia);
 
+    return 0;
+}
+
+/**
+ * Solve inverse kinematics for a single leg
+ *
+ * @param target Target foot position in leg coordinate system
+ * @param dimensions Leg segment lengths
+ * @return Joint angles (in degrees)
+ * @throws std::runtime_error if target is unreachable
+ */
+extern "C" JointAngles solve_ik(const Position3D& target, const LegDimensions& dimensions) {
+    JointAngles angles;
+    int result = solve_ik_impl(target, dimensions, angles);
+
+    if (result == -1) {
+        throw std::runtime_error("Target position is too far (unreachable)");
+    }
+
+    if (result == -2) {
+        throw std::runtime_error("Target position is too close (unreachable)");
+    }
+
     return angles;
 }
 
+/**
+ * Solve inverse kinematics for several legs in one call
+ *
+ * Never throws, so it is safe to call through a C FFI. Unreachable
+ * targets produce a row of NaN.
+ *
+ * @param targets Row-major array of n (x, y, z) positions
+ * @param n Number of targets
+ * @param dimensions Leg segment lengths
+ * @param out Row-major array of n (coxa, femur, tibia) angles (in degrees)
+ * @return Number of unreachable targets
+ */
+extern "C" int solve_ik_array(const double* targets, int n,
+                              const LegDimensions* dimensions, double* out) {
+    int unreachable = 0;
+
+    for (int i = 0; i < n; i++) {
+        Position3D target = {targets[3 * i], targets[3 * i + 1], targets[3 * i + 2]};
+        JointAngles angles;
+
+        if (solve_ik_impl(target, *dimensions, angles) == 0) {
+            out[3 * i] = angles.coxa;
+            out[3 * i + 1] = angles.femur;
+            out[3 * i + 2] = angles.tibia;
+        } else {
+            out[3 * i] = out[3 * i + 1] = out[3 * i + 2] = NAN;
+            unreachable++;
+        }
+    }
+
+    return unreachable;
+}
+
 /**
  * Forward kinematics - calculate foot position from joint angles
  * Useful for validation and testing
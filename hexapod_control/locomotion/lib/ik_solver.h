@@ -0,0 +1,38 @@
+/**
+ * Inverse Kinematics Solver for Hexapod Legs - public interface
+ *
+ * Shared by ik_solver.cpp and the Cython bindings (ik_solver_cy.pyx)
+ */
+
+#ifndef HEXAPOD_IK_SOLVER_H
+#define HEXAPOD_IK_SOLVER_H
+
+// Struct for 3D position
+struct Position3D {
+    double x;
+    double y;
+    double z;
+};
+
+// Struct for joint angles (in radians)
+struct JointAngles {
+    double coxa;   // Hip rotation
+    double femur;  // Upper leg angle
+    double tibia;  // Lower leg angle
+};
+
+// Struct for leg dimensions
+struct LegDimensions {
+    double coxa_length;   // Length of coxa (hip segment)
+    double femur_length;  // Length of femur (upper leg)
+    double tibia_length;  // Length of tibia (lower leg)
+};
+
+extern "C" JointAngles solve_ik(const Position3D& target, const LegDimensions& dimensions);
+extern "C" int solve_ik_array(const double* targets, int n,
+                              const LegDimensions* dimensions, double* out);
+extern "C" Position3D solve_fk(const JointAngles& angles, const LegDimensions& dimensions);
+extern "C" bool is_reachable(const Position3D& target, const LegDimensions& dimensions);
+extern "C" double max_reach_at_height(double z_height, const LegDimensions& dimensions);
+
+#endif  // HEXAPOD_IK_SOLVER_H
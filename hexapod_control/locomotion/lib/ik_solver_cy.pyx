@@ -0,0 +1,111 @@
+# distutils: language = c++
+# distutils: sources = ik_solver.cpp
+# cython: language_level=3
+"""
+Cython bindings for the C++ inverse kinematics solver.
+
+Calls the solver directly instead of through ctypes, avoiding per-call
+argument marshalling. Build with 'make cython' in locomotion/lib/.
+"""
+
+cimport cython
+
+
+cdef extern from "ik_solver.h":
+    cdef struct Position3D:
+        double x
+        double y
+        double z
+
+    cdef struct JointAngles:
+        double coxa
+        double femur
+        double tibia
+
+    cdef struct LegDimensions:
+        double coxa_length
+        double femur_length
+        double tibia_length
+
+    JointAngles solve_ik(const Position3D& target, const LegDimensions& dimensions) except +
+    int solve_ik_array(const double* targets, int n,
+                       const LegDimensions* dimensions, double* out) nogil
+    Position3D solve_fk(const JointAngles& angles, const LegDimensions& dimensions)
+
+
+cpdef tuple solve_ik_cy(double x, double y, double z,
+                        double coxa_length, double femur_length, double tibia_length):
+    """
+    Solve IK for one leg.
+
+    Returns:
+        (coxa, femur, tibia) in degrees
+
+    Raises:
+        RuntimeError: If target position is unreachable
+    """
+    cdef Position3D target
+    cdef LegDimensions dims
+    cdef JointAngles angles
+
+    target.x = x
+    target.y = y
+    target.z = z
+    dims.coxa_length = coxa_length
+    dims.femur_length = femur_length
+    dims.tibia_length = tibia_length
+
+    angles = solve_ik(target, dims)
+    return (angles.coxa, angles.femur, angles.tibia)
+
+
+cpdef tuple solve_fk_cy(double coxa, double femur, double tibia,
+                        double coxa_length, double femur_length, double tibia_length):
+    """
+    Solve FK for one leg.
+
+    Returns:
+        Foot (x, y, z) in mm
+    """
+    cdef JointAngles angles
+    cdef LegDimensions dims
+    cdef Position3D position
+
+    angles.coxa = coxa
+    angles.femur = femur
+    angles.tibia = tibia
+    dims.coxa_length = coxa_length
+    dims.femur_length = femur_length
+    dims.tibia_length = tibia_length
+
+    position = solve_fk(angles, dims)
+    return (position.x, position.y, position.z)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef int solve_ik_batch_cy(double[:, ::1] targets, double[:, ::1] out,
+                            double coxa_length, double femur_length, double tibia_length):
+    """
+    Solve IK for N legs, writing (coxa, femur, tibia) rows into out.
+
+    Unreachable targets produce NaN rows.
+
+    Returns:
+        Number of unreachable targets
+    """
+    cdef LegDimensions dims
+    cdef int n = targets.shape[0]
+    cdef int unreachable
+
+    if n == 0:
+        return 0
+
+    dims.coxa_length = coxa_length
+    dims.femur_length = femur_length
+    dims.tibia_length = tibia_length
+
+    with nogil:
+        unreachable = solve_ik_array(&targets[0, 0], n, &dims, &out[0, 0])
+
+    return unreachable
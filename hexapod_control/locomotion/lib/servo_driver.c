@@ -14,6 +14,8 @@
 #include <unistd.h>
 #include <math.h>
 
+#include "servo_driver.h"
+
 // PCA9685 Register Definitions
 #define PCA9685_MODE1 0x00
 #define PCA9685_MODE2 0x01
@@ -39,8 +41,13 @@
 #define SERVO_ANGLE_MIN 0.0
 #define SERVO_ANGLE_MAX 180.0
 
+// Channel writes sent as one I2C transaction (one message per channel)
+#define SERVO_MAX_BATCH 16
+#define CHANNEL_WRITE_LEN 5  // start register + ON_L, ON_H, OFF_L, OFF_H
+
 // Global I2C handle
 static int i2c_handle = -1;
+static uint8_t i2c_address = 0;
 
 /**
  * Initialize PCA9685 PWM driver
@@ -67,6 +74,7 @@ int servo_driver_init(int i2c_bus, uint8_t i2c_addr, uint16_t pwm_freq) {
            i2c_bus, i2c_addr, pwm_freq);
 
     i2c_handle = 1;  // Fake handle for development
+    i2c_address = i2c_addr;
 
     // Calculate prescaler value for desired PWM frequency
     // prescale_value = round(CLOCK_FREQ / (PWM_RESOLUTION * frequency)) - 1
@@ -134,6 +142,24 @@ uint16_t pulse_to_register(uint16_t pulse_us, uint16_t pwm_freq) {
     return register_value;
 }
 
+/**
+ * Encode one channel's LED register block for an auto-increment write
+ *
+ * MODE1_AI is set at init, so the four LEDn registers after the start
+ * register are written in a single message.
+ *
+ * @param buf Output buffer of CHANNEL_WRITE_LEN bytes
+ * @param channel PCA9685 channel (0-15)
+ * @param pwm_value 12-bit OFF time
+ */
+static void encode_channel_write(uint8_t* buf, uint8_t channel, uint16_t pwm_value) {
+    buf[0] = PCA9685_LED0_ON_L + (4 * channel);
+    buf[1] = 0x00;                        // ON_L
+    buf[2] = 0x00;                        // ON_H
+    buf[3] = pwm_value & 0xFF;            // OFF_L
+    buf[4] = (pwm_value >> 8) & 0x0F;     // OFF_H
+}
+
 /**
  * Set servo angle
  *
@@ -165,20 +191,14 @@ int servo_set_angle(uint8_t channel, double angle_deg,
     printf("[STUB] servo_set_angle: channel=%d, angle=%.2f°, pulse=%dus, pwm_value=%d\n",
            channel, angle_deg, pulse_us, pwm_value);
 
+    uint8_t buf[CHANNEL_WRITE_LEN];
+    encode_channel_write(buf, channel, pwm_value);
+
     // TODO: Write to PCA9685 registers when using real hardware
-    // Calculate register addresses for this channel
-    // uint8_t reg_on_l = PCA9685_LED0_ON_L + (4 * channel);
-    // uint8_t reg_on_h = PCA9685_LED0_ON_H + (4 * channel);
-    // uint8_t reg_off_l = PCA9685_LED0_OFF_L + (4 * channel);
-    // uint8_t reg_off_h = PCA9685_LED0_OFF_H + (4 * channel);
-    //
-    // // Set ON time to 0
-    // i2cWriteByteData(i2c_handle, reg_on_l, 0x00);
-    // i2cWriteByteData(i2c_handle, reg_on_h, 0x00);
-    //
-    // // Set OFF time to calculated PWM value
-    // i2cWriteByteData(i2c_handle, reg_off_l, pwm_value & 0xFF);
-    // i2cWriteByteData(i2c_handle, reg_off_h, (pwm_value >> 8) & 0x0F);
+    // ON time 0, OFF time pwm_value, in one auto-increment write
+    // if (i2cWriteDevice(i2c_handle, (char*)buf, CHANNEL_WRITE_LEN) != 0) {
+    //     return -1;
+    // }
 
     return 0;
 }
@@ -186,6 +206,11 @@ int servo_set_angle(uint8_t channel, double angle_deg,
 /**
  * Set multiple servos simultaneously
  *
+ * Register writes are coalesced: each batch of up to SERVO_MAX_BATCH
+ * channels goes out as one combined I2C transaction (a single I2C_RDWR
+ * ioctl) rather than one transfer per register. A batch is validated in
+ * full before it is sent.
+ *
  * @param channels Array of channel numbers
  * @param angles Array of angles (degrees)
  * @param count Number of servos to set
@@ -196,10 +221,94 @@ int servo_set_angle(uint8_t channel, double angle_deg,
  */
 int servo_set_multiple(const uint8_t* channels, const double* angles, int count,
                        uint16_t min_pulse, uint16_t max_pulse, uint16_t pwm_freq) {
+    if (i2c_handle < 0) {
+        fprintf(stderr, "Servo driver not initialized\n");
+        return -1;
+    }
+
+    uint8_t bufs[SERVO_MAX_BATCH][CHANNEL_WRITE_LEN];
+    // pi_i2c_msg_t segs[SERVO_MAX_BATCH];
+
+    for (int start = 0; start < count; start += SERVO_MAX_BATCH) {
+        int n = count - start;
+        if (n > SERVO_MAX_BATCH) n = SERVO_MAX_BATCH;
+
+        for (int k = 0; k < n; k++) {
+            uint8_t channel = channels[start + k];
+            if (channel > 15) {
+                fprintf(stderr, "Invalid channel: %d (must be 0-15)\n", channel);
+                return -1;
+            }
+
+            double angle_deg = angles[start + k];
+            uint16_t pulse_us = angle_to_pulse(angle_deg, min_pulse, max_pulse);
+            uint16_t pwm_value = pulse_to_register(pulse_us, pwm_freq);
+            encode_channel_write(bufs[k], channel, pwm_value);
+
+            printf("[STUB] servo_set_multiple: channel=%d, angle=%.2f°, pulse=%dus, pwm_value=%d\n",
+                   channel, angle_deg, pulse_us, pwm_value);
+
+            // segs[k].addr = i2c_address;
+            // segs[k].flags = 0;
+            // segs[k].len = CHANNEL_WRITE_LEN;
+            // segs[k].buf = (char*)bufs[k];
+        }
+
+        // TODO: Send the batch as one transaction when using real hardware
+        // if (i2cSegments(i2c_handle, segs, n) != n) {
+        //     fprintf(stderr, "I2C batch write failed\n");
+        //     return -1;
+        // }
+        printf("[STUB] servo_set_multiple: %d channel writes in one I2C transaction (addr=0x%02X)\n",
+               n, i2c_address);
+    }
+    return 0;
+}
+
+/**
+ * Apply per-servo calibration and set multiple servos simultaneously
+ *
+ * Each angle is adjusted as clamp(sign * angle + bias, min_angle, max_angle)
+ * using the calibration tables indexed by flat servo index, then written.
+ *
+ * @param servo_idx Array of flat servo indices (leg * 3 + joint)
+ * @param angles In: requested angles (degrees); out: adjusted angles
+ * @param count Number of servos to set
+ * @param channel_map PCA9685 channel per flat servo index
+ * @param signs Per-servo sign (-1.0 if inverted, else 1.0)
+ * @param biases Per-servo bias (offset, or 180 - offset if inverted)
+ * @param min_angles Per-servo lower angle limit
+ * @param max_angles Per-servo upper angle limit
+ * @param min_pulse Minimum pulse width
+ * @param max_pulse Maximum pulse width
+ * @param pwm_freq PWM frequency
+ * @return 0 on success, -1 on failure
+ */
+int servo_set_multiple_raw(const uint8_t* servo_idx, double* angles, int count,
+                           const uint16_t* channel_map, const double* signs,
+                           const double* biases, const double* min_angles,
+                           const double* max_angles, uint16_t min_pulse,
+                           uint16_t max_pulse, uint16_t pwm_freq) {
+    // Adjust every angle first so the caller always gets them all back
     for (int i = 0; i < count; i++) {
-        int result = servo_set_angle(channels[i], angles[i],
-                                     min_pulse, max_pulse, pwm_freq);
-        if (result != 0) {
+        uint8_t s = servo_idx[i];
+        double adjusted = signs[s] * angles[i] + biases[s];
+        if (adjusted > max_angles[s]) adjusted = max_angles[s];
+        if (adjusted < min_angles[s]) adjusted = min_angles[s];
+        angles[i] = adjusted;
+    }
+
+    // Resolve channels per batch and hand off to the coalescing writer
+    uint8_t batch_channels[SERVO_MAX_BATCH];
+    for (int start = 0; start < count; start += SERVO_MAX_BATCH) {
+        int n = count - start;
+        if (n > SERVO_MAX_BATCH) n = SERVO_MAX_BATCH;
+
+        for (int k = 0; k < n; k++) {
+            batch_channels[k] = (uint8_t)channel_map[servo_idx[start + k]];
+        }
+        if (servo_set_multiple(batch_channels, angles + start, n,
+                               min_pulse, max_pulse, pwm_freq) != 0) {
             return -1;
         }
     }
@@ -0,0 +1,46 @@
+/**
+ * Servo Driver for Hexapod using PCA9685 PWM Driver - public interface
+ *
+ * Shared by servo_driver.c and the Cython bindings (servo_driver_cy.pyx)
+ */
+
+#ifndef HEXAPOD_SERVO_DRIVER_H
+#define HEXAPOD_SERVO_DRIVER_H
+
+#include <stdint.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+int servo_driver_init(int i2c_bus, uint8_t i2c_addr, uint16_t pwm_freq);
+
+uint16_t angle_to_pulse(double angle_deg, uint16_t min_pulse, uint16_t max_pulse);
+
+uint16_t pulse_to_register(uint16_t pulse_us, uint16_t pwm_freq);
+
+int servo_set_angle(uint8_t channel, double angle_deg,
+                    uint16_t min_pulse, uint16_t max_pulse, uint16_t pwm_freq);
+
+int servo_set_multiple(const uint8_t* channels, const double* angles, int count,
+                       uint16_t min_pulse, uint16_t max_pulse, uint16_t pwm_freq);
+
+int servo_set_multiple_raw(const uint8_t* servo_idx, double* angles, int count,
+                           const uint16_t* channel_map, const double* signs,
+                           const double* biases, const double* min_angles,
+                           const double* max_angles, uint16_t min_pulse,
+                           uint16_t max_pulse, uint16_t pwm_freq);
+
+int servo_off(uint8_t channel);
+
+int servo_off_all(void);
+
+void servo_driver_close(void);
+
+int servo_driver_is_initialized(void);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif  // HEXAPOD_SERVO_DRIVER_H
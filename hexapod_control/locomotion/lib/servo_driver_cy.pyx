@@ -0,0 +1,97 @@
+# distutils: sources = servo_driver.c
+# distutils: libraries = m
+# cython: language_level=3
+"""
+Cython bindings for the PCA9685 servo driver.
+
+Exposes the same function names as libservo_driver, so ServoController can
+use this module in place of the ctypes library. Buffer arguments accept any
+contiguous buffer of the matching type, including ctypes arrays.
+Build with 'make cython' in locomotion/lib/.
+"""
+
+from libc.stdint cimport uint8_t, uint16_t
+
+
+cdef extern from "servo_driver.h":
+    int c_servo_driver_init "servo_driver_init"(int i2c_bus, uint8_t i2c_addr, uint16_t pwm_freq)
+    int c_servo_set_angle "servo_set_angle"(uint8_t channel, double angle_deg,
+                                            uint16_t min_pulse, uint16_t max_pulse,
+                                            uint16_t pwm_freq)
+    int c_servo_set_multiple "servo_set_multiple"(const uint8_t* channels, const double* angles,
+                                                  int count, uint16_t min_pulse,
+                                                  uint16_t max_pulse, uint16_t pwm_freq)
+    int c_servo_set_multiple_raw "servo_set_multiple_raw"(const uint8_t* servo_idx, double* angles,
+                                                          int count, const uint16_t* channel_map,
+                                                          const double* signs, const double* biases,
+                                                          const double* min_angles,
+                                                          const double* max_angles,
+                                                          uint16_t min_pulse, uint16_t max_pulse,
+                                                          uint16_t pwm_freq)
+    int c_servo_off "servo_off"(uint8_t channel)
+    int c_servo_off_all "servo_off_all"()
+    void c_servo_driver_close "servo_driver_close"()
+    int c_servo_driver_is_initialized "servo_driver_is_initialized"()
+
+
+cpdef int servo_driver_init(int i2c_bus, uint8_t i2c_addr, uint16_t pwm_freq):
+    """Initialize the PCA9685 driver; 0 on success."""
+    return c_servo_driver_init(i2c_bus, i2c_addr, pwm_freq)
+
+
+cpdef int servo_set_angle(uint8_t channel, double angle_deg,
+                          uint16_t min_pulse, uint16_t max_pulse, uint16_t pwm_freq):
+    """Set one servo angle; 0 on success."""
+    return c_servo_set_angle(channel, angle_deg, min_pulse, max_pulse, pwm_freq)
+
+
+cpdef int servo_set_multiple(const uint8_t[::1] channels, const double[::1] angles, int count,
+                             uint16_t min_pulse, uint16_t max_pulse, uint16_t pwm_freq):
+    """Set count servos from parallel channel/angle buffers; 0 on success."""
+    if count <= 0:
+        return 0
+    if count > channels.shape[0] or count > angles.shape[0]:
+        raise ValueError("count exceeds buffer length")
+    return c_servo_set_multiple(&channels[0], &angles[0], count,
+                                min_pulse, max_pulse, pwm_freq)
+
+
+cpdef int servo_set_multiple_raw(const uint8_t[::1] servo_idx, double[::1] angles, int count,
+                                 const uint16_t[::1] channel_map, const double[::1] signs,
+                                 const double[::1] biases, const double[::1] min_angles,
+                                 const double[::1] max_angles, uint16_t min_pulse,
+                                 uint16_t max_pulse, uint16_t pwm_freq):
+    """
+    Calibrate and set count servos; angles are replaced with adjusted values.
+
+    Returns:
+        0 on success, -1 on failure
+    """
+    if count <= 0:
+        return 0
+    if count > servo_idx.shape[0] or count > angles.shape[0]:
+        raise ValueError("count exceeds buffer length")
+    return c_servo_set_multiple_raw(&servo_idx[0], &angles[0], count,
+                                    &channel_map[0], &signs[0], &biases[0],
+                                    &min_angles[0], &max_angles[0],
+                                    min_pulse, max_pulse, pwm_freq)
+
+
+cpdef int servo_off(uint8_t channel):
+    """Turn off PWM on one channel; 0 on success."""
+    return c_servo_off(channel)
+
+
+cpdef int servo_off_all():
+    """Turn off PWM on all channels; 0 on success."""
+    return c_servo_off_all()
+
+
+cpdef void servo_driver_close():
+    """Release the I2C handle."""
+    c_servo_driver_close()
+
+
+cpdef int servo_driver_is_initialized():
+    """1 if the driver is initialized, 0 otherwise."""
+    return c_servo_driver_is_initialized()
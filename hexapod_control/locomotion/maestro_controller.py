@@ -4,25 +4,46 @@ Pololu Maestro servo controller for hexapod legs.
 Supports Pololu Mini Maestro 18-Channel USB Servo Controller via serial interface.
 """
 
+import os
 import serial
+import struct
 import time
+import weakref
+from functools import partial
+from itertools import chain
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+import numpy as np
 from loguru import logger
 
+try:
+    import termios
+    TERMIOS_AVAILABLE = True
+except ImportError:
+    TERMIOS_AVAILABLE = False
+
+from locomotion.ik_solver_wrapper import IKSolver, LegDimensions
 from utils.config_loader import get_config_loader
 
+# Joint name -> column of the (6, 3) per-servo state arrays
+JOINT_IDX = {'coxa': 0, 'femur': 1, 'tibia': 2}
+_LEG_JOINTS = np.arange(3)
+
+# Compact Protocol Set Target: 0x84, channel, target_low, target_high
+_SET_TARGET = struct.Struct('<BBBB').pack
+
+
+def _close_serial(ser) -> None:
+    """Close a serial handle if still open (finalizer; no servo I/O)."""
+    if ser is not None and ser.is_open:
+        ser.close()
+
 
-@dataclass
-class ServoConfig:
-    """Configuration for a single servo."""
-    channel: int
-    min_pulse: int = 992   # Quarter-microseconds (248us)
-    max_pulse: int = 8000  # Quarter-microseconds (2000us)
-    min_angle: float = 0.0
-    max_angle: float = 180.0
-    offset: float = 0.0     # Calibration offset in degrees
-    inverted: bool = False
+def _close_fd(fd: int) -> None:
+    """Close a raw tty file descriptor (finalizer; no servo I/O)."""
+    try:
+        os.close(fd)
+    except OSError:
+        pass
 
 
 class MaestroController:
@@ -32,20 +53,30 @@ class MaestroController:
     Communicates with Maestro via USB serial using Pololu protocol.
     Manages 18 servos (6 legs × 3 joints each).
 
+    Use as a context manager or call close() explicitly to park and release
+    the servos; if neither happens, only the serial port is closed when the
+    controller is garbage collected or the interpreter exits.
+
     Protocol Reference: https://www.pololu.com/docs/0J40/5.e
     """
 
-    def __init__(self, config_loader=None, mock_mode: bool = False):
+    def __init__(self, config_loader=None, mock_mode: bool = False, use_raw_fd: bool = False):
         """
         Initialize Maestro controller.
 
         Args:
             config_loader: ConfigLoader instance (creates if None)
             mock_mode: If True, simulate hardware (for development)
+            use_raw_fd: If True, write to the tty with os.write on a
+                termios-configured file descriptor instead of PySerial
+                (POSIX only)
         """
         self._config_loader = config_loader or get_config_loader()
         self._mock_mode = mock_mode
+        self._use_raw_fd = use_raw_fd
         self._serial = None
+        self._write = None  # Bound serial write while the port is usable
+        self._finalizer = None
         self._initialized = False
 
         # Load hardware configuration
@@ -53,9 +84,20 @@ class MaestroController:
         self._servo_config = hw_config['servos']
         self._hexapod_config = hw_config['hexapod']
 
-        # Servo state tracking
-        self._current_angles: Dict[Tuple[int, str], float] = {}  # (leg_idx, joint) -> angle
-        self._servo_configs: Dict[Tuple[int, str], ServoConfig] = {}
+        # IK for drive_from_targets, created on first use
+        self._leg_dimensions = LegDimensions.from_config(self._hexapod_config['dimensions'])
+        self._ik_solver: Optional[IKSolver] = None
+
+        # Servo state as parallel (6, 3) arrays indexed [leg_idx, JOINT_IDX[joint]];
+        # channel -1 marks a servo missing from the configuration
+        self._channels = np.full((6, 3), -1, dtype=np.int8)
+        self._current_angles = np.full((6, 3), 90.0)
+        self._offsets = np.zeros((6, 3))
+        self._min_angles = np.zeros((6, 3))
+        self._max_angles = np.full((6, 3), 180.0)
+        self._inverted = np.zeros((6, 3), dtype=bool)
+        self._target_offsets = np.zeros((6, 3))
+        self._target_scales = np.zeros((6, 3))
 
         # Maestro settings
         driver_config = self._servo_config['driver']
@@ -77,30 +119,59 @@ class MaestroController:
         offsets = self._servo_config.get('offsets', {})
         specs = self._servo_config['specs']
 
+        # Pulse specs are shared by every servo: validate and derive the
+        # angle -> target map once, then broadcast into the state arrays
+        min_pulse = specs['min_pulse']
+        max_pulse = specs['max_pulse']
+        if not 0 <= min_pulse <= max_pulse <= 65535:
+            raise ValueError(f"Invalid servo pulse range: {min_pulse}-{max_pulse}")
+
+        self._target_offsets.fill(min_pulse)
+        self._target_scales.fill((max_pulse - min_pulse) / 180.0)
+        self._min_angles.fill(specs['min_angle'])
+        self._max_angles.fill(specs['max_angle'])
+        self._slew_rate = specs.get('slew_rate', 300.0)  # degrees/second
+
         for key, channel in channels.items():
             # Parse "leg_idx.joint" format
-            parts = key.split('.')
-            if len(parts) != 2:
+            leg, _, joint = key.partition('.')
+            joint_idx = JOINT_IDX.get(joint)
+            if joint_idx is None or not leg.isdigit() or int(leg) > 5:
                 logger.warning(f"Invalid servo config key: {key}")
                 continue
 
-            leg_idx = int(parts[0])
-            joint = parts[1]
-
-            # Get offset if exists
-            offset = offsets.get(key, 0.0)
+            leg_idx = int(leg)
+            self._channels[leg_idx, joint_idx] = channel
+            self._offsets[leg_idx, joint_idx] = offsets.get(key, 0.0)
+
+        # Neutral pose and all-off commands never change, so encode them once
+        self._configured = np.nonzero(self._channels >= 0)
+        channels = self._channels[self._configured].tolist()
+        self._neutral_angles, neutral_targets = self._angles_to_targets_vec(
+            *self._configured, np.full(len(channels), 90.0)
+        )
+        self._neutral_command = self._encode_multiple_targets(
+            list(zip(channels, neutral_targets.tolist()))
+        )
+        self._disable_command = self._encode_multiple_targets([(ch, 0) for ch in channels])
+
+    def _servo_index(self, leg_idx: int, joint: str) -> Optional[Tuple[int, int]]:
+        """
+        Resolve a (leg_idx, joint) pair to an index into the state arrays.
 
-            self._servo_configs[(leg_idx, joint)] = ServoConfig(
-                channel=channel,
-                min_pulse=specs['min_pulse'],
-                max_pulse=specs['max_pulse'],
-                min_angle=specs['min_angle'],
-                max_angle=specs['max_angle'],
-                offset=offset
-            )
+        Args:
+            leg_idx: Leg index (0-5)
+            joint: Joint name ('coxa', 'femur', 'tibia')
 
-            # Initialize angle tracking
-            self._current_angles[(leg_idx, joint)] = 90.0  # Neutral position
+        Returns:
+            (leg_idx, joint_idx), or None if the servo is not configured
+        """
+        joint_idx = JOINT_IDX.get(joint)
+        if joint_idx is None or not 0 <= leg_idx < 6:
+            return None
+        if self._channels[leg_idx, joint_idx] < 0:
+            return None
+        return leg_idx, joint_idx
 
     def initialize(self) -> bool:
         """
@@ -119,12 +190,19 @@ class MaestroController:
             return True
 
         try:
-            # Open serial connection
-            self._serial = serial.Serial(
-                port=self._serial_port,
-                baudrate=self._baud_rate,
-                timeout=1.0
-            )
+            if self._use_raw_fd:
+                fd = self._open_raw_fd()
+                self._finalizer = weakref.finalize(self, _close_fd, fd)
+                self._write = partial(os.write, fd)
+            else:
+                # Open serial connection
+                self._serial = serial.Serial(
+                    port=self._serial_port,
+                    baudrate=self._baud_rate,
+                    timeout=1.0
+                )
+                self._finalizer = weakref.finalize(self, _close_serial, self._serial)
+                self._write = self._serial.write
 
             logger.info(f"Maestro controller connected: {self._serial_port} @ {self._baud_rate} baud")
 
@@ -149,6 +227,43 @@ class MaestroController:
             logger.error(f"Exception during Maestro initialization: {e}")
             return False
 
+    def _open_raw_fd(self) -> int:
+        """
+        Open the Maestro tty write-only and configure it as raw 8N1.
+
+        The protocol is one-way at a fixed baud rate, so the tty is set up
+        once and every command is a plain os.write().
+
+        Returns:
+            Open file descriptor
+
+        Raises:
+            serial.SerialException: If the port cannot be opened or configured
+        """
+        if not TERMIOS_AVAILABLE:
+            raise serial.SerialException("Raw fd mode requires termios (POSIX)")
+
+        speed = getattr(termios, f"B{self._baud_rate}", None)
+        if speed is None:
+            raise serial.SerialException(f"Unsupported baud rate: {self._baud_rate}")
+
+        try:
+            fd = os.open(self._serial_port, os.O_WRONLY | os.O_NOCTTY)
+        except OSError as e:
+            raise serial.SerialException(str(e)) from e
+
+        try:
+            cc = termios.tcgetattr(fd)[6]
+            # iflag, oflag, cflag, lflag, ispeed, ospeed, cc: raw 8N1, no flow control
+            termios.tcsetattr(fd, termios.TCSANOW, [
+                0, 0, termios.CS8 | termios.CREAD | termios.CLOCAL, 0, speed, speed, cc
+            ])
+        except termios.error as e:
+            os.close(fd)
+            raise serial.SerialException(str(e)) from e
+
+        return fd
+
     def _send_command(self, command: bytes) -> bool:
         """
         Send command to Maestro.
@@ -162,14 +277,17 @@ class MaestroController:
         if self._mock_mode:
             return True
 
-        if not self._serial or not self._serial.is_open:
+        write = self._write
+        if write is None:
             logger.error("Serial port not open")
             return False
 
         try:
-            self._serial.write(command)
+            write(command)
             return True
         except Exception as e:
+            # Treat the connection as lost until the controller is reinitialized
+            self._write = None
             logger.error(f"Failed to send command: {e}")
             return False
 
@@ -200,35 +318,151 @@ class MaestroController:
         # target_low = low 7 bits of target
         # target_high = high 7 bits of target
 
-        command = bytes([
-            0x84,                 # Set Target command
-            channel,              # Channel (0-17)
-            int(target & 0x7F),        # Low 7 bits
-            int((target >> 7) & 0x7F)  # High 7 bits
-        ])
+        return self._send_command(_SET_TARGET(0x84, channel, target & 0x7F, (target >> 7) & 0x7F))
+
+    def _set_multiple_targets(self, channel_targets: List[Tuple[int, int]]) -> bool:
+        """
+        Set targets for several channels with a single serial write.
+
+        Uses Compact Protocol Set Multiple Targets (Mini Maestro 12/18/24 only):
+        0x9F, count, first_channel, (target_low, target_high) * count
+        Channels must be contiguous within one command, so the list is split
+        into contiguous runs and all run commands are written together.
+
+        Args:
+            channel_targets: (channel, target) pairs, target in quarter-microseconds
+
+        Returns:
+            True if successful
+        """
+        command = self._encode_multiple_targets(channel_targets)
+
+        if command is None:
+            return False
+
+        if not command:
+            return True
 
         return self._send_command(command)
 
-    def _angle_to_target(self, angle: float, min_pulse: int, max_pulse: int) -> int:
+    def _encode_multiple_targets(self, channel_targets: List[Tuple[int, int]]) -> Optional[bytes]:
+        """
+        Encode (channel, target) pairs as Set Multiple Targets packets.
+
+        Args:
+            channel_targets: (channel, target) pairs, target in quarter-microseconds
+
+        Returns:
+            Concatenated packets for all contiguous runs, or None if a
+            channel is out of range
+        """
+        # Group sorted channels into contiguous runs: [first_channel, targets]
+        runs: List[Tuple[int, List[int]]] = []
+        for channel, target in sorted(channel_targets):
+            if channel < 0 or channel > 17:
+                logger.error(f"Invalid channel: {channel}")
+                return None
+
+            target = max(0, min(65535, int(target)))
+            if runs and channel == runs[-1][0] + len(runs[-1][1]):
+                runs[-1][1].append(target)
+            else:
+                runs.append((channel, [target]))
+
+        return b"".join(
+            self._multiple_targets_packet(first_channel, targets)
+            for first_channel, targets in runs
+        )
+
+    @staticmethod
+    def _multiple_targets_packet(first_channel: int, targets: List[int]) -> bytes:
+        """
+        Encode one Set Multiple Targets packet for a contiguous channel run.
+
+        Args:
+            first_channel: First channel of the run
+            targets: Targets for first_channel, first_channel + 1, ...
+
+        Returns:
+            Encoded packet
+        """
+        return bytes([
+            0x9F, len(targets), first_channel,
+            *chain.from_iterable((t & 0x7F, (t >> 7) & 0x7F) for t in targets)
+        ])
+
+    def _angle_to_target(self, angle: float, idx: Tuple[int, int]) -> int:
         """
         Convert angle (degrees) to Maestro target value (quarter-microseconds).
 
         Args:
             angle: Angle in degrees (0-180)
-            min_pulse: Minimum pulse width in quarter-microseconds
-            max_pulse: Maximum pulse width in quarter-microseconds
+            idx: (leg_idx, joint_idx) of the servo
 
         Returns:
             Target value in quarter-microseconds
         """
-        # Clamp angle to valid range
+        # Clamp angle to valid range; the result then stays within the
+        # validated pulse range, so no further clamp is needed
         angle = max(0.0, min(180.0, angle))
+        return int(self._target_offsets[idx] + angle * self._target_scales[idx])
+
+    def _angles_to_targets_vec(
+        self,
+        legs: np.ndarray,
+        joints: np.ndarray,
+        angles: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply calibration and map a set of angles to Maestro targets in one pass.
+
+        Args:
+            legs: Leg indices
+            joints: Joint indices, parallel to legs
+            angles: Requested angles in degrees, parallel to legs
+
+        Returns:
+            (adjusted angles in degrees, int32 targets in quarter-microseconds)
+        """
+        adjusted = angles + self._offsets[legs, joints]
+        adjusted = np.where(self._inverted[legs, joints], 180.0 - adjusted, adjusted)
+        adjusted = np.clip(adjusted, self._min_angles[legs, joints], self._max_angles[legs, joints])
+
+        targets = (
+            self._target_offsets[legs, joints]
+            + np.clip(adjusted, 0.0, 180.0) * self._target_scales[legs, joints]
+        ).astype(np.int32)
+
+        return adjusted, targets
+
+    def _write_angles(self, legs: np.ndarray, joints: np.ndarray, angles: np.ndarray) -> bool:
+        """
+        Move a set of servos with a single batched serial write.
+
+        Args:
+            legs: Leg indices
+            joints: Joint indices, parallel to legs
+            angles: Requested angles in degrees, parallel to legs
+
+        Returns:
+            True if successful
+        """
+        adjusted, targets = self._angles_to_targets_vec(legs, joints, angles)
 
-        # Linear interpolation
-        pulse_range = max_pulse - min_pulse
-        target = min_pulse + (angle / 180.0) * pulse_range
+        if self._mock_mode:
+            logger.debug("Mock: Set {} servos simultaneously", len(legs))
+            self._current_angles[legs, joints] = adjusted
+            return True
 
-        return int(target)
+        # One serial write for all servos instead of one per channel
+        success = self._set_multiple_targets(list(zip(
+            self._channels[legs, joints].tolist(), targets.tolist()
+        )))
+
+        if success:
+            self._current_angles[legs, joints] = adjusted
+
+        return success
 
     def set_servo_angle(self, leg_idx: int, joint: str, angle: float) -> bool:
         """
@@ -246,33 +480,32 @@ class MaestroController:
             logger.error("Maestro controller not initialized")
             return False
 
-        key = (leg_idx, joint)
-        if key not in self._servo_configs:
+        idx = self._servo_index(leg_idx, joint)
+        if idx is None:
             logger.error(f"Invalid servo: leg {leg_idx}, joint {joint}")
             return False
 
-        config = self._servo_configs[key]
-
         # Apply offset and clamp
-        adjusted_angle = angle + config.offset
-        if config.inverted:
+        adjusted_angle = angle + self._offsets[idx]
+        if self._inverted[idx]:
             adjusted_angle = 180.0 - adjusted_angle
 
-        adjusted_angle = max(config.min_angle, min(config.max_angle, adjusted_angle))
+        adjusted_angle = float(max(self._min_angles[idx], min(self._max_angles[idx], adjusted_angle)))
 
         if self._mock_mode:
-            logger.debug(f"Mock: Set servo leg={leg_idx} joint={joint} angle={adjusted_angle:.2f}°")
-            self._current_angles[key] = adjusted_angle
+            logger.debug("Mock: Set servo leg={} joint={} angle={:.2f}°",
+                         leg_idx, joint, adjusted_angle)
+            self._current_angles[idx] = adjusted_angle
             return True
 
         # Convert angle to Maestro target value
-        target = self._angle_to_target(adjusted_angle, config.min_pulse, config.max_pulse)
+        target = self._angle_to_target(adjusted_angle, idx)
 
         # Send command to Maestro
-        success = self._set_target(config.channel, target)
+        success = self._set_target(int(self._channels[idx]), target)
 
         if success:
-            self._current_angles[key] = adjusted_angle
+            self._current_angles[idx] = adjusted_angle
 
         return success
 
@@ -289,11 +522,17 @@ class MaestroController:
         Returns:
             True if all successful
         """
-        success = True
-        success &= self.set_servo_angle(leg_idx, 'coxa', coxa)
-        success &= self.set_servo_angle(leg_idx, 'femur', femur)
-        success &= self.set_servo_angle(leg_idx, 'tibia', tibia)
-        return success
+        if not self._initialized:
+            logger.error("Maestro controller not initialized")
+            return False
+
+        if not 0 <= leg_idx < 6 or (self._channels[leg_idx] < 0).any():
+            logger.error(f"Invalid leg: {leg_idx}")
+            return False
+
+        return self._write_angles(
+            np.full(3, leg_idx), _LEG_JOINTS, np.array([coxa, femur, tibia], dtype=float)
+        )
 
     def set_multiple_servos(self, servo_angles: Dict[Tuple[int, str], float]) -> bool:
         """
@@ -312,11 +551,79 @@ class MaestroController:
         if not servo_angles:
             return True
 
-        success = True
+        legs: List[int] = []
+        joints: List[int] = []
+        angles: List[float] = []
+
         for (leg_idx, joint), angle in servo_angles.items():
-            success &= self.set_servo_angle(leg_idx, joint, angle)
+            idx = self._servo_index(leg_idx, joint)
+            if idx is None:
+                logger.warning(f"Skipping invalid servo: leg={leg_idx} joint={joint}")
+                continue
 
-        return success
+            legs.append(idx[0])
+            joints.append(idx[1])
+            angles.append(angle)
+
+        if not legs:
+            return True
+
+        return self._write_angles(
+            np.array(legs), np.array(joints), np.array(angles, dtype=float)
+        )
+
+    def set_all_legs(self, leg_angles: Dict[int, Tuple[float, float, float]]) -> bool:
+        """
+        Set joint angles for several legs in one bus transaction.
+
+        Args:
+            leg_angles: Dictionary mapping leg_idx -> (coxa, femur, tibia)
+
+        Returns:
+            True if successful
+        """
+        servo_angles = {}
+        for leg_idx, (coxa, femur, tibia) in leg_angles.items():
+            servo_angles[(leg_idx, 'coxa')] = coxa
+            servo_angles[(leg_idx, 'femur')] = femur
+            servo_angles[(leg_idx, 'tibia')] = tibia
+
+        return self.set_multiple_servos(servo_angles)
+
+    def drive_from_targets(self, targets: np.ndarray) -> bool:
+        """
+        Move all legs to foot positions with one IK pass and one serial write.
+
+        Args:
+            targets: Array of shape (6, 3) with foot positions (x, y, z in mm)
+                per leg
+
+        Returns:
+            True if every leg was reachable and the write succeeded
+        """
+        if not self._initialized:
+            logger.error("Maestro controller not initialized")
+            return False
+
+        if self._ik_solver is None:
+            self._ik_solver = IKSolver()
+
+        angles = self._ik_solver.solve_legs(targets, self._leg_dimensions)
+
+        reachable = ~np.isnan(angles).any(axis=1) & (self._channels >= 0).all(axis=1)
+        if not reachable.all():
+            logger.error("Skipping unreachable or unconfigured legs: {}",
+                         np.flatnonzero(~reachable).tolist())
+
+        legs = np.flatnonzero(reachable)
+        if len(legs) == 0:
+            return False
+
+        success = self._write_angles(
+            np.repeat(legs, 3), np.tile(_LEG_JOINTS, len(legs)), angles[legs].ravel()
+        )
+
+        return success and len(legs) == 6
 
     def move_all_to_neutral(self) -> bool:
         """
@@ -327,11 +634,21 @@ class MaestroController:
         """
         logger.info("Moving all servos to neutral position")
 
-        servo_angles = {}
-        for key in self._servo_configs.keys():
-            servo_angles[key] = 90.0
+        if not self._initialized:
+            logger.error("Maestro controller not initialized")
+            return False
 
-        return self.set_multiple_servos(servo_angles)
+        if self._mock_mode:
+            self._current_angles[self._configured] = self._neutral_angles
+            return True
+
+        # One precomputed Set Multiple Targets write for every servo
+        success = self._send_command(self._neutral_command)
+
+        if success:
+            self._current_angles[self._configured] = self._neutral_angles
+
+        return success
 
     def disable_servo(self, leg_idx: int, joint: str) -> bool:
         """
@@ -344,21 +661,18 @@ class MaestroController:
         Returns:
             True if successful
         """
-        key = (leg_idx, joint)
-        if key not in self._servo_configs:
+        idx = self._servo_index(leg_idx, joint)
+        if idx is None:
             logger.error(f"Invalid servo: leg={leg_idx} joint={joint}")
             return False
 
         if self._mock_mode:
-            logger.debug(f"Mock: Disable servo leg={leg_idx} joint={joint}")
+            logger.debug("Mock: Disable servo leg={} joint={}", leg_idx, joint)
             return True
 
-        config = self._servo_configs[key]
-
         # Set target to 0 to disable servo
         # Compact Protocol: 0x84, channel, 0, 0
-        command = bytes([0x84, config.channel, 0, 0])
-        return self._send_command(command)
+        return self._send_command(_SET_TARGET(0x84, int(self._channels[idx]), 0, 0))
 
     def disable_all_servos(self) -> bool:
         """
@@ -373,12 +687,8 @@ class MaestroController:
             logger.debug("Mock: All servos disabled")
             return True
 
-        success = True
-        for key in self._servo_configs.keys():
-            leg_idx, joint = key
-            success &= self.disable_servo(leg_idx, joint)
-
-        return success
+        # Target 0 turns PWM off; one precomputed write covers every servo
+        return self._send_command(self._disable_command)
 
     def get_current_angle(self, leg_idx: int, joint: str) -> Optional[float]:
         """
@@ -391,7 +701,10 @@ class MaestroController:
         Returns:
             Current angle or None if not found
         """
-        return self._current_angles.get((leg_idx, joint))
+        idx = self._servo_index(leg_idx, joint)
+        if idx is None:
+            return None
+        return float(self._current_angles[idx])
 
     def get_leg_angles(self, leg_idx: int) -> Optional[Tuple[float, float, float]]:
         """
@@ -418,16 +731,32 @@ class MaestroController:
 
         logger.info("Closing Maestro controller")
 
+        # Longest neutral move, to wait only as long as the servos need
+        max_delta = float(np.max(
+            np.abs(self._current_angles[self._configured] - self._neutral_angles), initial=0.0
+        ))
+
         # Move to neutral and disable
         self.move_all_to_neutral()
-        time.sleep(0.5)
+        self._settle(max_delta)
         self.disable_all_servos()
 
-        if not self._mock_mode and self._serial and self._serial.is_open:
-            self._serial.close()
+        self._write = None
+        if self._finalizer is not None:
+            self._finalizer()
 
         self._initialized = False
 
+    def _settle(self, max_delta: float):
+        """
+        Wait for the servos to finish a move before their PWM is cut.
+
+        Args:
+            max_delta: Largest angle change of the move in degrees
+        """
+        if max_delta > 0.0 and not self._mock_mode:
+            time.sleep(max_delta / self._slew_rate + 0.02)
+
     def __enter__(self):
         """Context manager entry."""
         self.initialize()
@@ -436,8 +765,3 @@ class MaestroController:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
-
-    def __del__(self):
-        """Destructor."""
-        if self._initialized:
-            self.close()
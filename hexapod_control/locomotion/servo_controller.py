@@ -1,18 +1,79 @@
 """Servo controller for hexapod legs using PCA9685 PWM driver."""
 
 import ctypes
+import functools
+import sys
 import time
+import weakref
+from array import array
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from loguru import logger
 
+from locomotion import _servo_driver_bindings
 from utils.config_loader import get_config_loader
 
+try:
+    from locomotion.lib import servo_driver_cy
+    CYTHON_SERVO_AVAILABLE = True
+except ImportError:
+    CYTHON_SERVO_AVAILABLE = False
 
-@dataclass
+# Joint ids for the integer servo API (offset within a leg's three servos)
+JOINT_COXA = 0
+JOINT_FEMUR = 1
+JOINT_TIBIA = 2
+
+
+@functools.cache
+def _load_driver_library():
+    """
+    Load the servo driver, once per process.
+
+    Prefers the Cython bindings when built ('make cython'), otherwise loads
+    the shared library through ctypes.
+
+    Returns:
+        Driver module or library, or None if it is unavailable
+    """
+    if CYTHON_SERVO_AVAILABLE:
+        # Same function names as the shared library, called without ctypes
+        logger.info("Using Cython servo driver bindings")
+        return servo_driver_cy
+
+    lib_dir = Path(__file__).parent / "lib"
+
+    if sys.platform == "win32":
+        lib_path = lib_dir / "libservo_driver.dll"
+    else:
+        lib_path = lib_dir / "libservo_driver.so"
+
+    if not lib_path.exists():
+        logger.warning(
+            f"Servo driver library not found at {lib_path}. "
+            f"Run 'make' in locomotion/lib/ to build. Falling back to mock mode."
+        )
+        return None
+
+    try:
+        lib = _servo_driver_bindings.load(lib_path)
+        logger.info(f"Loaded servo driver library: {lib_path}")
+        return lib
+    except Exception as e:
+        logger.error(f"Failed to load servo driver library: {e}")
+        return None
+
+
+def _shutdown_driver(lib) -> None:
+    """Turn off all PWM outputs and release the driver (finalizer; no moves)."""
+    lib.servo_off_all()
+    lib.servo_driver_close()
+
+
+@dataclass(slots=True, frozen=True)
 class ServoConfig:
-    """Configuration for a single servo."""
+    """Configuration for a single servo (immutable after parsing)."""
     channel: int
     min_pulse: int = 500
     max_pulse: int = 2500
@@ -27,9 +88,27 @@ class ServoController:
     High-level servo controller for hexapod.
 
     Interfaces with C servo driver library for hardware PWM control.
+    Prefers the Cython bindings when built ('make cython'), otherwise
+    loads the library through ctypes.
     Manages 18 servos (6 legs × 3 joints each).
+
+    Constructing a ServoController returns a MockServoController instead
+    when mock_mode is set or the driver library is unavailable, so neither
+    class checks the mode on its write paths.
     """
 
+    # Joint name -> offset within a leg's block of the flat servo index
+    _JOINT_IDX = {'coxa': JOINT_COXA, 'femur': JOINT_FEMUR, 'tibia': JOINT_TIBIA}
+
+    # Fixed per class; MockServoController sets it
+    _mock_mode = False
+
+    def __new__(cls, config_loader=None, mock_mode: bool = False):
+        """Pick the hardware or mock implementation (like pathlib.Path does)."""
+        if cls is ServoController and (mock_mode or _load_driver_library() is None):
+            cls = MockServoController
+        return super().__new__(cls)
+
     def __init__(self, config_loader=None, mock_mode: bool = False):
         """
         Initialize servo controller.
@@ -39,8 +118,8 @@ class ServoController:
             mock_mode: If True, simulate hardware (for development)
         """
         self._config_loader = config_loader or get_config_loader()
-        self._mock_mode = mock_mode
         self._lib = None
+        self._finalizer = None
         self._initialized = False
 
         # Load hardware configuration
@@ -48,9 +127,37 @@ class ServoController:
         self._servo_config = hw_config['servos']
         self._hexapod_config = hw_config['hexapod']
 
-        # Servo state tracking
-        self._current_angles: Dict[Tuple[int, str], float] = {}  # (leg_idx, joint) -> angle
-        self._servo_configs: Dict[Tuple[int, str], ServoConfig] = {}
+        # Servo state, indexed by flat servo index leg_idx * 3 + joint
+        self._current_angles: List[float] = [90.0] * 18
+        self._servo_configs_list: List[Optional[ServoConfig]] = [None] * 18
+        # True once a servo has been driven and until it is disabled; only
+        # live servos can have unchanged writes skipped
+        self._servo_live: List[bool] = [False] * 18
+
+        # Per-servo config as flat (leg_idx * 3 + joint) ctypes arrays, filled once
+        self._c_channels = (ctypes.c_uint16 * 18)()
+        self._c_min_pulse = (ctypes.c_uint16 * 18)()
+        self._c_max_pulse = (ctypes.c_uint16 * 18)()
+        # Offset and inversion folded into adjusted = sign * angle + bias
+        self._c_sign = (ctypes.c_double * 18)()
+        self._c_bias = (ctypes.c_double * 18)()
+        self._c_min_angle = (ctypes.c_double * 18)()
+        self._c_max_angle = (ctypes.c_double * 18)()
+
+        # Reused argument buffers for servo_set_multiple_raw (one slot per servo)
+        self._max_servos = 18
+        self._scratch_idx = (ctypes.c_uint8 * self._max_servos)()
+        self._scratch_angles = (ctypes.c_double * self._max_servos)()
+
+        # Argument buffers for set_leg_angles (one leg's three joints)
+        self._leg_scratch_idx = (ctypes.c_uint8 * 3)()
+        self._leg_scratch_ang = (ctypes.c_double * 3)()
+
+        # Servo updates queued for the next flush(); one slot per servo at most
+        self._pending_idx = (ctypes.c_uint8 * self._max_servos)()
+        self._pending_ang = (ctypes.c_double * self._max_servos)()
+        self._pending_slot: List[int] = [-1] * self._max_servos  # flat index -> slot
+        self._pending_n = 0
 
         # PWM driver settings
         self._i2c_bus = self._servo_config['driver']['i2c_bus']
@@ -61,10 +168,10 @@ class ServoController:
         self._parse_servo_configs()
 
         # Load C library
-        if not mock_mode:
-            self._load_library()
-        else:
+        if self._mock_mode:
             logger.info("ServoController initialized in MOCK mode")
+        else:
+            self._lib = _load_driver_library()
 
     def _parse_servo_configs(self):
         """Parse servo configurations from YAML."""
@@ -72,6 +179,16 @@ class ServoController:
         offsets = self._servo_config.get('offsets', {})
         specs = self._servo_config['specs']
 
+        # Pulse range is shared by all servos
+        self._min_pulse = specs['min_pulse']
+        self._max_pulse = specs['max_pulse']
+        self._slew_rate = specs.get('slew_rate', 300.0)  # degrees/second
+
+        # Smallest angle change the PWM output can express: one 12-bit
+        # register step of the PWM period, converted from pulse width to degrees
+        step_us = 1000000.0 / self._pwm_freq / 4096
+        self._servo_resolution = 180.0 * step_us / (self._max_pulse - self._min_pulse)
+
         for key, channel in channels.items():
             # Parse "leg_idx.joint" format
             parts = key.split('.')
@@ -81,11 +198,14 @@ class ServoController:
 
             leg_idx = int(parts[0])
             joint = parts[1]
+            if joint not in self._JOINT_IDX or not 0 <= leg_idx < 6:
+                logger.warning(f"Invalid servo config key: {key}")
+                continue
 
             # Get offset if exists
             offset = offsets.get(key, 0.0)
 
-            self._servo_configs[(leg_idx, joint)] = ServoConfig(
+            config = ServoConfig(
                 channel=channel,
                 min_pulse=specs['min_pulse'],
                 max_pulse=specs['max_pulse'],
@@ -93,82 +213,70 @@ class ServoController:
                 max_angle=specs['max_angle'],
                 offset=offset
             )
+            i = leg_idx * 3 + self._JOINT_IDX[joint]
+            self._servo_configs_list[i] = config
+            self._c_channels[i] = config.channel
+            self._c_min_pulse[i] = config.min_pulse
+            self._c_max_pulse[i] = config.max_pulse
+            if config.inverted:
+                self._c_sign[i] = -1.0
+                self._c_bias[i] = 180.0 - config.offset
+            else:
+                self._c_sign[i] = 1.0
+                self._c_bias[i] = config.offset
+            self._c_min_angle[i] = config.min_angle
+            self._c_max_angle[i] = config.max_angle
 
             # Initialize angle tracking
-            self._current_angles[(leg_idx, joint)] = 90.0  # Neutral position
+            self._current_angles[i] = 90.0  # Neutral position
+
+        # Neutral pose is constant after parsing: adjust it once and keep it
+        # ready as driver arguments for move_all_to_neutral
+        self._neutral_idx = [i for i, c in enumerate(self._servo_configs_list) if c is not None]
+        self._neutral_adjusted: List[float] = [self._adjust_angle(i, 90.0) for i in range(18)]
+        n = len(self._neutral_idx)
+        # Packed by array.array; the ctypes views share its memory instead of
+        # marshalling element by element through (c_type * n)(*values)
+        self._neutral_channels_buf = array('B', [self._c_channels[i] for i in self._neutral_idx])
+        self._neutral_angles_buf = array('d', [self._neutral_adjusted[i] for i in self._neutral_idx])
+        self._neutral_channels = (ctypes.c_uint8 * n).from_buffer(self._neutral_channels_buf)
+        self._neutral_angles = (ctypes.c_double * n).from_buffer(self._neutral_angles_buf)
+
+    def _adjust_angle(self, i: int, angle: float) -> float:
+        """
+        Apply offset, inversion and limits for one servo.
 
-    def _load_library(self):
-        """Load C servo driver library."""
-        import sys
-        lib_dir = Path(__file__).parent / "lib"
+        Mirrors the adjustment servo_set_multiple_raw performs in C.
 
-        if sys.platform == "win32":
-            lib_path = lib_dir / "libservo_driver.dll"
-        else:
-            lib_path = lib_dir / "libservo_driver.so"
+        Args:
+            i: Flat servo index
+            angle: Requested angle in degrees
 
-        if not lib_path.exists():
-            logger.warning(
-                f"Servo driver library not found at {lib_path}. "
-                f"Run 'make' in locomotion/lib/ to build. Falling back to mock mode."
-            )
-            self._mock_mode = True
-            return
+        Returns:
+            Adjusted angle in degrees
+        """
+        adjusted_angle = self._c_sign[i] * angle + self._c_bias[i]
+        hi = self._c_max_angle[i]
+        adjusted_angle = adjusted_angle if adjusted_angle < hi else hi
+        lo = self._c_min_angle[i]
+        return adjusted_angle if adjusted_angle > lo else lo
 
-        try:
-            self._lib = ctypes.CDLL(str(lib_path))
-            self._setup_ctypes()
-            logger.info(f"Loaded servo driver library: {lib_path}")
-        except Exception as e:
-            logger.error(f"Failed to load servo driver library: {e}")
-            self._mock_mode = True
-
-    def _setup_ctypes(self):
-        """Setup ctypes function signatures."""
-        # servo_driver_init
-        self._lib.servo_driver_init.argtypes = [
-            ctypes.c_int,    # i2c_bus
-            ctypes.c_uint8,  # i2c_addr
-            ctypes.c_uint16  # pwm_freq
-        ]
-        self._lib.servo_driver_init.restype = ctypes.c_int
-
-        # servo_set_angle
-        self._lib.servo_set_angle.argtypes = [
-            ctypes.c_uint8,   # channel
-            ctypes.c_double,  # angle_deg
-            ctypes.c_uint16,  # min_pulse
-            ctypes.c_uint16,  # max_pulse
-            ctypes.c_uint16   # pwm_freq
-        ]
-        self._lib.servo_set_angle.restype = ctypes.c_int
-
-        # servo_set_multiple
-        self._lib.servo_set_multiple.argtypes = [
-            ctypes.POINTER(ctypes.c_uint8),   # channels
-            ctypes.POINTER(ctypes.c_double),  # angles
-            ctypes.c_int,                      # count
-            ctypes.c_uint16,                   # min_pulse
-            ctypes.c_uint16,                   # max_pulse
-            ctypes.c_uint16                    # pwm_freq
-        ]
-        self._lib.servo_set_multiple.restype = ctypes.c_int
-
-        # servo_off
-        self._lib.servo_off.argtypes = [ctypes.c_uint8]
-        self._lib.servo_off.restype = ctypes.c_int
-
-        # servo_off_all
-        self._lib.servo_off_all.argtypes = []
-        self._lib.servo_off_all.restype = ctypes.c_int
-
-        # servo_driver_close
-        self._lib.servo_driver_close.argtypes = []
-        self._lib.servo_driver_close.restype = None
-
-        # servo_driver_is_initialized
-        self._lib.servo_driver_is_initialized.argtypes = []
-        self._lib.servo_driver_is_initialized.restype = ctypes.c_int
+    def _flat(self, leg_idx: int, joint: str) -> Optional[int]:
+        """
+        Get the flat servo index for a leg and joint.
+
+        Args:
+            leg_idx: Leg index (0-5)
+            joint: Joint name ('coxa', 'femur', 'tibia')
+
+        Returns:
+            leg_idx * 3 + joint index, or None if the servo is not configured
+        """
+        j = self._JOINT_IDX.get(joint)
+        if j is None or not 0 <= leg_idx < 6:
+            return None
+        i = leg_idx * 3 + j
+        return i if self._servo_configs_list[i] is not None else None
 
     def initialize(self) -> bool:
         """
@@ -181,11 +289,6 @@ class ServoController:
             logger.warning("Servo controller already initialized")
             return True
 
-        if self._mock_mode:
-            logger.info("Mock mode: Simulating servo initialization")
-            self._initialized = True
-            return True
-
         try:
             result = self._lib.servo_driver_init(
                 self._i2c_bus,
@@ -195,6 +298,8 @@ class ServoController:
 
             if result == 0:
                 self._initialized = True
+                # Safe C-side cleanup if the controller is collected unclosed
+                self._finalizer = weakref.finalize(self, _shutdown_driver, self._lib)
                 logger.info("Servo controller initialized successfully")
 
                 # Move to neutral positions
@@ -217,6 +322,27 @@ class ServoController:
             joint: Joint name ('coxa', 'femur', 'tibia')
             angle: Target angle in degrees (0-180)
 
+        Returns:
+            True if successful
+        """
+        joint_id = self._JOINT_IDX.get(joint)
+        if joint_id is None:
+            logger.error(f"Invalid servo: leg {leg_idx}, joint {joint}")
+            return False
+
+        return self.set_servo_angle_fast(leg_idx, joint_id, angle)
+
+    def set_servo_angle_fast(self, leg_idx: int, joint_id: int, angle: float) -> bool:
+        """
+        Set angle for a specific servo by integer joint id.
+
+        Same as set_servo_angle without the joint name lookup.
+
+        Args:
+            leg_idx: Leg index (0-5)
+            joint_id: JOINT_COXA, JOINT_FEMUR or JOINT_TIBIA
+            angle: Target angle in degrees (0-180)
+
         Returns:
             True if successful
         """
@@ -224,44 +350,41 @@ class ServoController:
             logger.error("Servo controller not initialized")
             return False
 
-        key = (leg_idx, joint)
-        if key not in self._servo_configs:
-            logger.error(f"Invalid servo: leg {leg_idx}, joint {joint}")
+        i = leg_idx * 3 + joint_id
+        if not (0 <= leg_idx < 6 and 0 <= joint_id < 3) or self._servo_configs_list[i] is None:
+            logger.error(f"Invalid servo: leg {leg_idx}, joint {joint_id}")
             return False
 
-        config = self._servo_configs[key]
-
-        # Apply offset and clamp
-        adjusted_angle = angle + config.offset
-        if config.inverted:
-            adjusted_angle = 180.0 - adjusted_angle
+        # Apply offset/inversion and clamp
+        adjusted_angle = self._adjust_angle(i, angle)
 
-        adjusted_angle = max(config.min_angle, min(config.max_angle, adjusted_angle))
+        if not self._write_servo(i, adjusted_angle):
+            logger.error(f"Failed to set servo angle: leg={leg_idx} joint={joint_id}")
+            return False
 
-        if self._mock_mode:
-            logger.debug(f"Mock: Set servo leg={leg_idx} joint={joint} angle={adjusted_angle:.2f}°")
-            self._current_angles[key] = adjusted_angle
-            return True
+        self._current_angles[i] = adjusted_angle
+        self._servo_live[i] = True
+        return True
 
-        try:
-            result = self._lib.servo_set_angle(
-                config.channel,
-                adjusted_angle,
-                config.min_pulse,
-                config.max_pulse,
-                self._pwm_freq
-            )
+    def _write_servo(self, i: int, adjusted_angle: float) -> bool:
+        """
+        Drive one servo to an already adjusted angle.
 
-            if result == 0:
-                self._current_angles[key] = adjusted_angle
-                return True
-            else:
-                logger.error(f"Failed to set servo angle: leg={leg_idx} joint={joint}")
-                return False
+        Args:
+            i: Flat servo index
+            adjusted_angle: Angle after offset, inversion and limits
 
-        except Exception as e:
-            logger.error(f"Exception setting servo angle: {e}")
-            return False
+        Returns:
+            True if the driver accepted it
+        """
+        # The driver reports failures through its return code
+        return self._lib.servo_set_angle(
+            self._c_channels[i],
+            adjusted_angle,
+            self._min_pulse,
+            self._max_pulse,
+            self._pwm_freq
+        ) == 0
 
     def set_leg_angles(self, leg_idx: int, coxa: float, femur: float, tibia: float) -> bool:
         """
@@ -276,11 +399,86 @@ class ServoController:
         Returns:
             True if all successful
         """
+        if not self._initialized:
+            logger.error("Servo controller not initialized")
+            return False
+
+        if not 0 <= leg_idx < 6:
+            logger.error(f"Invalid leg: {leg_idx}")
+            return False
+
+        # One driver call for the leg; pending queued updates are left alone
+        idx = self._leg_scratch_idx
+        angles = self._leg_scratch_ang
+        base = leg_idx * 3
         success = True
-        success &= self.set_servo_angle(leg_idx, 'coxa', coxa)
-        success &= self.set_servo_angle(leg_idx, 'femur', femur)
-        success &= self.set_servo_angle(leg_idx, 'tibia', tibia)
-        return success
+        n = 0
+
+        for joint_id, angle in ((JOINT_COXA, coxa), (JOINT_FEMUR, femur), (JOINT_TIBIA, tibia)):
+            i = base + joint_id
+            if self._servo_configs_list[i] is None:
+                logger.error(f"Invalid servo: leg {leg_idx}, joint {joint_id}")
+                success = False
+                continue
+
+            idx[n] = i
+            angles[n] = angle
+            n += 1
+
+        if n == 0:
+            return False
+
+        return self._submit(idx, angles, n) and success
+
+    def queue_servo_angle(self, leg_idx: int, joint: str, angle: float) -> bool:
+        """
+        Queue a servo angle for the next flush() without touching the driver.
+
+        Queuing the same servo again before a flush replaces its angle.
+
+        Args:
+            leg_idx: Leg index (0-5)
+            joint: Joint name ('coxa', 'femur', 'tibia')
+            angle: Target angle in degrees (0-180)
+
+        Returns:
+            True if queued
+        """
+        i = self._flat(leg_idx, joint)
+        if i is None:
+            logger.error(f"Invalid servo: leg {leg_idx}, joint {joint}")
+            return False
+
+        slot = self._pending_slot[i]
+        if slot < 0:
+            slot = self._pending_n
+            self._pending_n += 1
+            self._pending_slot[i] = slot
+            self._pending_idx[slot] = i
+
+        self._pending_ang[slot] = angle
+        return True
+
+    def flush(self) -> bool:
+        """
+        Send all queued servo angles in one driver call.
+
+        Returns:
+            True if successful (or nothing was queued)
+        """
+        n = self._pending_n
+        if n == 0:
+            return True
+
+        for k in range(n):
+            self._pending_slot[self._pending_idx[k]] = -1
+        self._pending_n = 0
+
+        if not self._initialized:
+            logger.error("Servo controller not initialized")
+            return False
+
+        return self._submit(self._pending_idx, self._pending_ang, n)
 
     def set_multiple_servos(self, servo_angles: Dict[Tuple[int, str], float]) -> bool:
         """
@@ -299,55 +497,90 @@ class ServoController:
         if not servo_angles:
             return True
 
-        # Prepare arrays for C function
-        channels = []
-        angles = []
+        # Fill the preallocated C argument buffers; keys are unique, so at most 18
+        idx = self._scratch_idx
+        angles = self._scratch_angles
+        current = self._current_angles
+        live = self._servo_live
+        resolution = self._servo_resolution
+        n = 0
 
         for (leg_idx, joint), angle in servo_angles.items():
-            key = (leg_idx, joint)
-            if key not in self._servo_configs:
+            i = self._flat(leg_idx, joint)
+            if i is None:
                 logger.warning(f"Skipping invalid servo: leg={leg_idx} joint={joint}")
                 continue
 
-            config = self._servo_configs[key]
-
-            # Apply offset and clamp
-            adjusted_angle = angle + config.offset
-            if config.inverted:
-                adjusted_angle = 180.0 - adjusted_angle
-            adjusted_angle = max(config.min_angle, min(config.max_angle, adjusted_angle))
+            # Skip servos whose output would not change by a PWM step
+            if live[i] and abs(self._adjust_angle(i, angle) - current[i]) < resolution:
+                continue
 
-            channels.append(config.channel)
-            angles.append(adjusted_angle)
-            self._current_angles[key] = adjusted_angle
+            idx[n] = i
+            angles[n] = angle
+            n += 1
 
-        if not channels:
+        if n == 0:
             return True
 
-        if self._mock_mode:
-            logger.debug(f"Mock: Set {len(channels)} servos simultaneously")
-            return True
+        return self._submit(idx, angles, n)
 
-        try:
-            # Convert to C arrays
-            c_channels = (ctypes.c_uint8 * len(channels))(*channels)
-            c_angles = (ctypes.c_double * len(angles))(*angles)
-
-            result = self._lib.servo_set_multiple(
-                c_channels,
-                c_angles,
-                len(channels),
-                self._servo_configs[list(servo_angles.keys())[0]].min_pulse,
-                self._servo_configs[list(servo_angles.keys())[0]].max_pulse,
-                self._pwm_freq
-            )
+    def _submit(self, idx, angles, n: int) -> bool:
+        """
+        Apply calibration to n raw angles and send them in one driver call.
 
-            return result == 0
+        Args:
+            idx: Buffer of flat servo indices
+            angles: Buffer of raw angles; overwritten with adjusted angles
+            n: Number of entries used
 
-        except Exception as e:
-            logger.error(f"Exception setting multiple servos: {e}")
+        Returns:
+            True if successful
+        """
+        # Calibration runs in C; angles come back adjusted. Failures are
+        # reported through the return code
+        result = self._lib.servo_set_multiple_raw(
+            idx,
+            angles,
+            n,
+            self._c_channels,
+            self._c_sign,
+            self._c_bias,
+            self._c_min_angle,
+            self._c_max_angle,
+            self._min_pulse,
+            self._max_pulse,
+            self._pwm_freq
+        )
+
+        for k in range(n):
+            self._current_angles[idx[k]] = angles[k]
+
+        if result != 0:
+            logger.error(f"Failed to set {n} servos")
             return False
 
+        for k in range(n):
+            self._servo_live[idx[k]] = True
+        return True
+
+    def set_all_legs(self, leg_angles: Dict[int, Tuple[float, float, float]]) -> bool:
+        """
+        Set joint angles for several legs in one driver call.
+
+        Args:
+            leg_angles: Dictionary mapping leg_idx -> (coxa, femur, tibia)
+
+        Returns:
+            True if successful
+        """
+        servo_angles = {}
+        for leg_idx, (coxa, femur, tibia) in leg_angles.items():
+            servo_angles[(leg_idx, 'coxa')] = coxa
+            servo_angles[(leg_idx, 'femur')] = femur
+            servo_angles[(leg_idx, 'tibia')] = tibia
+
+        return self.set_multiple_servos(servo_angles)
+
     def move_all_to_neutral(self) -> bool:
         """
         Move all servos to neutral position (90 degrees).
@@ -357,11 +590,41 @@ class ServoController:
         """
         logger.info("Moving all servos to neutral position")
 
-        servo_angles = {}
-        for key in self._servo_configs.keys():
-            servo_angles[key] = 90.0
+        if not self._initialized:
+            logger.error("Servo controller not initialized")
+            return False
 
-        return self.set_multiple_servos(servo_angles)
+        n = len(self._neutral_idx)
+        if n == 0:
+            return True
+
+        if not self._write_neutral(n):
+            return False
+
+        for i in self._neutral_idx:
+            self._current_angles[i] = self._neutral_adjusted[i]
+            self._servo_live[i] = True
+        return True
+
+    def _write_neutral(self, n: int) -> bool:
+        """
+        Send the precomputed neutral pose to the driver.
+
+        Args:
+            n: Number of configured servos in the neutral buffers
+
+        Returns:
+            True if successful
+        """
+        # Angles were adjusted at parse time, so skip the calibrating call
+        return self._lib.servo_set_multiple(
+            self._neutral_channels,
+            self._neutral_angles,
+            n,
+            self._min_pulse,
+            self._max_pulse,
+            self._pwm_freq
+        ) == 0
 
     def disable_servo(self, leg_idx: int, joint: str) -> bool:
         """
@@ -374,18 +637,17 @@ class ServoController:
         Returns:
             True if successful
         """
-        key = (leg_idx, joint)
-        if key not in self._servo_configs:
+        i = self._flat(leg_idx, joint)
+        if i is None:
             logger.error(f"Invalid servo: leg={leg_idx} joint={joint}")
             return False
 
-        if self._mock_mode:
-            logger.debug(f"Mock: Disable servo leg={leg_idx} joint={joint}")
-            return True
+        self._servo_live[i] = False
+        return self._servo_off(i)
 
-        config = self._servo_configs[key]
-        result = self._lib.servo_off(config.channel)
-        return result == 0
+    def _servo_off(self, i: int) -> bool:
+        """Turn off PWM for one servo by flat index; True if successful."""
+        return self._lib.servo_off(self._c_channels[i]) == 0
 
     def disable_all_servos(self) -> bool:
         """
@@ -395,13 +657,12 @@ class ServoController:
             True if successful
         """
         logger.warning("Disabling all servos")
+        self._servo_live = [False] * 18
+        return self._servo_off_all()
 
-        if self._mock_mode:
-            logger.debug("Mock: All servos disabled")
-            return True
-
-        result = self._lib.servo_off_all()
-        return result == 0
+    def _servo_off_all(self) -> bool:
+        """Turn off PWM for all channels; True if successful."""
+        return self._lib.servo_off_all() == 0
 
     def get_current_angle(self, leg_idx: int, joint: str) -> Optional[float]:
         """
@@ -414,7 +675,11 @@ class ServoController:
         Returns:
             Current angle or None if not found
         """
-        return self._current_angles.get((leg_idx, joint))
+        j = self._JOINT_IDX.get(joint)
+        if j is None or not 0 <= leg_idx < 6:
+            return None
+        i = leg_idx * 3 + j
+        return self._current_angles[i] if self._servo_configs_list[i] is not None else None
 
     def get_leg_angles(self, leg_idx: int) -> Optional[Tuple[float, float, float]]:
         """
@@ -441,16 +706,35 @@ class ServoController:
 
         logger.info("Closing servo controller")
 
+        # Longest neutral move, to wait only as long as the servos need
+        max_delta = max(
+            (abs(self._current_angles[i] - self._neutral_adjusted[i]) for i in self._neutral_idx),
+            default=0.0
+        )
+
         # Move to neutral and disable
         self.move_all_to_neutral()
-        time.sleep(0.5)
+        self._settle(max_delta)
         self.disable_all_servos()
 
-        if not self._mock_mode and self._lib:
+        if self._finalizer is not None:
+            # Servos are already off; only the driver handle is left
+            self._finalizer.detach()
+            self._finalizer = None
             self._lib.servo_driver_close()
 
         self._initialized = False
 
+    def _settle(self, max_delta: float):
+        """
+        Wait for the servos to finish a move before their PWM is cut.
+
+        Args:
+            max_delta: Largest angle change of the move in degrees
+        """
+        if max_delta > 0.0:
+            time.sleep(max_delta / self._slew_rate + 0.02)
+
     def __enter__(self):
         """Context manager entry."""
         self.initialize()
@@ -460,7 +744,58 @@ class ServoController:
         """Context manager exit."""
         self.close()
 
-    def __del__(self):
-        """Destructor."""
+
+class MockServoController(ServoController):
+    """
+    ServoController that simulates the hardware (for development).
+
+    Tracks angles like the real controller but never calls the driver.
+    """
+
+    _mock_mode = True
+
+    def initialize(self) -> bool:
+        """
+        Simulate servo driver initialization.
+
+        Returns:
+            True
+        """
         if self._initialized:
-            self.close()
+            logger.warning("Servo controller already initialized")
+            return True
+
+        logger.info("Mock mode: Simulating servo initialization")
+        self._initialized = True
+        return True
+
+    def _write_servo(self, i: int, adjusted_angle: float) -> bool:
+        """Simulate driving one servo."""
+        logger.debug("Mock: Set servo leg={} joint={} angle={:.2f}°",
+                     i // 3, i % 3, adjusted_angle)
+        return True
+
+    def _submit(self, idx, angles, n: int) -> bool:
+        """Simulate a batched driver call; applies calibration in Python."""
+        for k in range(n):
+            self._current_angles[idx[k]] = self._adjust_angle(idx[k], angles[k])
+            self._servo_live[idx[k]] = True
+        logger.debug("Mock: Set {} servos simultaneously", n)
+        return True
+
+    def _write_neutral(self, n: int) -> bool:
+        """Simulate sending the neutral pose."""
+        return True
+
+    def _servo_off(self, i: int) -> bool:
+        """Simulate turning off one servo."""
+        logger.debug("Mock: Disable servo leg={} joint={}", i // 3, i % 3)
+        return True
+
+    def _servo_off_all(self) -> bool:
+        """Simulate turning off all servos."""
+        logger.debug("Mock: All servos disabled")
+        return True
+
+    def _settle(self, max_delta: float):
+        """Simulated servos move instantly."""
@@ -10,9 +10,18 @@ import asyncio
 import argparse
 import signal
 import sys
-from typing import Optional
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from loguru import logger
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    # uvloop is POSIX-only; on Windows (or without it) the default loop is used
+    UVLOOP_AVAILABLE = False
+
 # Import subsystems
 from utils.config_loader import get_config_loader
 from autonomy.state_machine import StateMachine, OperationalMode
@@ -24,6 +33,33 @@ from azure_iot.device_client import AzureIoTClient
 from azure_iot.telemetry_sender import TelemetrySender
 from azure_iot.device_twin_handler import DeviceTwinHandler
 
+# Command string -> enum member, for exception-free lookups in the handlers
+_GAIT_BY_NAME = {g.value: g for g in GaitType}
+# Modes are keyed by both the upper- and lowercase name, so the usual
+# spellings resolve without building a case-folded copy of the string
+_MODE_BY_NAME = {
+    **{m.name: m for m in OperationalMode},
+    **{m.name.lower(): m for m in OperationalMode},
+}
+# behavior.yaml autonomy.default_mode -> mode entered at startup
+_STARTUP_MODES = {
+    "autonomous": OperationalMode.AUTONOMOUS,
+    "semi_autonomous": OperationalMode.SEMI_AUTONOMOUS,
+    "remote_control": OperationalMode.REMOTE_CONTROL
+}
+
+
+@dataclass(slots=True, frozen=True)
+class _Subsystems:
+    """Subsystems of a fully initialized controller (all present, fixed for its lifetime)."""
+    servo: ServoController
+    ik: IKSolver
+    gait: GaitController
+    imu: IMUSensor
+    iot: AzureIoTClient
+    telemetry: TelemetrySender
+    twin: DeviceTwinHandler
+
 
 class HexapodController:
     """
@@ -32,6 +68,22 @@ class HexapodController:
     Manages all subsystems and coordinates their operation.
     """
 
+    # Main control loop period in seconds (10 Hz)
+    CONTROL_PERIOD = 0.1
+    # Consecutive overrunning ticks before the control loop warns
+    OVERRUN_WARN_CYCLES = 10
+    # Orientation samples per batched telemetry message, and a size cap
+    # (estimated JSON bytes) well below the IoT Hub 256 KB message limit
+    ORIENTATION_BATCH_MAX = 20
+    ORIENTATION_BATCH_BYTES = 200_000
+    _ORIENTATION_SAMPLE_BYTES = 80
+    # How long a get_status response is reused, in seconds
+    STATUS_CACHE_TTL = 0.05
+    # Direct methods that run as soon as they arrive, never queued behind others
+    _CRITICAL_METHODS = frozenset({"emergency_stop"})
+    # Other direct-method calls run concurrently, at most this many at once
+    CMD_MAX_CONCURRENT = 4
+
     def __init__(self, mock_mode: bool = False):
         """
         Initialize hexapod controller.
@@ -60,13 +112,59 @@ class HexapodController:
         self._telemetry_sender: Optional[TelemetrySender] = None
         self._device_twin_handler: Optional[DeviceTwinHandler] = None
 
-        # Register signal handlers
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # Set once initialize_subsystems succeeds; handlers and the control
+        # loop only run after that, so they use it without None checks
+        self._sub: Optional[_Subsystems] = None
+
+        # Orientation samples (timestamp, roll, pitch, yaw) awaiting a batched send
+        self._orient_batch: List[Tuple[float, float, float, float]] = []
+        self._orient_batch_limit = min(
+            self.ORIENTATION_BATCH_MAX,
+            self.ORIENTATION_BATCH_BYTES // self._ORIENTATION_SAMPLE_BYTES
+        )
+
+        # Orientation samples within the deadband of the last sent one are
+        # dropped, except for a periodic heartbeat
+        orient_filter = (
+            self._config_loader.get_behavior_config()
+            .get('telemetry', {})
+            .get('orientation_filter', {})
+        )
+        self._orient_deadband = orient_filter.get('deadband', 0.5)
+        self._orient_heartbeat = orient_filter.get('heartbeat', 2.0)
+        # A partial batch is flushed once its oldest sample is this old, so a
+        # stationary robot's heartbeats don't wait for a full batch
+        self._orient_batch_age = orient_filter.get('max_batch_age', self._orient_heartbeat)
+        self._orient_last_sent: Optional[Tuple[float, float, float, float]] = None
+
+        # Last get_status response as (loop time, response), and the status
+        # build in progress that concurrent callers share
+        self._status_cache: Optional[Tuple[float, dict]] = None
+        self._status_inflight: Optional[asyncio.Task] = None
+
+        # Non-critical direct-method calls as (handler, payload, future),
+        # started by the command dispatcher task
+        self._cmd_queue: asyncio.Queue = asyncio.Queue()
+        self._cmd_dispatcher_task: Optional[asyncio.Task] = None
 
         logger.info(f"HexapodController initialized (mock_mode={mock_mode})")
 
-    def _signal_handler(self, signum, frame):
+    def _install_signal_handlers(self):
+        """Route SIGINT/SIGTERM to the shutdown event on the running loop."""
+        loop = asyncio.get_running_loop()
+
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                # Handler runs in loop context, so it wakes waiters immediately
+                loop.add_signal_handler(signum, self._handle_signal, signum)
+            except NotImplementedError:
+                # Windows event loops lack add_signal_handler; hop onto the loop
+                signal.signal(
+                    signum,
+                    lambda num, frame: loop.call_soon_threadsafe(self._handle_signal, num)
+                )
+
+    def _handle_signal(self, signum):
         """Handle shutdown signals."""
         logger.warning(f"Received signal {signum}, initiating shutdown")
         self._shutdown_event.set()
@@ -81,16 +179,39 @@ class HexapodController:
         logger.info("Initializing subsystems...")
 
         try:
-            # Initialize servo controller
-            logger.info("Initializing servo controller...")
+            # Construct the independent subsystems (cheap, no I/O)
+            logger.info("Initializing servo controller, IMU sensor and Azure IoT client...")
             self._servo_controller = ServoController(
                 config_loader=self._config_loader,
                 mock_mode=self._mock_mode
             )
-            if not self._servo_controller.initialize():
+            self._imu_sensor = IMUSensor(
+                config_loader=self._config_loader,
+                mock_mode=self._mock_mode
+            )
+            self._iot_client = AzureIoTClient(
+                config_loader=self._config_loader,
+                mock_mode=self._mock_mode
+            )
+
+            # Bring up hardware and the IoT Hub connection concurrently; the
+            # blocking hardware initializers run in worker threads
+            async with asyncio.TaskGroup() as tg:
+                servo_task = tg.create_task(asyncio.to_thread(self._servo_controller.initialize))
+                imu_task = tg.create_task(asyncio.to_thread(self._imu_sensor.initialize))
+                iot_task = tg.create_task(self._iot_client.connect())
+
+            if not servo_task.result():
                 logger.error("Failed to initialize servo controller")
                 return False
 
+            if not imu_task.result():
+                logger.error("Failed to initialize IMU")
+                return False
+
+            if not iot_task.result():
+                logger.warning("Failed to connect to Azure IoT Hub (continuing anyway)")
+
             # Initialize IK solver
             logger.info("Initializing IK solver...")
             self._ik_solver = IKSolver()
@@ -103,25 +224,6 @@ class HexapodController:
                 config_loader=self._config_loader
             )
 
-            # Initialize IMU sensor
-            logger.info("Initializing IMU sensor...")
-            self._imu_sensor = IMUSensor(
-                config_loader=self._config_loader,
-                mock_mode=self._mock_mode
-            )
-            if not self._imu_sensor.initialize():
-                logger.error("Failed to initialize IMU")
-                return False
-
-            # Initialize Azure IoT client
-            logger.info("Initializing Azure IoT client...")
-            self._iot_client = AzureIoTClient(
-                config_loader=self._config_loader,
-                mock_mode=self._mock_mode
-            )
-            if not await self._iot_client.connect():
-                logger.warning("Failed to connect to Azure IoT Hub (continuing anyway)")
-
             # Initialize telemetry sender
             logger.info("Initializing telemetry sender...")
             self._telemetry_sender = TelemetrySender(
@@ -136,6 +238,16 @@ class HexapodController:
                 config_loader=self._config_loader
             )
 
+            self._sub = _Subsystems(
+                servo=self._servo_controller,
+                ik=self._ik_solver,
+                gait=self._gait_controller,
+                imu=self._imu_sensor,
+                iot=self._iot_client,
+                telemetry=self._telemetry_sender,
+                twin=self._device_twin_handler
+            )
+
             # Register IoT Hub method handlers
             self._register_iot_handlers()
 
@@ -143,41 +255,134 @@ class HexapodController:
             return True
 
         except Exception as e:
+            if isinstance(e, ExceptionGroup):
+                # Report the first failure from the concurrent startup phase
+                e = e.exceptions[0]
             logger.error(f"Failed to initialize subsystems: {e}")
             return False
 
     def _register_iot_handlers(self):
         """Register Azure IoT Hub message and method handlers."""
-        if not self._iot_client:
-            return
+        iot = self._sub.iot
+        twin = self._sub.twin
+
+        # Register direct method handlers. emergency_stop runs directly so
+        # no other call can delay it; the rest go through the bounded
+        # command dispatcher
+        methods = {
+            "get_status": self._handle_get_status,
+            "set_autonomy_mode": self._handle_set_autonomy_mode,
+            "emergency_stop": self._handle_emergency_stop,
+            "change_gait": self._handle_change_gait,
+        }
+        for name, handler in methods.items():
+            if name not in self._CRITICAL_METHODS:
+                handler = self._queued_method(handler)
+            iot.register_method_handler(name, handler)
 
-        # Register direct method handlers
-        self._iot_client.register_method_handler("get_status", self._handle_get_status)
-        self._iot_client.register_method_handler("set_autonomy_mode", self._handle_set_autonomy_mode)
-        self._iot_client.register_method_handler("emergency_stop", self._handle_emergency_stop)
-        self._iot_client.register_method_handler("change_gait", self._handle_change_gait)
+        if self._cmd_dispatcher_task is None:
+            self._cmd_dispatcher_task = asyncio.create_task(self._cmd_dispatcher())
 
         # Register C2D message handlers
-        self._iot_client.register_message_handler("set_mode", self._handle_set_mode_command)
+        iot.register_message_handler("set_mode", self._handle_set_mode_command)
 
         # Register device twin property handlers
-        if self._device_twin_handler:
-            self._device_twin_handler.register_property_handler("gait_mode", self._handle_gait_mode_change)
-            self._device_twin_handler.register_property_handler("max_speed", self._handle_max_speed_change)
+        twin.register_property_handler("gait_mode", self._handle_gait_mode_change)
+        twin.register_property_handler("max_speed", self._handle_max_speed_change)
 
         logger.info("IoT Hub handlers registered")
 
+    def _queued_method(
+        self, handler: Callable[[dict], Awaitable[dict]]
+    ) -> Callable[[dict], Awaitable[dict]]:
+        """
+        Wrap a direct-method handler so its calls run via the command dispatcher.
+
+        Args:
+            handler: Async handler taking the method payload
+
+        Returns:
+            Async handler that enqueues the call and awaits its result
+        """
+        async def enqueue(payload) -> dict:
+            fut = asyncio.get_running_loop().create_future()
+            self._cmd_queue.put_nowait((handler, payload, fut))
+            return await fut
+
+        return enqueue
+
+    async def _cmd_dispatcher(self):
+        """Start queued direct-method calls as tasks, CMD_MAX_CONCURRENT at most at a time."""
+        queue = self._cmd_queue
+        slots = asyncio.Semaphore(self.CMD_MAX_CONCURRENT)
+        # Running call -> future its caller awaits
+        running: Dict[asyncio.Task, asyncio.Future] = {}
+
+        def finish(task: asyncio.Task):
+            fut = running.pop(task)
+            slots.release()
+            if fut.done():
+                return
+            if task.cancelled():
+                fut.set_exception(RuntimeError("Controller shutting down"))
+            elif task.exception() is not None:
+                fut.set_exception(task.exception())
+            else:
+                fut.set_result(task.result())
+
+        try:
+            while True:
+                await slots.acquire()
+                handler, payload, fut = await queue.get()
+                if fut.done():
+                    # Caller gave up while the call was queued
+                    slots.release()
+                    continue
+                task = asyncio.create_task(handler(payload))
+                running[task] = fut
+                task.add_done_callback(finish)
+        finally:
+            # Stop running calls and fail whatever is still queued so no caller waits forever
+            for task in running:
+                task.cancel()
+            while not queue.empty():
+                fut = queue.get_nowait()[2]
+                if not fut.done():
+                    fut.set_exception(RuntimeError("Controller shutting down"))
+
     async def _handle_get_status(self, payload) -> dict:
         """Handle get_status direct method."""
-        logger.info("Handling get_status request")
+        # Polled; the IoT client already logs each method request at INFO
+        logger.debug("Handling get_status request")
 
-        imu_data = await self._imu_sensor.read_data()
+        # Serve recent polls from cache; concurrent callers share one IMU read
+        cached = self._status_cache
+        if cached is not None and asyncio.get_running_loop().time() - cached[0] < self.STATUS_CACHE_TTL:
+            return cached[1]
+
+        task = self._status_inflight
+        if task is None:
+            task = self._status_inflight = asyncio.create_task(self._build_status())
+            task.add_done_callback(self._clear_status_inflight)
+
+        # Shielded so one cancelled caller doesn't cancel the shared read
+        return await asyncio.shield(task)
+
+    def _clear_status_inflight(self, task: asyncio.Task):
+        """Forget a finished status build."""
+        if self._status_inflight is task:
+            self._status_inflight = None
+
+    async def _build_status(self) -> dict:
+        """Read the IMU, build the get_status response and cache it."""
+        sub = self._sub
+        imu_data = await sub.imu.read_data()
 
         status = {
             "operational_mode": self._state_machine.mode_name,
             "is_operational": self._state_machine.is_operational(),
-            "gait": self._gait_controller.get_current_gait().value if self._gait_controller else "unknown",
-            "is_walking": self._gait_controller.is_walking() if self._gait_controller else False,
+            "gait": sub.gait.get_current_gait().value,
+            "is_walking": sub.gait.is_walking(),
             "orientation": {
                 "roll": imu_data.roll,
                 "pitch": imu_data.pitch,
@@ -188,32 +393,40 @@ class HexapodController:
                 "gyro": imu_data.gyro_cal,
                 "accel": imu_data.accel_cal
             },
-            "telemetry_stats": self._telemetry_sender.get_statistics() if self._telemetry_sender else {}
+            "telemetry_stats": sub.telemetry.get_statistics()
         }
 
-        return {"status": "success", "data": status}
+        response = {"status": "success", "data": status}
+        self._status_cache = (asyncio.get_running_loop().time(), response)
+        return response
 
     async def _handle_set_autonomy_mode(self, payload) -> dict:
         """Handle set_autonomy_mode direct method."""
-        mode_str = payload.get("mode", "").upper()
-        logger.info(f"Handling set_autonomy_mode: {mode_str}")
-
-        try:
-            target_mode = OperationalMode[mode_str]
-            success = await self._state_machine.transition_to(
-                target_mode,
-                reason="Cloud command",
-                triggered_by="operator"
-            )
+        mode_str = payload.get("mode", "")
+        logger.info("Handling set_autonomy_mode: {}", mode_str)
 
-            if success:
-                return {"status": "success", "mode": mode_str}
-            else:
-                return {"status": "error", "message": "Invalid mode transition"}
+        # Payloads are arbitrary JSON; only strings can name a mode
+        if not isinstance(mode_str, str):
+            return {"status": "error", "message": f"Unknown mode: {mode_str}"}
 
-        except KeyError:
+        target_mode = _MODE_BY_NAME.get(mode_str)
+        if target_mode is None:
+            # Mixed case; fall back to case folding
+            target_mode = _MODE_BY_NAME.get(mode_str.upper())
+        if target_mode is None:
             return {"status": "error", "message": f"Unknown mode: {mode_str}"}
 
+        success = await self._state_machine.transition_to(
+            target_mode,
+            reason="Cloud command",
+            triggered_by="operator"
+        )
+
+        if success:
+            return {"status": "success", "mode": target_mode.name}
+        else:
+            return {"status": "error", "message": "Invalid mode transition"}
+
     async def _handle_emergency_stop(self, payload) -> dict:
         """Handle emergency_stop direct method."""
         logger.critical("Emergency stop triggered from cloud")
@@ -221,52 +434,53 @@ class HexapodController:
         await self._state_machine.emergency_stop("Cloud emergency stop command")
 
         # Stop gait immediately
-        if self._gait_controller:
-            await self._gait_controller.stop_walking()
+        await self._sub.gait.stop_walking()
 
         # Disable servos
-        if self._servo_controller:
-            self._servo_controller.disable_all_servos()
+        self._sub.servo.disable_all_servos()
 
         return {"status": "success", "message": "Emergency stop executed"}
 
     async def _handle_change_gait(self, payload) -> dict:
         """Handle change_gait direct method."""
         gait_str = payload.get("gait", "").lower()
-        logger.info(f"Handling change_gait: {gait_str}")
-
-        try:
-            gait_type = GaitType(gait_str)
-            self._gait_controller.set_gait(gait_type)
-            return {"status": "success", "gait": gait_str}
+        logger.info("Handling change_gait: {}", gait_str)
 
-        except ValueError:
+        gait_type = _GAIT_BY_NAME.get(gait_str)
+        if gait_type is None:
             return {"status": "error", "message": f"Unknown gait: {gait_str}"}
 
+        self._sub.gait.set_gait(gait_type)
+        return {"status": "success", "gait": gait_str}
+
     async def _handle_set_mode_command(self, message):
         """Handle C2D set_mode command."""
-        logger.info(f"Received set_mode command: {message}")
+        logger.info("Received set_mode command: {}", message)
         # Similar to set_autonomy_mode
         await self._handle_set_autonomy_mode({"mode": message})
 
     async def _handle_gait_mode_change(self, new_value):
         """Handle gait_mode desired property change."""
-        logger.info(f"Gait mode changed via device twin: {new_value}")
-        try:
-            gait_type = GaitType(new_value)
-            self._gait_controller.set_gait(gait_type)
-        except ValueError:
+        logger.info("Gait mode changed via device twin: {}", new_value)
+        # Twin values are arbitrary JSON; only strings can name a gait
+        gait_type = _GAIT_BY_NAME.get(new_value) if isinstance(new_value, str) else None
+        if gait_type is None:
             logger.error(f"Invalid gait mode: {new_value}")
+            return
+
+        self._sub.gait.set_gait(gait_type)
 
     async def _handle_max_speed_change(self, new_value):
         """Handle max_speed desired property change."""
-        logger.info(f"Max speed changed via device twin: {new_value}")
+        logger.info("Max speed changed via device twin: {}", new_value)
         # TODO: Implement speed limiting in gait controller
 
     async def start(self):
         """Start hexapod control system."""
         logger.info("Starting Hexapod Control System")
 
+        self._install_signal_handlers()
+
         # Initialize subsystems
         if not await self.initialize_subsystems():
             logger.error("Subsystem initialization failed")
@@ -275,14 +489,7 @@ class HexapodController:
         # Transition to semi-autonomous mode
         behavior_config = self._config_loader.get_behavior_config()
         default_mode = behavior_config['autonomy']['default_mode']
-
-        mode_map = {
-            "autonomous": OperationalMode.AUTONOMOUS,
-            "semi_autonomous": OperationalMode.SEMI_AUTONOMOUS,
-            "remote_control": OperationalMode.REMOTE_CONTROL
-        }
-
-        initial_mode = mode_map.get(default_mode, OperationalMode.SEMI_AUTONOMOUS)
+        initial_mode = _STARTUP_MODES.get(default_mode, OperationalMode.SEMI_AUTONOMOUS)
 
         await self._state_machine.transition_to(
             initial_mode,
@@ -291,12 +498,12 @@ class HexapodController:
         )
 
         # Start background services
-        await self._telemetry_sender.start()
-        await self._device_twin_handler.start()
+        await self._sub.telemetry.start()
+        await self._sub.twin.start()
 
         # Move to standing position
         logger.info("Moving to standing position")
-        await self._gait_controller.stand()
+        await self._sub.gait.stand()
 
         self._running = True
         logger.info("Hexapod Control System started successfully")
@@ -309,10 +516,7 @@ class HexapodController:
 
     async def _send_startup_telemetry(self):
         """Send startup telemetry."""
-        if not self._telemetry_sender:
-            return
-
-        self._telemetry_sender.queue_telemetry(
+        self._sub.telemetry.queue_telemetry(
             {
                 "event": "system_startup",
                 "mode": self._state_machine.mode_name,
@@ -326,43 +530,103 @@ class HexapodController:
         """Main control loop."""
         logger.info("Entering main control loop")
 
-        try:
-            while self._running:
-                # Check for shutdown signal
-                if self._shutdown_event.is_set():
-                    logger.info("Shutdown signal received")
-                    break
+        sub = self._sub
+        loop = asyncio.get_running_loop()
+        period = self.CONTROL_PERIOD
+        next_tick = loop.time()
+        overruns = 0
 
-                # Read sensors
-                imu_data = await self._imu_sensor.read_data()
+        # One waiter for the whole loop; each tick's wait ends early when it completes
+        shutdown_wait = asyncio.create_task(self._shutdown_event.wait())
 
-                # Send periodic telemetry
-                self._telemetry_sender.queue_orientation_update(
-                    imu_data.roll,
-                    imu_data.pitch,
-                    imu_data.yaw
-                )
-
-                # Check for fall detection
-                if self._imu_sensor.detect_fall():
+        try:
+            while self._running:
+                # Read sensors; the fall check reuses the same sample
+                imu_data, fallen = await sub.imu.read_and_check_fall()
+
+                # Collect orientation telemetry when it changed; sent in batches
+                sample = (time.time(), imu_data.roll, imu_data.pitch, imu_data.yaw)
+                if self._orientation_changed(sample):
+                    self._orient_last_sent = sample
+                    self._orient_batch.append(sample)
+                batch = self._orient_batch
+                if batch and (
+                    len(batch) >= self._orient_batch_limit
+                    or sample[0] - batch[0][0] >= self._orient_batch_age
+                ):
+                    self._flush_orientation_batch()
+
+                # Check for fall detection; once stopped, a robot that stays
+                # down doesn't re-trigger (and re-log) every tick
+                if fallen and not self._state_machine.is_emergency_stopped():
                     logger.warning("Fall detected!")
                     await self._state_machine.emergency_stop("Fall detected")
-
-                    if self._gait_controller:
-                        await self._gait_controller.stop_walking()
+                    await sub.gait.stop_walking()
 
                 # TODO: Add autonomous navigation logic here
                 # TODO: Add obstacle detection
                 # TODO: Add path planning
 
-                # Sleep for control loop interval
-                await asyncio.sleep(0.1)  # 10 Hz control loop
+                # Sleep until the next absolute deadline, so the time spent
+                # on work above doesn't stretch the period
+                next_tick += period
+                delay = next_tick - loop.time()
+                if delay < 0:
+                    overruns += 1
+                    if overruns == self.OVERRUN_WARN_CYCLES:
+                        logger.warning(
+                            f"Control loop overran its {period}s period "
+                            f"for {overruns} consecutive cycles"
+                        )
+                    if delay < -period:
+                        # Too far behind to catch up; resync instead of bursting
+                        next_tick = loop.time()
+                else:
+                    overruns = 0
+
+                # Wait out the tick, waking at once if shutdown is requested
+                done, _ = await asyncio.wait({shutdown_wait}, timeout=max(0.0, delay))
+                if shutdown_wait in done:
+                    logger.info("Shutdown signal received")
+                    break
 
         except Exception as e:
             logger.error(f"Error in control loop: {e}")
         finally:
+            shutdown_wait.cancel()
             await self.shutdown()
 
+    def _orientation_changed(self, sample: Tuple[float, float, float, float]) -> bool:
+        """
+        Check whether an orientation sample is worth sending.
+
+        Args:
+            sample: (timestamp, roll, pitch, yaw)
+
+        Returns:
+            True if any axis moved beyond the deadband since the last sent
+            sample, or the heartbeat interval has elapsed
+        """
+        last = self._orient_last_sent
+        if last is None or sample[0] - last[0] >= self._orient_heartbeat:
+            return True
+
+        deadband = self._orient_deadband
+        if abs(sample[1] - last[1]) > deadband or abs(sample[2] - last[2]) > deadband:
+            return True
+
+        # Yaw wraps at 360 degrees
+        d_yaw = abs(sample[3] - last[3]) % 360.0
+        return min(d_yaw, 360.0 - d_yaw) > deadband
+
+    def _flush_orientation_batch(self):
+        """Queue collected orientation samples as one telemetry message."""
+        if not self._orient_batch:
+            return
+
+        self._sub.telemetry.queue_orientation_batch(self._orient_batch)
+        self._orient_batch = []
+
     async def shutdown(self):
         """Shutdown hexapod control system."""
         if not self._running:
@@ -382,8 +646,15 @@ class HexapodController:
         if self._gait_controller:
             await self._gait_controller.stop_walking()
 
+        # Stop command dispatch
+        if self._cmd_dispatcher_task:
+            self._cmd_dispatcher_task.cancel()
+            await asyncio.gather(self._cmd_dispatcher_task, return_exceptions=True)
+            self._cmd_dispatcher_task = None
+
         # Stop background services
         if self._telemetry_sender:
+            self._flush_orientation_batch()
             await self._telemetry_sender.stop()
 
         if self._device_twin_handler:
@@ -428,18 +699,22 @@ async def main():
 
     args = parser.parse_args()
 
-    # Configure logging
+    # Configure logging; enqueue=True hands records to a background thread
+    # so sink writes never block the event loop
     logger.remove()
     logger.add(
         sys.stderr,
         level=args.log_level,
+        enqueue=True,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>"
     )
     logger.add(
         "logs/hexapod_{time}.log",
         rotation="1 day",
         retention="7 days",
-        level="DEBUG"
+        level="DEBUG",
+        enqueue=True,
+        format="{time} {level} {name}:{function} {message}"
     )
 
     logger.info("=" * 60)
@@ -457,8 +732,12 @@ async def main():
         logger.exception(f"Unexpected error: {e}")
     finally:
         await controller.shutdown()
+        # Drain the queued log records before the loop exits
+        await logger.complete()
 
 
 if __name__ == "__main__":
-    # Run async main
-    asyncio.run(main())
+    # Run async main, on uvloop when available
+    loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
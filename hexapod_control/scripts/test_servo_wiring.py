@@ -16,7 +16,9 @@ import sys
 import os
 import time
 import argparse
-from typing import Optional, Dict, Tuple
+import functools
+from types import MappingProxyType
+from typing import Optional, Mapping, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -25,6 +27,109 @@ from locomotion.maestro_controller import MaestroController
 from utils.config_loader import get_config_loader
 from loguru import logger
 
+# Human-readable leg names by leg index
+_LEG_NAMES = {
+    0: "Front Right",
+    1: "Middle Right",
+    2: "Rear Right",
+    3: "Rear Left",
+    4: "Middle Left",
+    5: "Front Left"
+}
+
+# What each joint does, shown while its channel is tested
+_JOINT_DESCRIPTIONS = {
+    'coxa': "  COXA: Hip joint - controls leg rotation (forward/backward)\n"
+            "        Movement rotates leg horizontally around body attachment point.",
+    'femur': "  FEMUR: Upper leg joint - controls leg lift (up/down)\n"
+             "         Movement raises or lowers the leg vertically.",
+    'tibia': "  TIBIA: Lower leg joint - controls foot extension\n"
+             "         Movement extends or retracts the foot (shin joint)."
+}
+
+# Banner rules
+_SEP = "=" * 70
+_RULE = "-" * 70
+
+# Printed when interactive mode starts
+_INTERACTIVE_BANNER = "\n".join([
+    "\n" + _SEP,
+    "INTERACTIVE SERVO WIRING TEST",
+    _SEP,
+    "\nCommands:",
+    "  <channel>     - Test specific channel (0-17)",
+    "  leg <n>       - Test all servos on leg n (0-5)",
+    "  all           - Test all servos sequentially",
+    "  map           - Show channel mapping table",
+    "  neutral       - Move all servos to neutral (90°)",
+    "  help          - Show this help",
+    "  quit          - Exit program",
+    _SEP + "\n",
+])
+
+# Printed by the 'help' command
+_HELP_TEXT = "\n".join([
+    "\n" + _SEP,
+    "HELP - SERVO TESTING COMMANDS",
+    _SEP,
+    "\nChannel Testing:",
+    "  0-17          - Test specific channel number",
+    "                  Example: 0 (tests channel 0)",
+    "\nLeg Testing:",
+    "  leg <n>       - Test all servos on leg (0-5)",
+    "                  Example: leg 0 (tests all servos on leg 0)",
+    "\nBulk Operations:",
+    "  all           - Test all 18 servos in sequence",
+    "  neutral       - Move all servos to 90° neutral position",
+    "  map           - Display channel mapping table",
+    "\nUtility:",
+    "  help          - Show this help message",
+    "  quit          - Exit program (or Ctrl+C)",
+    "\nLeg Numbering:",
+    "  0 = Front Right    3 = Rear Left",
+    "  1 = Middle Right   4 = Middle Left",
+    "  2 = Rear Right     5 = Front Left",
+    "\nJoint Types:",
+    "  coxa  = Hip joint (horizontal rotation)",
+    "  femur = Upper leg joint (vertical)",
+    "  tibia = Lower leg joint (vertical)",
+    _SEP + "\n",
+])
+
+# Channel test sequence: neutral, -30°, +30°, neutral
+_TEST_ANGLES = (90, 60, 120, 90)
+_TEST_ANGLE_NAMES = ("Neutral (90°)", "Min (-30°)", "Max (+30°)", "Neutral (90°)")
+_TEST_SEQUENCE = tuple(zip(_TEST_ANGLES, _TEST_ANGLE_NAMES))
+
+
+@functools.lru_cache(maxsize=4)
+def _compute_channel_maps(
+    channel_items: Tuple[Tuple[str, int], ...]
+) -> Tuple[Mapping[int, Tuple[int, str]], Mapping[Tuple[int, str], int]]:
+    """
+    Build the channel <-> (leg, joint) lookups from hardware.yaml channels.
+
+    Args:
+        channel_items: Sorted ("leg_idx.joint", channel) pairs (hashable, for the cache)
+
+    Returns:
+        Read-only (channel_to_servo, servo_to_channel) mappings
+    """
+    channel_to_servo = {}
+    servo_to_channel = {}
+
+    for key, channel in channel_items:
+        # Parse "leg_idx.joint" format
+        parts = key.split('.')
+        if len(parts) == 2:
+            leg_idx = int(parts[0])
+            joint = parts[1]
+
+            channel_to_servo[channel] = (leg_idx, joint)
+            servo_to_channel[(leg_idx, joint)] = channel
+
+    return MappingProxyType(channel_to_servo), MappingProxyType(servo_to_channel)
+
 
 class ServoWiringTester:
     """Interactive servo wiring test utility."""
@@ -43,6 +148,10 @@ class ServoWiringTester:
         # Build channel mapping
         self._build_channel_map()
 
+        # When all servos were last sent to neutral (time.monotonic()), or
+        # None if any servo has moved since
+        self._last_neutral_ts: Optional[float] = None
+
         # Initialize Maestro controller
         logger.info("Initializing Maestro controller...")
         self.controller = MaestroController(
@@ -58,20 +167,10 @@ class ServoWiringTester:
 
     def _build_channel_map(self):
         """Build mapping from channel number to leg/joint information."""
-        self.channel_to_servo: Dict[int, Tuple[int, str]] = {}
-        self.servo_to_channel: Dict[Tuple[int, str], int] = {}
-
         channels = self.hw_config['servos']['channels']
-
-        for key, channel in channels.items():
-            # Parse "leg_idx.joint" format
-            parts = key.split('.')
-            if len(parts) == 2:
-                leg_idx = int(parts[0])
-                joint = parts[1]
-
-                self.channel_to_servo[channel] = (leg_idx, joint)
-                self.servo_to_channel[(leg_idx, joint)] = channel
+        self.channel_to_servo, self.servo_to_channel = _compute_channel_maps(
+            tuple(sorted(channels.items()))
+        )
 
     def get_servo_info(self, channel: int) -> Optional[Tuple[int, str]]:
         """
@@ -87,32 +186,30 @@ class ServoWiringTester:
 
     def print_channel_map(self):
         """Print complete channel mapping table."""
-        print("\n" + "="*70)
-        print("SERVO CHANNEL MAPPING (from hardware.yaml)")
-        print("="*70)
-        print(f"{'Channel':<10} {'Leg':<10} {'Joint':<15} {'Description':<25}")
-        print("-"*70)
-
-        leg_names = [
-            "Front Right",
-            "Middle Right",
-            "Rear Right",
-            "Rear Left",
-            "Middle Left",
-            "Front Left"
+        # Built up and written at once rather than one print() per row
+        rows = [
+            "",
+            _SEP,
+            "SERVO CHANNEL MAPPING (from hardware.yaml)",
+            _SEP,
+            f"{'Channel':<10} {'Leg':<10} {'Joint':<15} {'Description':<25}",
+            _RULE,
         ]
 
         for channel in range(18):
             info = self.get_servo_info(channel)
             if info:
                 leg_idx, joint = info
-                leg_name = leg_names[leg_idx] if leg_idx < len(leg_names) else f"Leg {leg_idx}"
+                leg_name = self._get_leg_name(leg_idx)
                 desc = f"{leg_name} - {joint.capitalize()}"
-                print(f"{channel:<10} {leg_idx:<10} {joint:<15} {desc:<25}")
+                rows.append(f"{channel:<10} {leg_idx:<10} {joint:<15} {desc:<25}")
             else:
-                print(f"{channel:<10} {'N/A':<10} {'N/A':<15} {'Not configured':<25}")
+                rows.append(f"{channel:<10} {'N/A':<10} {'N/A':<15} {'Not configured':<25}")
 
-        print("="*70 + "\n")
+        rows.append(_SEP)
+        rows.append("\n")
+        sys.stdout.write("\n".join(rows))
+        sys.stdout.flush()
 
     def test_channel(self, channel: int, duration: float = 2.0):
         """
@@ -129,21 +226,24 @@ class ServoWiringTester:
             return False
 
         leg_idx, joint = info
+        self._last_neutral_ts = None
 
-        print("\n" + "="*70)
+        print("\n" + _SEP)
         print(f"TESTING CHANNEL {channel}")
-        print("="*70)
+        print(_SEP)
         print(f"Expected Movement:")
         print(f"  Leg:   {leg_idx} ({self._get_leg_name(leg_idx)})")
         print(f"  Joint: {joint.upper()}")
         print(f"\n{self._get_joint_description(joint)}")
-        print("="*70)
+        print(_SEP)
 
-        # Move servo through test sequence
-        angles = [90, 60, 120, 90]  # Neutral, -30°, +30°, neutral
-        angle_names = ["Neutral (90°)", "Min (-30°)", "Max (+30°)", "Neutral (90°)"]
+        # Move servo through test sequence. Each step lasts duration / steps
+        # from when its command is sent, so the serial write time is part of
+        # the dwell, not added to it
+        step = duration / len(_TEST_SEQUENCE)
+        deadline = time.monotonic()
 
-        for angle, name in zip(angles, angle_names):
+        for angle, name in _TEST_SEQUENCE:
             print(f"\n→ Moving to {name}...")
             success = self.controller.set_servo_angle(leg_idx, joint, angle)
 
@@ -151,7 +251,8 @@ class ServoWiringTester:
                 logger.error(f"Failed to move servo on channel {channel}")
                 return False
 
-            time.sleep(duration / len(angles))
+            deadline += step
+            time.sleep(max(0.0, deadline - time.monotonic()))
 
         logger.success(f"Channel {channel} test complete")
         return True
@@ -164,9 +265,9 @@ class ServoWiringTester:
             leg_idx: Leg index (0-5)
             duration: Test duration per servo in seconds
         """
-        print("\n" + "="*70)
+        print("\n" + _SEP)
         print(f"TESTING LEG {leg_idx} - {self._get_leg_name(leg_idx)}")
-        print("="*70)
+        print(_SEP)
 
         joints = ['coxa', 'femur', 'tibia']
 
@@ -190,40 +291,27 @@ class ServoWiringTester:
         Args:
             duration: Test duration per servo in seconds
         """
-        print("\n" + "="*70)
+        print("\n" + _SEP)
         print("TESTING ALL SERVOS SEQUENTIALLY")
-        print("="*70)
+        print(_SEP)
         print("Watch each servo move in sequence.")
         print("Press Ctrl+C to stop.\n")
 
         try:
-            for channel in range(18):
-                info = self.get_servo_info(channel)
-                if info:
-                    self.test_channel(channel, duration)
-                    time.sleep(0.5)
+            for channel in sorted(self.channel_to_servo):
+                self.test_channel(channel, duration)
+                time.sleep(0.5)
         except KeyboardInterrupt:
             print("\n\nTest stopped by user")
 
         # Return all to neutral
         print("\nReturning all servos to neutral position...")
-        self.controller.move_all_to_neutral()
+        self._move_all_to_neutral()
         logger.success("All servos test complete")
 
     def interactive_mode(self):
         """Run interactive mode for manual servo testing."""
-        print("\n" + "="*70)
-        print("INTERACTIVE SERVO WIRING TEST")
-        print("="*70)
-        print("\nCommands:")
-        print("  <channel>     - Test specific channel (0-17)")
-        print("  leg <n>       - Test all servos on leg n (0-5)")
-        print("  all           - Test all servos sequentially")
-        print("  map           - Show channel mapping table")
-        print("  neutral       - Move all servos to neutral (90°)")
-        print("  help          - Show this help")
-        print("  quit          - Exit program")
-        print("="*70 + "\n")
+        print(_INTERACTIVE_BANNER)
 
         try:
             while True:
@@ -247,7 +335,7 @@ class ServoWiringTester:
 
                     elif cmd == 'neutral':
                         print("Moving all servos to neutral position...")
-                        self.controller.move_all_to_neutral()
+                        self._move_all_to_neutral()
                         logger.success("All servos at neutral (90°)")
 
                     elif cmd.startswith('leg '):
@@ -279,65 +367,32 @@ class ServoWiringTester:
 
     def print_help(self):
         """Print help information."""
-        print("\n" + "="*70)
-        print("HELP - SERVO TESTING COMMANDS")
-        print("="*70)
-        print("\nChannel Testing:")
-        print("  0-17          - Test specific channel number")
-        print("                  Example: 0 (tests channel 0)")
-        print("\nLeg Testing:")
-        print("  leg <n>       - Test all servos on leg (0-5)")
-        print("                  Example: leg 0 (tests all servos on leg 0)")
-        print("\nBulk Operations:")
-        print("  all           - Test all 18 servos in sequence")
-        print("  neutral       - Move all servos to 90° neutral position")
-        print("  map           - Display channel mapping table")
-        print("\nUtility:")
-        print("  help          - Show this help message")
-        print("  quit          - Exit program (or Ctrl+C)")
-        print("\nLeg Numbering:")
-        print("  0 = Front Right    3 = Rear Left")
-        print("  1 = Middle Right   4 = Middle Left")
-        print("  2 = Rear Right     5 = Front Left")
-        print("\nJoint Types:")
-        print("  coxa  = Hip joint (horizontal rotation)")
-        print("  femur = Upper leg joint (vertical)")
-        print("  tibia = Lower leg joint (vertical)")
-        print("="*70 + "\n")
+        print(_HELP_TEXT)
 
     def cleanup(self):
         """Clean up and close controller."""
         print("\nCleaning up...")
-        self.controller.move_all_to_neutral()
-        time.sleep(0.5)
+        # Skip the move and settle time if the servos were just parked
+        if self._last_neutral_ts is None or time.monotonic() - self._last_neutral_ts >= 1.0:
+            self._move_all_to_neutral()
+            time.sleep(0.5)
         self.controller.close()
         logger.info("Controller closed")
 
+    def _move_all_to_neutral(self):
+        """Move all servos to neutral and note when."""
+        self.controller.move_all_to_neutral()
+        self._last_neutral_ts = time.monotonic()
+
     @staticmethod
     def _get_leg_name(leg_idx: int) -> str:
         """Get human-readable leg name."""
-        leg_names = {
-            0: "Front Right",
-            1: "Middle Right",
-            2: "Rear Right",
-            3: "Rear Left",
-            4: "Middle Left",
-            5: "Front Left"
-        }
-        return leg_names.get(leg_idx, f"Leg {leg_idx}")
+        return _LEG_NAMES.get(leg_idx, f"Leg {leg_idx}")
 
     @staticmethod
     def _get_joint_description(joint: str) -> str:
         """Get description of joint function."""
-        descriptions = {
-            'coxa': "  COXA: Hip joint - controls leg rotation (forward/backward)\n"
-                   "        Movement rotates leg horizontally around body attachment point.",
-            'femur': "  FEMUR: Upper leg joint - controls leg lift (up/down)\n"
-                    "         Movement raises or lowers the leg vertically.",
-            'tibia': "  TIBIA: Lower leg joint - controls foot extension\n"
-                    "         Movement extends or retracts the foot (shin joint)."
-        }
-        return descriptions.get(joint, "")
+        return _JOINT_DESCRIPTIONS.get(joint, "")
 
 
 def main():
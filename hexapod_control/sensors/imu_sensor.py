@@ -1,25 +1,77 @@
 """IMU sensor interface for BNO055 or MPU9250."""
 
-import asyncio
+import time
+import struct
+import functools
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+import numpy as np
 from loguru import logger
 
-try:
-    import board
-    import busio
-    import adafruit_bno055
-    BNO055_AVAILABLE = True
-except ImportError:
-    BNO055_AVAILABLE = False
-    logger.warning("BNO055 library not available. Install with: pip install adafruit-circuitpython-bno055")
-
 from utils.config_loader import get_config_loader
 
 
-@dataclass
+@functools.cache
+def _load_bno055():
+    """
+    Import the CircuitPython BNO055 stack, once per process.
+
+    Deferred until hardware is actually initialized: importing board/busio
+    probes the platform's I2C devices, which mock runs don't need.
+
+    Returns:
+        (board, busio, adafruit_bno055) modules, or None if unavailable
+    """
+    try:
+        import board
+        import busio
+        import adafruit_bno055
+    except ImportError:
+        logger.warning("BNO055 library not available. Install with: pip install adafruit-circuitpython-bno055")
+        return None
+    return board, busio, adafruit_bno055
+
+
+# Magnetometer and calibration values when the sensor returns none at all
+_NO_MAG = (None, None, None)
+_NO_CAL = (0, 0, 0, 0)
+# Calibration and temperature change slowly; read them on every Nth hardware read
+_SLOW_READ_EVERY = 50
+
+
+def _tilt(data: "IMUData") -> float:
+    """Larger of |roll| and |pitch| for a reading, in degrees."""
+    roll = abs(data.roll)
+    pitch = abs(data.pitch)
+    return roll if roll > pitch else pitch
+
+
+# Mock sample ranges, in IMUData field order: roll, pitch, yaw, gyro x/y/z,
+# accel x/y/z, mag x/y/z, temperature
+_MOCK_LOW = np.array([-5.0, -5.0, 0.0, -10.0, -10.0, -10.0, -1.0, -1.0, 9.31, -50.0, -50.0, -50.0, 23.0])
+_MOCK_HIGH = np.array([5.0, 5.0, 360.0, 10.0, 10.0, 10.0, 1.0, 1.0, 10.31, 50.0, 50.0, 50.0, 27.0])
+# Mock samples drawn per RNG call
+_MOCK_BATCH = 256
+
+
+def _zero_none(values: tuple) -> tuple:
+    """
+    Replace missing (None) components of a sensor vector with 0.0.
+
+    Args:
+        values: Vector as returned by the sensor driver
+
+    Returns:
+        The same tuple when complete, otherwise a copy with zeros filled in
+    """
+    if None in values:
+        return tuple(0.0 if v is None else v for v in values)
+    return values
+
+
+@dataclass(slots=True, frozen=True)
 class IMUData:
-    """IMU sensor data."""
+    """IMU sensor data (immutable: one reading is shared by all callers within the snapshot TTL)."""
     # Orientation (Euler angles in degrees)
     roll: float
     pitch: float
@@ -57,6 +109,25 @@ class IMUSensor:
     Provides orientation, angular velocity, and acceleration data.
     """
 
+    # Record layout for sample buffers filled by read_into()
+    DTYPE = np.dtype([
+        ('roll', 'f4'), ('pitch', 'f4'), ('yaw', 'f4'),
+        ('gx', 'f4'), ('gy', 'f4'), ('gz', 'f4'),
+        ('ax', 'f4'), ('ay', 'f4'), ('az', 'f4'),
+    ])
+
+    # int16 fixed-point variant of DTYPE for long sample histories (half the
+    # memory). Stored value = physical value * QSCALE, per field, using the
+    # BNO055's own register resolutions: 16 LSB/deg, 16 LSB/(deg/s) and
+    # 100 LSB/(m/s^2), so yaw 0-360, gyro +/-2000 and accel +/-16 g all fit
+    QDTYPE = np.dtype([(name, 'i2') for name in DTYPE.names])
+    QSCALE = (16.0, 16.0, 16.0, 16.0, 16.0, 16.0, 100.0, 100.0, 100.0)
+
+    # Packed record written by pack_into(): orientation, gyro and accel as
+    # float32, the four calibration levels as bytes, then temperature
+    # (NaN when unknown). 44 bytes, little-endian
+    WIRE = struct.Struct("<9f4Bf")
+
     def __init__(self, config_loader=None, mock_mode: bool = False):
         """
         Initialize IMU sensor.
@@ -78,8 +149,17 @@ class IMUSensor:
         self._i2c_address = self._imu_config['i2c_address']
         self._update_rate = self._imu_config['update_rate']
 
-        # Last reading
+        # Last reading, and when it came off the bus (time.monotonic()). Reads
+        # within half a sensor update period reuse it instead of the bus
         self._last_data: Optional[IMUData] = None
+        self._snapshot_ts = 0.0
+        self._snapshot_ttl = 0.5 / self._update_rate
+        # Hardware reads until calibration and temperature are read again
+        self._slow_countdown = 0
+
+        # Mock samples are drawn in batches and handed out one row per read
+        self._rng = np.random.default_rng()
+        self._mock_rows: List[List[float]] = []
 
         logger.info(f"IMUSensor initialized ({self._imu_type})")
 
@@ -99,11 +179,13 @@ class IMUSensor:
             self._initialized = True
             return True
 
-        if not BNO055_AVAILABLE:
+        modules = _load_bno055()
+        if modules is None:
             logger.error("BNO055 library not available. Falling back to mock mode.")
             self._mock_mode = True
             self._initialized = True
             return True
+        board, busio, adafruit_bno055 = modules
 
         try:
             # Initialize I2C
@@ -144,7 +226,12 @@ class IMUSensor:
             return
 
         try:
-            status = self._sensor.calibration_status
+            # Reuse the calibration from a fresh reading rather than another I2C read
+            data = self._fresh_snapshot()
+            if data is not None:
+                status = (data.sys_cal, data.gyro_cal, data.accel_cal, data.mag_cal)
+            else:
+                status = self._sensor.calibration_status
             logger.info(
                 f"IMU Calibration - System: {status[0]}, "
                 f"Gyro: {status[1]}, Accel: {status[2]}, Mag: {status[3]}"
@@ -162,6 +249,15 @@ class IMUSensor:
         """
         Read current IMU data.
 
+        Returns:
+            IMUData with current sensor readings
+        """
+        return self._read_data_sync()
+
+    def _read_data_sync(self) -> IMUData:
+        """
+        Read current IMU data (the I2C reads don't await, so this is synchronous).
+
         Returns:
             IMUData with current sensor readings
         """
@@ -172,6 +268,11 @@ class IMUSensor:
         if self._mock_mode:
             return self._get_mock_data()
 
+        data = self._fresh_snapshot()
+        if data is not None:
+            return data
+        now = time.monotonic()
+
         try:
             # Read orientation (Euler angles)
             euler = self._sensor.euler
@@ -179,82 +280,141 @@ class IMUSensor:
                 # Sensor not ready yet
                 return self._last_data or self._get_mock_data()
 
-            # Read gyroscope
-            gyro = self._sensor.gyro
-
-            # Read accelerometer
-            accel = self._sensor.acceleration
-
-            # Read magnetometer
-            mag = self._sensor.magnetic
-
-            # Read calibration status
-            cal_status = self._sensor.calibration_status
-
-            # Read temperature
-            temp = self._sensor.temperature
+            sensor = self._sensor
+            euler = _zero_none(euler)
+            gyro = _zero_none(sensor.gyro)
+            accel = _zero_none(sensor.acceleration)
+            # Missing magnetometer components stay None
+            mag = sensor.magnetic or _NO_MAG
+
+            last = self._last_data
+            if self._slow_countdown > 0 and last is not None:
+                self._slow_countdown -= 1
+                cal_status = (last.sys_cal, last.gyro_cal, last.accel_cal, last.mag_cal)
+                temperature = last.temperature
+            else:
+                self._slow_countdown = _SLOW_READ_EVERY - 1
+                cal_status = sensor.calibration_status or _NO_CAL
+                temperature = sensor.temperature
 
             data = IMUData(
                 # Orientation (convert to roll, pitch, yaw)
-                roll=euler[2] if euler[2] is not None else 0.0,
-                pitch=euler[1] if euler[1] is not None else 0.0,
-                yaw=euler[0] if euler[0] is not None else 0.0,
+                roll=euler[2],
+                pitch=euler[1],
+                yaw=euler[0],
 
                 # Gyroscope
-                gyro_x=gyro[0] if gyro[0] is not None else 0.0,
-                gyro_y=gyro[1] if gyro[1] is not None else 0.0,
-                gyro_z=gyro[2] if gyro[2] is not None else 0.0,
+                gyro_x=gyro[0],
+                gyro_y=gyro[1],
+                gyro_z=gyro[2],
 
                 # Accelerometer
-                accel_x=accel[0] if accel[0] is not None else 0.0,
-                accel_y=accel[1] if accel[1] is not None else 0.0,
-                accel_z=accel[2] if accel[2] is not None else 0.0,
+                accel_x=accel[0],
+                accel_y=accel[1],
+                accel_z=accel[2],
 
                 # Magnetometer
-                mag_x=mag[0] if mag and mag[0] is not None else None,
-                mag_y=mag[1] if mag and mag[1] is not None else None,
-                mag_z=mag[2] if mag and mag[2] is not None else None,
+                mag_x=mag[0],
+                mag_y=mag[1],
+                mag_z=mag[2],
 
                 # Calibration
-                sys_cal=cal_status[0] if cal_status else 0,
-                gyro_cal=cal_status[1] if cal_status else 0,
-                accel_cal=cal_status[2] if cal_status else 0,
-                mag_cal=cal_status[3] if cal_status else 0,
+                sys_cal=cal_status[0],
+                gyro_cal=cal_status[1],
+                accel_cal=cal_status[2],
+                mag_cal=cal_status[3],
 
                 # Temperature
-                temperature=temp
+                temperature=temperature
             )
 
             self._last_data = data
+            self._snapshot_ts = now
             return data
 
         except Exception as e:
             logger.error(f"Error reading IMU data: {e}")
             return self._last_data or self._get_mock_data()
 
+    def _fresh_snapshot(self) -> Optional[IMUData]:
+        """
+        Get the last hardware reading if it is still within the snapshot TTL.
+
+        Returns:
+            Cached IMUData, or None if there is none or it is stale
+        """
+        if self._last_data is not None and time.monotonic() - self._snapshot_ts < self._snapshot_ttl:
+            return self._last_data
+        return None
+
+    def read_into(self, buffer: np.ndarray, idx: int) -> IMUData:
+        """
+        Read IMU data and store it as one record of a sample buffer.
+
+        Lets callers keep a window of samples (e.g. a ring buffer allocated
+        once with np.empty(n, dtype=IMUSensor.DTYPE)) as contiguous arrays
+        rather than a list of IMUData objects. Buffers with dtype
+        IMUSensor.QDTYPE get the sample quantized by IMUSensor.QSCALE.
+
+        Args:
+            buffer: Array with dtype IMUSensor.DTYPE or IMUSensor.QDTYPE
+            idx: Record index to overwrite
+
+        Returns:
+            IMUData that was stored
+        """
+        data = self._read_data_sync()
+        values = (
+            data.roll, data.pitch, data.yaw,
+            data.gyro_x, data.gyro_y, data.gyro_z,
+            data.accel_x, data.accel_y, data.accel_z,
+        )
+        if buffer.dtype == self.QDTYPE:
+            values = tuple(round(v * scale) for v, scale in zip(values, self.QSCALE))
+        buffer[idx] = values
+        return data
+
+    def pack_into(self, buf, offset: int) -> IMUData:
+        """
+        Read IMU data and pack it into a byte buffer in IMUSensor.WIRE layout.
+
+        For logging to a shared-memory or mmap ring buffer without any
+        per-sample serialization; readers decode with WIRE.unpack_from().
+
+        Args:
+            buf: Writable buffer (bytearray, mmap, memoryview)
+            offset: Byte offset of the record (needs WIRE.size bytes)
+
+        Returns:
+            IMUData that was packed
+        """
+        data = self._read_data_sync()
+        temperature = data.temperature
+        self.WIRE.pack_into(
+            buf, offset,
+            data.roll, data.pitch, data.yaw,
+            data.gyro_x, data.gyro_y, data.gyro_z,
+            data.accel_x, data.accel_y, data.accel_z,
+            data.sys_cal, data.gyro_cal, data.accel_cal, data.mag_cal,
+            float("nan") if temperature is None else temperature,
+        )
+        return data
+
+    def invalidate_snapshot(self):
+        """Make the next read go to the sensor even if the last one is recent."""
+        self._snapshot_ts = 0.0
+
     def _get_mock_data(self) -> IMUData:
         """Generate mock IMU data for testing."""
-        import random
-
-        return IMUData(
-            roll=random.uniform(-5.0, 5.0),
-            pitch=random.uniform(-5.0, 5.0),
-            yaw=random.uniform(0.0, 360.0),
-            gyro_x=random.uniform(-10.0, 10.0),
-            gyro_y=random.uniform(-10.0, 10.0),
-            gyro_z=random.uniform(-10.0, 10.0),
-            accel_x=random.uniform(-1.0, 1.0),
-            accel_y=random.uniform(-1.0, 1.0),
-            accel_z=9.81 + random.uniform(-0.5, 0.5),
-            mag_x=random.uniform(-50.0, 50.0),
-            mag_y=random.uniform(-50.0, 50.0),
-            mag_z=random.uniform(-50.0, 50.0),
-            sys_cal=3,
-            gyro_cal=3,
-            accel_cal=3,
-            mag_cal=3,
-            temperature=25.0 + random.uniform(-2.0, 2.0)
-        )
+        rows = self._mock_rows
+        if not rows:
+            rows = self._mock_rows = self._rng.uniform(
+                _MOCK_LOW, _MOCK_HIGH, size=(_MOCK_BATCH, len(_MOCK_LOW))
+            ).tolist()
+
+        v = rows.pop()
+        # Orientation, gyro, accel and mag, then full calibration
+        return IMUData(*v[:12], 3, 3, 3, 3, temperature=v[12])
 
     def get_orientation(self) -> Tuple[float, float, float]:
         """
@@ -263,7 +423,7 @@ class IMUSensor:
         Returns:
             (roll, pitch, yaw) in degrees
         """
-        data = asyncio.run(self.read_data())
+        data = self._read_data_sync()
         return (data.roll, data.pitch, data.yaw)
 
     def get_angular_velocity(self) -> Tuple[float, float, float]:
@@ -273,7 +433,7 @@ class IMUSensor:
         Returns:
             (gyro_x, gyro_y, gyro_z) in degrees/second
         """
-        data = asyncio.run(self.read_data())
+        data = self._read_data_sync()
         return (data.gyro_x, data.gyro_y, data.gyro_z)
 
     def get_acceleration(self) -> Tuple[float, float, float]:
@@ -283,7 +443,7 @@ class IMUSensor:
         Returns:
             (accel_x, accel_y, accel_z) in m/s^2
         """
-        data = asyncio.run(self.read_data())
+        data = self._read_data_sync()
         return (data.accel_x, data.accel_y, data.accel_z)
 
     def is_calibrated(self, threshold: int = 2) -> bool:
@@ -299,7 +459,7 @@ class IMUSensor:
         if self._mock_mode:
             return True
 
-        data = asyncio.run(self.read_data())
+        data = self._read_data_sync()
         return (
             data.sys_cal >= threshold and
             data.gyro_cal >= threshold and
@@ -316,8 +476,7 @@ class IMUSensor:
         Returns:
             True if roll and pitch within tolerance
         """
-        roll, pitch, _ = self.get_orientation()
-        return abs(roll) < tolerance and abs(pitch) < tolerance
+        return self.get_tilt() < tolerance
 
     def detect_fall(self, threshold: float = 30.0) -> bool:
         """
@@ -329,8 +488,31 @@ class IMUSensor:
         Returns:
             True if fallen
         """
-        roll, pitch, _ = self.get_orientation()
-        return abs(roll) > threshold or abs(pitch) > threshold
+        return self.get_tilt() > threshold
+
+    def get_tilt(self) -> float:
+        """
+        Get the current tilt: the larger of |roll| and |pitch|.
+
+        Level and fall checks are both a comparison against this value.
+
+        Returns:
+            Tilt in degrees
+        """
+        return _tilt(self._read_data_sync())
+
+    async def read_and_check_fall(self, threshold: float = 30.0) -> Tuple[IMUData, bool]:
+        """
+        Read IMU data and check it for a fall in one sensor transaction.
+
+        Args:
+            threshold: Roll/pitch threshold in degrees
+
+        Returns:
+            (IMUData, True if fallen)
+        """
+        data = await self.read_data()
+        return data, _tilt(data) > threshold
 
     def close(self):
         """Close IMU sensor and release resources."""
@@ -192,6 +192,108 @@ async def test_gait_controller():
         return False
 
 
+async def test_stop_walking_mid_cycle():
+    """Test stop_walking returns within about one step of a long tripod cycle."""
+    logger.info("Testing stop_walking during a tripod cycle...")
+
+    try:
+        import dataclasses
+        from locomotion.gait_controller import GaitController, GaitType
+
+        class _Servo:
+            """Accepts every leg update."""
+            def set_all_legs(self, leg_angles):
+                return True
+
+            def set_leg_angles(self, leg_idx, coxa, femur, tibia):
+                return True
+
+        gait = GaitController(servo_controller=_Servo())
+        # 4 s cycle, 20 steps: one step is 0.2 s
+        gait._gait_configs[GaitType.TRIPOD] = dataclasses.replace(
+            gait._gait_configs[GaitType.TRIPOD], cycle_time=4.0
+        )
+
+        walk = asyncio.create_task(gait.start_walking(speed=1.0))
+        await asyncio.sleep(0.3)
+        assert gait.is_walking()
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await gait.stop_walking()
+        elapsed = loop.time() - start
+        await walk
+
+        assert elapsed < 0.4, f"stop took {elapsed:.2f}s"
+        logger.success(f"✅ Gait stopped mid-cycle in {elapsed * 1000:.0f} ms")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Stop walking test failed: {e!r}")
+        return False
+
+
+async def test_emergency_stop_not_blocked():
+    """Test emergency_stop completes while a slow get_status is in flight."""
+    logger.info("Testing emergency stop during a slow status read...")
+
+    try:
+        from types import SimpleNamespace
+        from main import HexapodController
+
+        class _Registry:
+            """Stands in for the IoT client and twin handler registries."""
+            def __init__(self):
+                self.methods = {}
+
+            def register_method_handler(self, name, handler):
+                self.methods[name] = handler
+
+            def register_message_handler(self, name, handler):
+                pass
+
+            def register_property_handler(self, name, handler):
+                pass
+
+        class _StuckIMU:
+            """IMU whose read never returns."""
+            async def read_data(self):
+                await asyncio.Event().wait()
+
+        class _Gait:
+            async def stop_walking(self):
+                pass
+
+        class _Servo:
+            def disable_all_servos(self):
+                pass
+
+        controller = HexapodController(mock_mode=True)
+        iot = _Registry()
+        controller._sub = SimpleNamespace(
+            iot=iot, twin=_Registry(), imu=_StuckIMU(), gait=_Gait(), servo=_Servo()
+        )
+        controller._register_iot_handlers()
+
+        try:
+            status = asyncio.create_task(iot.methods["get_status"]({}))
+            await asyncio.sleep(0.01)
+            assert not status.done()
+
+            result = await asyncio.wait_for(iot.methods["emergency_stop"]({}), timeout=1.0)
+            assert result["status"] == "success"
+        finally:
+            controller._cmd_dispatcher_task.cancel()
+            await asyncio.gather(controller._cmd_dispatcher_task, status, return_exceptions=True)
+
+        logger.success("✅ Emergency stop not blocked by a pending status read")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Emergency stop test failed: {e!r}")
+        return False
+
+
 async def run_all_tests():
     """Run all tests."""
     logger.info("=" * 60)
@@ -207,21 +309,29 @@ async def run_all_tests():
         ("IMU Sensor", test_imu_sensor, True),
         ("Azure IoT Client", test_azure_iot, True),
         ("Gait Controller", test_gait_controller, True),
+        ("Gait Stop Latency", test_stop_walking_mid_cycle, True),
+        ("Emergency Stop Latency", test_emergency_stop_not_blocked, True),
     ]
 
     results = []
 
-    for test_name, test_func, is_async in tests:
-        logger.info("")
-        try:
-            if is_async:
-                result = await test_func()
-            else:
-                result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            logger.error(f"Test '{test_name}' crashed: {e}")
-            results.append((test_name, False))
+    # The import test runs first on its own: everything else depends on it.
+    # The rest are independent and run concurrently, sync ones in threads,
+    # so their log lines may interleave
+    logger.info("")
+    outcomes = [await asyncio.to_thread(tests[0][1])]
+    logger.info("")
+    outcomes += await asyncio.gather(
+        *(test_func() if is_async else asyncio.to_thread(test_func)
+          for _, test_func, is_async in tests[1:]),
+        return_exceptions=True
+    )
+
+    for (test_name, _, _), result in zip(tests, outcomes):
+        if isinstance(result, Exception):
+            logger.error(f"Test '{test_name}' crashed: {result}")
+            result = False
+        results.append((test_name, result))
 
     # Summary
     logger.info("")
@@ -249,5 +359,13 @@ async def run_all_tests():
 
 
 if __name__ == "__main__":
-    success = asyncio.run(run_all_tests())
+    # Same event loop as main.py: uvloop when installed (POSIX only)
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        success = runner.run(run_all_tests())
     sys.exit(0 if success else 1)
@@ -1,11 +1,155 @@
 """Configuration loader for YAML configuration files."""
 
 import os
+import pickle
+import sys
+import tempfile
+import threading
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from loguru import logger
 
+# libyaml's C parser when PyYAML was built with it (same output, several
+# times faster), otherwise the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML by absolute path as (st_mtime_ns, st_size, frozen data); shared
+# by every ConfigLoader in the process
+_parsed_yaml: Dict[str, Tuple[int, int, Any]] = {}
+
+# Key paths checked by ConfigLoader.validate_hardware_config/validate_behavior_config
+_REQUIRED_HARDWARE_FIELDS = (
+    'hexapod.leg_count',
+    'hexapod.dimensions.coxa_length',
+    'hexapod.dimensions.femur_length',
+    'hexapod.dimensions.tibia_length',
+    'servos.driver.type',
+    'imu.type',
+)
+_REQUIRED_BEHAVIOR_FIELDS = (
+    'gaits.tripod',
+    'navigation.path_planning.algorithm',
+    'autonomy.default_mode',
+)
+
+# Loaders handed out by get_config_loader(), by config_dir
+_shared_loaders: Dict[Optional[str], "ConfigLoader"] = {}
+_shared_loaders_lock = threading.Lock()
+
+# Marks a ConfigLoader.get() key path that resolved to nothing
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Recursively convert parsed YAML into read-only containers.
+
+    Strings (keys included) are interned, so the many repeated keys share
+    one object and lookups with literal keys from code match by identity.
+
+    Args:
+        value: Parsed YAML value
+
+    Returns:
+        Value with dicts wrapped in MappingProxyType and lists turned into tuples
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({_freeze(k): _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def _read_yaml(path: Path) -> Any:
+    """
+    Parse a YAML file into read-only containers, reusing an earlier parse.
+
+    A cached parse is reused while the file's modification time and size
+    are unchanged, so an edited file is picked up on the next read.
+
+    Args:
+        path: YAML file path
+
+    Returns:
+        Frozen parsed data
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+
+    cached = _parsed_yaml.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    data = _freeze(_load_with_disk_cache(key, st))
+
+    _parsed_yaml[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _load_with_disk_cache(path: str, st: os.stat_result) -> Any:
+    """
+    Parse a YAML file, through a pickle of the parse kept next to it.
+
+    The pickle lives in a .cache directory beside the file and is named
+    after the file's modification time and size, so an edited file misses
+    and is re-parsed. Cache failures (e.g. a read-only config directory)
+    only cost the parse. Set CONFIG_NO_CACHE=1 to bypass the cache.
+
+    Args:
+        path: Absolute YAML file path
+        st: os.stat() result for path
+
+    Returns:
+        Parsed data (plain dicts and lists)
+    """
+    if os.environ.get("CONFIG_NO_CACHE") == "1":
+        with open(path, 'rb') as f:
+            return yaml.load(f, Loader=_YAML_LOADER)
+
+    cache_dir = os.path.join(os.path.dirname(path), ".cache")
+    name = os.path.basename(path)
+    cache_file = os.path.join(cache_dir, f"{name}.{st.st_mtime_ns}.{st.st_size}.pkl")
+
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable config cache {cache_file}: {e}")
+
+    with open(path, 'rb') as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+        # Drop pickles of earlier versions of this file (only exact
+        # "<name>.<mtime>.<size>.pkl" matches: azure_config.yaml must not
+        # evict azure_config.yaml.template's)
+        for entry in os.listdir(cache_dir):
+            stamp = entry[len(name) + 1:-4].split('.')
+            if entry.startswith(name + ".") and entry.endswith(".pkl") and \
+                    len(stamp) == 2 and all(part.isdigit() for part in stamp) and \
+                    os.path.join(cache_dir, entry) != cache_file:
+                os.unlink(os.path.join(cache_dir, entry))
+    except OSError as e:
+        logger.debug(f"Could not write config cache {cache_file}: {e}")
+
+    return data
+
 
 class ConfigLoader:
     """Load and manage YAML configuration files."""
@@ -29,6 +173,11 @@ class ConfigLoader:
             raise FileNotFoundError(f"Configuration directory not found: {self.config_dir}")
 
         self._configs: Dict[str, Any] = {}
+        # get() results by (config_name, key_path); configs are read-only,
+        # so entries only go stale on reload()
+        self._get_cache: Dict[Tuple[str, str], Any] = {}
+        # Azure fallback config, once _load_azure_template() has built it
+        self._azure_template: Optional[Mapping[str, Any]] = None
         logger.info(f"ConfigLoader initialized with directory: {self.config_dir}")
 
     def load(self, config_name: str, required: bool = True) -> Optional[Dict[str, Any]]:
@@ -40,7 +189,9 @@ class ConfigLoader:
             required: If True, raise error if file not found
 
         Returns:
-            Dictionary containing configuration data, or None if not found and not required
+            Read-only mapping of the configuration data (nested dicts are
+            MappingProxyType, lists are tuples), or None if not found and
+            not required. Copy with dict(...) to derive a modified config.
 
         Raises:
             FileNotFoundError: If required config file not found
@@ -54,22 +205,22 @@ class ConfigLoader:
         # Build file path
         config_file = self.config_dir / f"{config_name}.yaml"
 
-        if not config_file.exists():
-            if required:
-                raise FileNotFoundError(f"Required configuration file not found: {config_file}")
-            else:
-                logger.warning(f"Optional configuration file not found: {config_file}")
-                return None
-
-        # Load YAML file
+        # Load YAML file (no separate exists() probe: the stat in _read_yaml
+        # reports a missing file)
         try:
-            with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f)
+            config_data = _read_yaml(config_file)
 
             self._configs[config_name] = config_data
             logger.info(f"Loaded configuration: {config_name}")
             return config_data
 
+        except FileNotFoundError:
+            if required:
+                raise FileNotFoundError(f"Required configuration file not found: {config_file}") from None
+            else:
+                logger.warning(f"Optional configuration file not found: {config_file}")
+                return None
+
         except yaml.YAMLError as e:
             logger.error(f"Failed to parse YAML file {config_file}: {e}")
             raise
@@ -85,6 +236,8 @@ class ConfigLoader:
         Returns:
             Dictionary with all configurations
         """
+        # Loaded one after another on purpose: libyaml holds the GIL while it
+        # builds the Python objects, so a thread pool only adds its overhead
         configs = {}
 
         # Load hardware configuration
@@ -110,16 +263,17 @@ class ConfigLoader:
         Returns:
             Azure config template with placeholder values
         """
+        if self._azure_template is not None:
+            return self._azure_template
+
         template_file = self.config_dir / "azure_config.yaml.template"
 
-        if template_file.exists():
-            with open(template_file, 'r') as f:
-                template = yaml.safe_load(f)
+        try:
+            template = _read_yaml(template_file)
             logger.info("Loaded Azure configuration template (mock mode)")
-            return template
-        else:
+        except FileNotFoundError:
             logger.warning("Azure template not found, using minimal default config")
-            return {
+            template = _freeze({
                 'azure_iot': {
                     'connection_string': '',
                     'protocol': 'MQTT',
@@ -127,7 +281,10 @@ class ConfigLoader:
                 'development': {
                     'mock_connection': True
                 }
-            }
+            })
+
+        self._azure_template = template
+        return template
 
     def get(self, config_name: str, key_path: str, default: Any = None) -> Any:
         """
@@ -145,20 +302,42 @@ class ConfigLoader:
             >>> loader = ConfigLoader()
             >>> coxa_length = loader.get('hardware', 'hexapod.dimensions.coxa_length')
         """
+        cache_key = (config_name, key_path)
+        try:
+            value = self._get_cache[cache_key]
+        except KeyError:
+            value = self._get_cache[cache_key] = self._lookup(config_name, key_path)
+
+        if value is _MISSING:
+            logger.debug(f"Key path not found: {key_path}, returning default")
+            return default
+        return value
+
+    def _lookup(self, config_name: str, key_path: str) -> Any:
+        """
+        Resolve a dot-notation key path (uncached part of get()).
+
+        Args:
+            config_name: Name of configuration file
+            key_path: Dot-separated path to configuration key
+
+        Returns:
+            Configuration value, or _MISSING if the config or key is absent
+        """
         config = self.load(config_name)
         if config is None:
-            return default
+            return _MISSING
 
-        # Navigate through nested dictionary
-        keys = key_path.split('.')
+        # Navigate through nested dictionary. Indexing a scalar or tuple
+        # with a string key raises TypeError, so one handler covers both
+        # a missing key and a path that runs past a leaf
         value = config
 
-        for key in keys:
-            if isinstance(value, dict) and key in value:
+        try:
+            for key in key_path.split('.'):
                 value = value[key]
-            else:
-                logger.debug(f"Key path not found: {key_path}, returning default")
-                return default
+        except (KeyError, TypeError):
+            return _MISSING
 
         return value
 
@@ -167,8 +346,12 @@ class ConfigLoader:
         Reload configuration file(s).
 
         Args:
-            config_name: Specific config to reload, or None to reload all
+            config_name: Specific config to reload, or None to reload every
+                config loaded so far (others are read when first requested)
         """
+        self._get_cache.clear()
+        self._azure_template = None
+
         if config_name:
             # Remove from cache and reload
             if config_name in self._configs:
@@ -176,10 +359,12 @@ class ConfigLoader:
             self.load(config_name)
             logger.info(f"Reloaded configuration: {config_name}")
         else:
-            # Reload all
+            # Reload the configs in use; unused ones stay unparsed
+            loaded = list(self._configs)
             self._configs.clear()
-            self.load_all()
-            logger.info("Reloaded all configurations")
+            for name in loaded:
+                self.load(name)
+            logger.info(f"Reloaded all configurations: {', '.join(loaded)}")
 
     def get_hardware_config(self) -> Dict[str, Any]:
         """Get hardware configuration."""
@@ -200,24 +385,7 @@ class ConfigLoader:
         Returns:
             True if valid, False otherwise
         """
-        required_fields = [
-            'hexapod.leg_count',
-            'hexapod.dimensions.coxa_length',
-            'hexapod.dimensions.femur_length',
-            'hexapod.dimensions.tibia_length',
-            'servos.driver.type',
-            'imu.type',
-        ]
-
-        hardware = self.get_hardware_config()
-
-        for field in required_fields:
-            if self.get('hardware', field) is None:
-                logger.error(f"Missing required hardware configuration field: {field}")
-                return False
-
-        logger.info("Hardware configuration validated successfully")
-        return True
+        return self._validate('hardware', _REQUIRED_HARDWARE_FIELDS)
 
     def validate_behavior_config(self) -> bool:
         """
@@ -226,40 +394,48 @@ class ConfigLoader:
         Returns:
             True if valid, False otherwise
         """
-        required_fields = [
-            'gaits.tripod',
-            'navigation.path_planning.algorithm',
-            'autonomy.default_mode',
-        ]
+        return self._validate('behavior', _REQUIRED_BEHAVIOR_FIELDS)
+
+    def _validate(self, config_name: str, required_fields: Tuple[str, ...]) -> bool:
+        """
+        Check that a configuration has a value at every required key path.
 
-        behavior = self.get_behavior_config()
+        Args:
+            config_name: Name of configuration file
+            required_fields: Dot-separated key paths that must be set
 
+        Returns:
+            True if valid, False otherwise
+        """
         for field in required_fields:
-            if self.get('behavior', field) is None:
-                logger.error(f"Missing required behavior configuration field: {field}")
+            if self.get(config_name, field) is None:
+                logger.error(f"Missing required {config_name} configuration field: {field}")
                 return False
 
-        logger.info("Behavior configuration validated successfully")
+        logger.info(f"{config_name.capitalize()} configuration validated successfully")
         return True
 
 
-# Singleton instance
-_config_loader: Optional[ConfigLoader] = None
-
-
 def get_config_loader(config_dir: Optional[str] = None) -> ConfigLoader:
     """
-    Get singleton ConfigLoader instance.
+    Get the shared ConfigLoader instance.
+
+    Every call with the same config_dir returns the same loader, so modules
+    can call this freely (e.g. per sensor or controller instance) without
+    re-reading YAML. To pick up edited files, call reload() on the loader;
+    a fresh loader is never needed.
 
     Args:
-        config_dir: Configuration directory (only used on first call)
+        config_dir: Configuration directory (None for the project default)
 
     Returns:
-        ConfigLoader instance
+        ConfigLoader instance, one per configuration directory
     """
-    global _config_loader
-
-    if _config_loader is None:
-        _config_loader = ConfigLoader(config_dir)
-
-    return _config_loader
+    loader = _shared_loaders.get(config_dir)
+    if loader is None:
+        # Double-checked so concurrent first calls build only one loader
+        with _shared_loaders_lock:
+            loader = _shared_loaders.get(config_dir)
+            if loader is None:
+                loader = _shared_loaders[config_dir] = ConfigLoader(config_dir)
+    return loader